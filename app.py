@@ -1,3 +1,5 @@
+import os
+
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -7,8 +9,9 @@ import cartopy.feature as cfeature
 from matplotlib.ticker import MaxNLocator
 
 from sat_sim.analysis.sweep_local_geom import run_sweep_local_geom_analysis
-from sat_sim.coverage.grid import compute_grid_coverage
-from sat_sim.coverage.grid_gap import compute_grid_max_gap
+from sat_sim.analysis.result_store import DEFAULT_STORE_DIR
+from sat_sim.coverage.grid_gap import compute_grid_gap_statistics
+from sat_sim.coverage.land_mask import ocean_cell_mask
 from sat_sim.orbits.constellation import generate_constellation
 from sat_sim.orbits.elements import coe_to_rv
 from sat_sim.orbits.propagator import propagate_orbit
@@ -30,8 +33,18 @@ st.sidebar.header("Mission Parameters")
 altitude_km = st.sidebar.number_input("Altitude [km]", 300.0, 2000.0, 550.0)
 inclination_deg = st.sidebar.number_input("Inclination [deg]", 0.0, 180.0, 98.0)
 duration_h = st.sidebar.number_input("Simulation Duration [h]", 1.0, 72.0, 24.0)
-dt_s = st.sidebar.number_input("Time Step [s]", 10.0, 300.0, 60.0)
+auto_dt = st.sidebar.checkbox(
+    "Automatic time step",
+    value=False,
+    help="Pick the coarsest step whose worst gap and availability stay "
+         "within tolerance of the 10 s result (convergence study on a "
+         "subset of the architectures; small sweeps run at 10 s directly)"
+)
+dt_s = st.sidebar.number_input(
+    "Time Step [s]", 10.0, 300.0, 60.0, disabled=auto_dt
+)
 min_elev_deg = st.sidebar.number_input("Min Elevation [deg]", 0.0, 45.0, 0.0)
+maritime = st.sidebar.checkbox("Maritime (ocean cells only)", value=False)
 
 st.sidebar.header("Ground Location")
 
@@ -40,6 +53,39 @@ lon = st.sidebar.number_input("Longitude [deg]", -180.0, 180.0, 9.94350)
 
 st.sidebar.header("Architecture Sweep")
 n_max = st.sidebar.number_input("Max Total Satellites", 1, 30, 8)
+n_workers = st.sidebar.number_input(
+    "Parallel Workers", 1, os.cpu_count() or 1, os.cpu_count() or 1
+)
+lattice_sweep = st.sidebar.checkbox(
+    "Reuse RAAN/phase lattice",
+    value=True,
+    help="Propagate each lattice point once and evaluate architectures "
+         "by combining per-satellite visibility masks"
+)
+pareto_only = st.sidebar.checkbox(
+    "Pareto front only",
+    value=False,
+    help="Satellites vs. worst gap vs. availability; provably dominated "
+         "architectures are skipped without being evaluated"
+)
+max_gap_requirement = st.sidebar.number_input(
+    "Max Gap Requirement [min] (0 = none)", 0.0, 1440.0, 0.0,
+    disabled=pareto_only
+)
+analytic_screening = st.sidebar.checkbox(
+    "Analytic pre-screening",
+    value=True,
+    help="With a gap requirement, analytic street-of-coverage estimates "
+         "(empirical J2 margins) skip architectures that are clearly "
+         "infeasible or feasible; feasible ones are listed with their "
+         "worst-case bound columns instead of simulated metrics"
+)
+resume_sweep = st.sidebar.checkbox(
+    "Resume from result store",
+    value=False,
+    help=f"Save each finished architecture to {DEFAULT_STORE_DIR} "
+         "(Parquet) and skip the ones already stored for this scenario"
+)
 
 run_button = st.sidebar.button("Run Analysis")
 
@@ -48,6 +94,14 @@ run_button = st.sidebar.button("Run Analysis")
 # =============================
 
 if run_button:
+    progress_bar = st.progress(0.0, text="Running analysis...")
+
+    def report_progress(done, total):
+        progress_bar.progress(
+            done / total,
+            text=f"Running analysis... {done}/{total} architectures"
+        )
+
     with st.spinner("Running analysis..."):
         st.session_state["results"] = run_sweep_local_geom_analysis(
             station_lat_deg=lat,
@@ -55,10 +109,20 @@ if run_button:
             altitude_km=altitude_km,
             inclination_deg=inclination_deg,
             duration_h=duration_h,
-            dt_s=dt_s,
+            dt_s="auto" if auto_dt else dt_s,
             min_elev_deg=min_elev_deg,
             n_max=n_max,
+            n_workers=n_workers,
+            progress=report_progress,
+            sweep_mode="lattice" if lattice_sweep else "architecture",
+            pareto_only=pareto_only,
+            store_dir=DEFAULT_STORE_DIR if resume_sweep else None,
+            max_gap_requirement_min=(
+                None if pareto_only else max_gap_requirement or None
+            ),
+            screening=analytic_screening,
         )
+        progress_bar.empty()
         st.session_state.pop("show_maps", None)
         st.session_state.pop("selected_arch", None)
 
@@ -69,10 +133,21 @@ if "results" not in st.session_state:
 results = st.session_state["results"]
 
 if not results:
-    st.warning("No architectures evaluated.")
+    st.warning("No architectures evaluated (or none meets the requirement).")
     st.stop()
 
-df = pd.DataFrame(results).sort_values("worst_gap_min").reset_index(drop=True)
+df = pd.DataFrame(results)
+
+# Screened (not simulated) rows have NaN metrics: ranked after the
+# simulated ones by their worst-case bound and drawn separately
+df = df.sort_values(
+    [c for c in ("worst_gap_min", "worst_gap_bound_min") if c in df]
+).reset_index(drop=True)
+
+if "dt_s" in df:
+    # Step chosen by the convergence study (also used for the maps)
+    dt_s = float(df.pop("dt_s").iloc[0])
+    st.caption(f"Automatic time step: {dt_s:g} s")
 df.insert(0, "rank", df.index + 1)
 
 # =============================
@@ -105,6 +180,17 @@ with col1:
     fig1, ax1 = plt.subplots()
     ax1.plot(df["total_sats"], df["worst_gap_min"], marker="o")
 
+    if "worst_gap_bound_min" in df:
+        ax1.scatter(
+            df["total_sats"],
+            df["worst_gap_bound_min"],
+            marker="v",
+            facecolors="none",
+            edgecolors="gray",
+            label="Screened (upper bound)"
+        )
+        ax1.legend()
+
     if selected_row is not None:
         ax1.scatter(
             selected_row["total_sats"],
@@ -124,6 +210,17 @@ with col2:
     fig2, ax2 = plt.subplots()
     ax2.plot(df["total_sats"], df["availability_percent"], marker="o")
 
+    if "availability_bound_percent" in df:
+        ax2.scatter(
+            df["total_sats"],
+            df["availability_bound_percent"],
+            marker="^",
+            facecolors="none",
+            edgecolors="gray",
+            label="Screened (lower bound)"
+        )
+        ax2.legend()
+
     if selected_row is not None:
         ax2.scatter(
             selected_row["total_sats"],
@@ -175,27 +272,27 @@ constellation = [coe_to_rv(coe) for coe in constellation_coe]
 lat_grid = np.arange(-90, 91, 20)
 lon_grid = np.arange(-180, 181, 20)
 
-coverage = compute_grid_coverage(
-    constellation=constellation,
-    timeline=timeline,
-    propagate_fn=lambda r0, v0, tl: propagate_orbit(r0, v0, tl, use_j2=True),
-    min_elevation_rad=min_elev_deg * DEG2RAD,
-    lat_grid_deg=lat_grid,
-    lon_grid_deg=lon_grid,
-)
-
-coverage_min = coverage * (duration_h * 60.0)
+# Maritime mode: land cells are not evaluated (NaN -> blank on the maps)
+cell_mask = ocean_cell_mask(lat_grid, lon_grid) if maritime else None
 
-max_gap = compute_grid_max_gap(
+# Coverage and max gap from a single propagation / visibility pass
+grid_stats = compute_grid_gap_statistics(
     constellation=constellation,
     timeline=timeline,
     propagate_fn=lambda r0, v0, tl: propagate_orbit(r0, v0, tl, use_j2=True),
     min_elevation_rad=min_elev_deg * DEG2RAD,
     lat_grid_deg=lat_grid,
     lon_grid_deg=lon_grid,
+    cell_mask=cell_mask,
+    n_workers=n_workers,
+    gap_bins_s=False,
+    pass_bins_s=False,
+    revisit_bins_s=False,
 )
 
-max_gap_min = max_gap / 60.0
+coverage_min = grid_stats["coverage_fraction"] * (duration_h * 60.0)
+
+max_gap_min = grid_stats["max_gap_s"] / 60.0
 
 # =============================
 # Maps
@@ -11,6 +11,7 @@ from sat_sim.orbits.elements import coe_to_rv
 from sat_sim.orbits.propagator import propagate_orbit
 from sat_sim.coverage.grid import compute_grid_coverage
 from sat_sim.coverage.grid_gap import compute_grid_max_gap
+from sat_sim.coverage.roi import roi_cell_mask, roi_geometry
 
 ROI = {
     "type": "point",
@@ -39,6 +40,15 @@ def draw_roi(ax, roi):
         lons = [roi["lon_min"], roi["lon_min"], roi["lon_max"], roi["lon_max"], roi["lon_min"]]
         ax.plot(lons, lats, color="blue", linewidth=2, transform=ccrs.PlateCarree())
 
+    elif roi["type"] in ("polygon", "shapefile"):
+        ax.add_geometries(
+            [roi_geometry(roi)],
+            crs=ccrs.PlateCarree(),
+            facecolor="none",
+            edgecolor="blue",
+            linewidth=2
+        )
+
 def plot_coverage_map(
     coverage_min,
     lat_grid,
@@ -153,6 +163,8 @@ def main():
     min_elev = 10.0 * DEG2RAD
     total_minutes = (timeline.times[-1] + timeline.dt) / 60.0
 
+    roi_mask = roi_cell_mask(ROI, lat_grid, lon_grid)
+
     # -------------------------------
     # Loop nas Top N arquiteturas
     # -------------------------------
@@ -222,6 +234,8 @@ def main():
 
         max_gap_min = max_gap / 60.0
 
+        print(f"  Gap máximo na ROI: {np.max(max_gap_min[roi_mask]):.1f} min")
+
         plot_gap_map(
             max_gap_min,
             lat_grid,
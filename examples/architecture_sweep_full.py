@@ -8,52 +8,40 @@ from sat_sim.time import TimeArray
 from sat_sim.orbits.constellation import generate_constellation
 from sat_sim.orbits.elements import coe_to_rv
 from sat_sim.orbits.propagator import propagate_orbit
-from sat_sim.coverage.grid import compute_grid_coverage
-from sat_sim.coverage.grid_gap import compute_grid_max_gap
+from sat_sim.coverage.grid_gap import compute_grid_gap_statistics
+from sat_sim.coverage.roi import parse_roi, roi_cell_mask
+from sat_sim.coverage.land_mask import ocean_cell_mask
+from sat_sim.coverage.traffic import density_weights
+from sat_sim.coverage.capacity import AlohaParams
+from sat_sim.analysis.result_store import DEFAULT_STORE_DIR, ResultStore
+from sat_sim.analysis.sweep_executor import (
+    parse_shard,
+    shard_architectures,
+    sweep_architectures,
+)
 
 
 # -------------------------------------------------
 # ROI helper
 # -------------------------------------------------
-def parse_roi(roi_str):
+def worst_gap_in_roi(max_gap_map, roi_mask):
     """
-    Parse ROI no formato:
-      point:lat,lon
+    Retorna o worst gap (min) nas células da ROI.
     """
-    kind, values = roi_str.split(":")
-    if kind != "point":
-        raise ValueError("Somente ROI do tipo 'point' é suportada neste passo")
-
-    lat, lon = map(float, values.split(","))
-    return {
-        "type": "point",
-        "lat": lat,
-        "lon": lon
-    }
-
-
-def worst_gap_in_roi(max_gap_map, lat_grid, lon_grid, roi):
-    """
-    Retorna o worst gap (min) na ROI definida.
-    """
-    if roi["type"] == "point":
-        lat0 = roi["lat"]
-        lon0 = roi["lon"]
-
-        i = np.argmin(np.abs(lat_grid - lat0))
-        j = np.argmin(np.abs(lon_grid - lon0))
-
-        return max_gap_map[i, j]
-
-    else:
-        raise ValueError("ROI type não suportado neste passo")
+    return np.nanmax(max_gap_map[roi_mask])
 
 
 def run_sweep(
     N_max,
     altitude_km,
     inclination_deg,
-    roi
+    roi,
+    n_workers=None,
+    maritime=False,
+    traffic_path=None,
+    message_interval_s=None,
+    store_dir=None,
+    shard=None
 ):
     # -------------------------------
     # Configurações globais
@@ -71,6 +59,55 @@ def run_sweep(
 
     total_minutes = (timeline.times[-1] + timeline.dt) / 60.0
 
+    # Máscara da ROI (calculada uma vez; só essas células são avaliadas)
+    roi_mask = roi_cell_mask(roi, lat_grid, lon_grid)
+
+    # Modo marítimo: exclui células de terra da avaliação e das estatísticas
+    if maritime:
+        roi_mask = roi_mask & ocean_cell_mask(lat_grid, lon_grid)
+
+        if not roi_mask.any():
+            raise ValueError("ROI não contém células oceânicas neste grid")
+
+    # Pesos de tráfego (raster reamostrado uma vez, em cache)
+    traffic = None
+    if traffic_path is not None:
+        traffic = density_weights(traffic_path, lat_grid, lon_grid)
+
+    # Store de resultados (Parquet): retoma sweeps interrompidos
+    store = None
+    if store_dir is not None:
+        store = ResultStore(store_dir, {
+            "analysis": "roi_grid",
+            "altitude_km": altitude_km,
+            "inclination_deg": inclination_deg,
+            "roi": roi,
+            "maritime": maritime,
+            "traffic_path": traffic_path,
+            "message_interval_s": message_interval_s,
+            "duration_s": float(timeline.times[-1] + timeline.dt),
+            "dt_s": float(timeline.dt),
+            "min_elevation_rad": min_elev,
+            "lat_grid_deg": lat_grid.tolist(),
+            "lon_grid_deg": lon_grid.tolist(),
+        }, shard=shard)
+
+        print(f"Store de resultados: {store.path} ({len(store)} arquiteturas)")
+
+    # Shard i/N: só as arquiteturas atribuídas a este processo
+    assigned = None
+    if shard is not None:
+        assigned = shard_architectures(
+            sweep_architectures(N_max),
+            shard,
+            len(timeline.times)
+        )
+
+        print(f"Shard {shard[0]}/{shard[1]}: {len(assigned)} arquiteturas")
+
+        if store is not None:
+            store.write_manifest(assigned)
+
     results = []
 
     altitude = R_EARTH + altitude_km * 1000.0
@@ -85,6 +122,14 @@ def run_sweep(
             if total_sats > N_max:
                 continue
 
+            if assigned is not None and (n_planes, sats_per_plane) not in assigned:
+                continue
+
+            if store is not None and (n_planes, sats_per_plane) in store:
+                print(f"Arquitetura {n_planes}×{sats_per_plane} já no store")
+                results.append(store.get((n_planes, sats_per_plane)))
+                continue
+
             print(f"Rodando arquitetura {n_planes}×{sats_per_plane} ({total_sats} sats)")
 
             constellation_coe = generate_constellation(
@@ -97,9 +142,11 @@ def run_sweep(
             constellation = [coe_to_rv(coe) for coe in constellation_coe]
 
             # -------------------------------
-            # Cobertura
+            # Cobertura, gap máximo, tráfego servido e capacidade das
+            # células da ROI, uma propagação (a carga ALOHA dos satélites
+            # soma todo o tráfego do grid)
             # -------------------------------
-            coverage = compute_grid_coverage(
+            stats = compute_grid_gap_statistics(
                 constellation=constellation,
                 timeline=timeline,
                 propagate_fn=lambda r0, v0, tl: propagate_orbit(
@@ -107,58 +154,99 @@ def run_sweep(
                 ),
                 min_elevation_rad=min_elev,
                 lat_grid_deg=lat_grid,
-                lon_grid_deg=lon_grid
+                lon_grid_deg=lon_grid,
+                cell_mask=roi_mask,
+                n_workers=n_workers,
+                gap_bins_s=False,
+                pass_bins_s=False,
+                revisit_bins_s=False,
+                weights=traffic,
+                aloha_params=(
+                    None if message_interval_s is None
+                    else AlohaParams(message_interval_s=message_interval_s)
+                )
             )
 
-            coverage_min = coverage * total_minutes
+            coverage_min = stats["coverage_fraction"][roi_mask] * total_minutes
 
             mean_cov = np.mean(coverage_min)
             min_cov = np.min(coverage_min)
 
-            # -------------------------------
-            # Gap máximo
-            # -------------------------------
-            max_gap = compute_grid_max_gap(
-                constellation=constellation,
-                timeline=timeline,
-                propagate_fn=lambda r0, v0, tl: propagate_orbit(
-                    r0, v0, tl, use_j2=True
-                ),
-                min_elevation_rad=min_elev,
-                lat_grid_deg=lat_grid,
-                lon_grid_deg=lon_grid
-            )
-
-            max_gap_min = max_gap / 60.0
+            max_gap_min = stats["max_gap_s"] / 60.0
 
             # -------------------------------
             # Critério primário (ROI)
             # -------------------------------
-            worst_gap_roi = worst_gap_in_roi(
-                max_gap_min,
-                lat_grid,
-                lon_grid,
-                roi
-            )
+            worst_gap_roi = worst_gap_in_roi(max_gap_min, roi_mask)
 
-            results.append({
+            row = {
                 "n_planes": n_planes,
                 "sats_per_plane": sats_per_plane,
                 "total_sats": total_sats,
                 "worst_gap_roi_min": worst_gap_roi,
                 "mean_coverage_min": mean_cov,
                 "min_coverage_min": min_cov,
-            })
+            }
+
+            # -------------------------------
+            # Tráfego servido (ponderado por densidade AIS)
+            # -------------------------------
+            if traffic is not None:
+                row["weighted_availability_percent"] = (
+                    100.0 * stats["weighted_availability"]
+                )
+                row["traffic_cells_worst_gap_min"] = (
+                    stats["weighted_cells_worst_gap_s"] / 60.0
+                )
+                row["traffic_mean_max_gap_min"] = (
+                    stats["weighted_mean_max_gap_s"] / 60.0
+                )
+
+                # -------------------------------
+                # Capacidade slotted-ALOHA (terminais = pesos de tráfego)
+                # -------------------------------
+                if message_interval_s is not None:
+                    capacity = stats["capacity"]
+
+                    row["detection_percent"] = (
+                        100.0 * capacity["region_detection_probability"][0]
+                    )
+                    row["peak_collision_percent"] = (
+                        100.0 * capacity["collision_probability"].max()
+                    )
+                    row["delivered_messages"] = capacity["delivered_messages"]
+
+            results.append(row)
+
+            if store is not None:
+                store.append((n_planes, sats_per_plane), row)
+
+    # Com shards, merge_sweep_shards.py junta os fragmentos no fim
+    if store is not None and shard is None:
+        store.compact()
+
+    if not results:
+        print("\nNenhuma arquitetura neste shard.")
+        return results
 
     # -------------------------------
     # Ranking
     # -------------------------------
-    results.sort(
-        key=lambda r: (
-            r["worst_gap_roi_min"],
-            -r["mean_coverage_min"]
+    if traffic is not None:
+        # Ranking pelo tráfego servido
+        results.sort(
+            key=lambda r: (
+                -r["weighted_availability_percent"],
+                r["worst_gap_roi_min"]
+            )
+        )
+    else:
+        results.sort(
+            key=lambda r: (
+                r["worst_gap_roi_min"],
+                -r["mean_coverage_min"]
+            )
         )
-    )
 
     # -------------------------------
     # CSV
@@ -166,7 +254,8 @@ def run_sweep(
     os.makedirs("results", exist_ok=True)
     output_path = os.path.join(
         "results",
-        "architecture_sweep_roi_results.csv"
+        "architecture_sweep_roi_results.csv" if shard is None
+        else f"architecture_sweep_roi_results_shard{shard[0]}of{shard[1]}.csv"
     )
 
     with open(output_path, "w", newline="") as f:
@@ -224,18 +313,87 @@ def main():
         "--roi",
         type=str,
         default="point:57.02868,9.94350",
-        help="ROI no formato point:lat,lon (default: Sternula)"
+        help=(
+            "ROI: point:lat,lon | box:lat_min,lat_max,lon_min,lon_max | "
+            "lat_band:lat_min[,lat_max] | polygon:lat,lon;lat,lon;... | "
+            "shapefile:arquivo.shp[:CAMPO=valor] (default: Sternula)"
+        )
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processos paralelos para o grid (default: serial)"
+    )
+
+    parser.add_argument(
+        "--maritime",
+        action="store_true",
+        help="Avalia apenas células oceânicas (máscara de terra em cache)"
+    )
+
+    parser.add_argument(
+        "--traffic",
+        type=str,
+        default=None,
+        help=(
+            "Raster de densidade de navios (.tif/.npy/.csv); "
+            "ranking por tráfego servido"
+        )
+    )
+
+    parser.add_argument(
+        "--message-interval",
+        type=float,
+        default=None,
+        help=(
+            "Intervalo médio entre mensagens por navio [s]; com --traffic, "
+            "adiciona capacidade slotted-ALOHA (detecção e colisões)"
+        )
+    )
+
+    parser.add_argument(
+        "--store",
+        type=str,
+        nargs="?",
+        const=DEFAULT_STORE_DIR,
+        default=None,
+        help=(
+            "Grava cada arquitetura ao terminar em um store Parquet e pula "
+            "as já gravadas (diretório opcional, default: %(const)s)"
+        )
+    )
+
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        help=(
+            "Avalia só o shard i de N (i/N, 1 <= i <= N), balanceado por "
+            "custo; com o mesmo --store em disco compartilhado, junte os "
+            "shards com merge_sweep_shards.py"
+        )
     )
 
     args = parser.parse_args()
 
+    if args.message_interval is not None and args.traffic is None:
+        parser.error("--message-interval requer --traffic")
+
     roi = parse_roi(args.roi)
 
     run_sweep(
         N_max=args.n_max,
         altitude_km=args.altitude,
         inclination_deg=args.inclination,
-        roi=roi
+        roi=roi,
+        n_workers=args.workers,
+        maritime=args.maritime,
+        traffic_path=args.traffic,
+        message_interval_s=args.message_interval,
+        store_dir=args.store,
+        shard=args.shard
     )
 
 
@@ -9,9 +9,23 @@ from sat_sim.ground.stations import GroundStation
 from sat_sim.orbits.constellation import generate_constellation
 from sat_sim.orbits.elements import coe_to_rv
 from sat_sim.orbits.propagator import propagate_orbit
-from sat_sim.frames.transforms import eci_to_ecef
-from sat_sim.access.intervals import compute_access_intervals, max_gap
-from sat_sim.access.vdes_access import is_vdes_sat_uplink_available
+from sat_sim.access.geometry import ATTITUDE_MODES
+from sat_sim.access.vdes_access import (
+    RF_MODES,
+    vdes_sat_uplink_budget,
+    vdes_sat_uplink_closed
+)
+from sat_sim.analysis.data_volume import integrate_data_volume
+from sat_sim.analysis.local_rf_metrics import (
+    closed_link_metrics,
+    compute_local_rf_link_metrics
+)
+from sat_sim.analysis.sweep_local_rf import run_sweep_local_rf_analysis
+from sat_sim.rf.vdes.antenna import load_antenna_pattern
+from sat_sim.rf.vdes.link_budget import DEFAULT_SAT_UPLINK_PARAMS
+from sat_sim.rf.vdes.losses import default_vhf_loss_chain
+from sat_sim.rf.vdes.throughput import VDES_SAT_MODCODS, achievable_rate_bps
+from sat_sim.coverage.engine import propagate_constellation_ecef
 
 
 # -------------------------------------------------
@@ -31,6 +45,11 @@ def compute_local_rf_metrics(
     n_planes,
     sats_per_plane,
     timeline,
+    rf_mode="table",
+    pattern=None,
+    attitude="nadir",
+    rate_model=None,
+    loss_chain=None,
 ):
     constellation_coe = generate_constellation(
         altitude=altitude,
@@ -41,52 +60,107 @@ def compute_local_rf_metrics(
 
     constellation = [coe_to_rv(coe) for coe in constellation_coe]
 
-    visible_times = []
-
-    for r0, v0 in constellation:
+    ephemeris, velocity = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        lambda r0, v0, tl: propagate_orbit(r0, v0, tl, use_j2=True),
+        with_velocity=True,
+    )
 
-        rs, _ = propagate_orbit(
-            r0,
-            v0,
-            timeline,
-            use_j2=True,
-        )
+    # Fechamento RF vetorizado: [n_steps, n_sats]
+    closed = vdes_sat_uplink_closed(
+        ephemeris,
+        station,
+        mode=rf_mode,
+        pattern=pattern,
+        v_sat_ecef=velocity,
+        attitude=attitude,
+        loss_chain=loss_chain,
+        times_s=timeline.times,
+    )
 
-        for r_eci, t in zip(rs, timeline.times):
+    # Mesmas convenções do caminho --joint (closed_link_metrics)
+    link = closed_link_metrics(closed, timeline)
 
-            r_ecef = eci_to_ecef(r_eci, t)
+    total_time = timeline.times[-1] + timeline.dt
 
-            res = is_vdes_sat_uplink_available(
-                r_sat_eci=r_eci,
-                r_sat_ecef=r_ecef,
-                station=station,
-            )
+    metrics = {
+        "availability_percent": link["availability_percent"],
+        "worst_gap_min": link["worst_gap_s"] / 60.0,
+    }
 
-            if res.get("is_closed", False):
-                visible_times.append(t)
+    # Volume de dados: C/N das amostras com link fechado -> taxa
+    if rate_model is not None:
+        cn_db = vdes_sat_uplink_budget(
+            ephemeris,
+            station,
+            pattern=pattern,
+            v_sat_ecef=velocity,
+            attitude=attitude,
+            loss_chain=loss_chain,
+            times_s=timeline.times,
+        )["cn_db"]
+
+        rate = np.where(
+            closed,
+            achievable_rate_bps(
+                cn_db,
+                DEFAULT_SAT_UPLINK_PARAMS.bandwidth_hz,
+                rate_model
+            ),
+            0.0,
+        )
 
-    visible_times = sorted(set(visible_times))
+        volume = integrate_data_volume(rate, timeline)
+        metrics["data_volume_mbit_per_day"] = (
+            volume["total_volume_bits"] / 1e6 / (total_time / 86400.0)
+        )
 
-    intervals = compute_access_intervals(
-        visible_times,
-        timeline.dt,
-    )
+    return metrics
 
-    total_time = timeline.times[-1] + timeline.dt
 
-    availability = (
-        len(visible_times) * timeline.dt / total_time
+def compute_local_joint_metrics(
+    station,
+    altitude,
+    inclination,
+    n_planes,
+    sats_per_plane,
+    timeline,
+    pattern=None,
+    attitude="nadir",
+    loss_chain=None,
+):
+    """
+    Uplink, downlink e joint em uma única propagação. O ranking usa o
+    critério joint (algum satélite fecha os dois sentidos).
+    """
+    constellation_coe = generate_constellation(
+        altitude=altitude,
+        inclination=inclination,
+        n_planes=n_planes,
+        sats_per_plane=sats_per_plane,
     )
 
-    gap = max_gap(
-        intervals,
-        0.0,
-        total_time,
+    metrics = compute_local_rf_link_metrics(
+        [coe_to_rv(coe) for coe in constellation_coe],
+        timeline,
+        station,
+        lambda r0, v0, tl: propagate_orbit(r0, v0, tl, use_j2=True),
+        uplink_pattern=pattern,
+        downlink_pattern=pattern,
+        attitude=attitude,
+        loss_chain=loss_chain,
     )
 
     return {
-        "availability_percent": availability * 100.0,
-        "worst_gap_min": gap / 60.0,
+        "availability_percent": metrics["joint"]["availability_percent"],
+        "worst_gap_min": metrics["joint"]["worst_gap_s"] / 60.0,
+        "uplink_availability_percent":
+            metrics["uplink"]["availability_percent"],
+        "uplink_worst_gap_min": metrics["uplink"]["worst_gap_s"] / 60.0,
+        "downlink_availability_percent":
+            metrics["downlink"]["availability_percent"],
+        "downlink_worst_gap_min": metrics["downlink"]["worst_gap_s"] / 60.0,
     }
 
 
@@ -128,6 +202,13 @@ def run_sweep_local_rf(
     max_gap_requirement=None,
     min_availability_requirement=None,
     output_filename="architecture_sweep_local_rf.csv",
+    rf_mode="table",
+    pattern=None,
+    attitude="nadir",
+    joint=False,
+    rate_model=None,
+    loss_chain=None,
+    early_stop=False,
 ):
 
     station = GroundStation(
@@ -137,32 +218,73 @@ def run_sweep_local_rf(
 
     results = []
 
-    for n_planes in range(1, n_max + 1):
-        for sats_per_plane in range(1, n_max + 1):
-
-            total_sats = n_planes * sats_per_plane
+    # Early stop: avaliação em blocos da biblioteca; só as arquiteturas
+    # que atendem aos requisitos são retornadas
+    if early_stop:
+        results = run_sweep_local_rf_analysis(
+            station_lat_deg=lat,
+            station_lon_deg=lon,
+            altitude_km=(altitude - R_EARTH) / 1000.0,
+            inclination_deg=inclination / DEG2RAD,
+            duration_h=timeline.tf / 3600.0,
+            dt_s=timeline.dt,
+            n_max=n_max,
+            max_gap_requirement_min=max_gap_requirement,
+            min_availability_requirement_pct=min_availability_requirement,
+            rf_mode=rf_mode,
+            pattern=pattern,
+            attitude=attitude,
+            rate_model=rate_model,
+            loss_chain=loss_chain,
+            early_stop=True,
+        )
+    else:
+        for n_planes in range(1, n_max + 1):
+            for sats_per_plane in range(1, n_max + 1):
 
-            if total_sats > n_max:
-                continue
+                total_sats = n_planes * sats_per_plane
 
-            print(f"Rodando {n_planes}×{sats_per_plane} ({total_sats} sats)")
+                if total_sats > n_max:
+                    continue
 
-            metrics = compute_local_rf_metrics(
-                station=station,
-                altitude=altitude,
-                inclination=inclination,
-                n_planes=n_planes,
-                sats_per_plane=sats_per_plane,
-                timeline=timeline,
-            )
+                print(
+                    f"Rodando {n_planes}×{sats_per_plane} "
+                    f"({total_sats} sats)"
+                )
 
-            results.append({
-                "n_planes": n_planes,
-                "sats_per_plane": sats_per_plane,
-                "total_sats": total_sats,
-                "availability_percent": metrics["availability_percent"],
-                "worst_gap_min": metrics["worst_gap_min"],
-            })
+                if joint:
+                    metrics = compute_local_joint_metrics(
+                        station=station,
+                        altitude=altitude,
+                        inclination=inclination,
+                        n_planes=n_planes,
+                        sats_per_plane=sats_per_plane,
+                        timeline=timeline,
+                        pattern=pattern,
+                        attitude=attitude,
+                        loss_chain=loss_chain,
+                    )
+                else:
+                    metrics = compute_local_rf_metrics(
+                        station=station,
+                        altitude=altitude,
+                        inclination=inclination,
+                        n_planes=n_planes,
+                        sats_per_plane=sats_per_plane,
+                        timeline=timeline,
+                        rf_mode=rf_mode,
+                        pattern=pattern,
+                        attitude=attitude,
+                        rate_model=rate_model,
+                        loss_chain=loss_chain,
+                    )
+
+                results.append({
+                    "n_planes": n_planes,
+                    "sats_per_plane": sats_per_plane,
+                    "total_sats": total_sats,
+                    **metrics,
+                })
 
     results.sort(key=lambda r: r["worst_gap_min"])
 
@@ -176,8 +298,22 @@ def run_sweep_local_rf(
         "N_max": n_max,
         "Max gap requirement [min]": max_gap_requirement,
         "Min availability requirement [%]": min_availability_requirement,
+        "RF mode": rf_mode,
+        "Antenna pattern": pattern.name if pattern else "omni (0 dBi)",
+        "Attitude": attitude,
+        "Link": "uplink + downlink (joint)" if joint else "uplink",
+        "Rate model": getattr(rate_model, "name", rate_model),
+        "Early stop": early_stop,
+        "Propagation losses": (
+            ", ".join(t.name for t in loss_chain.terms)
+            if loss_chain is not None else "free space only"
+        ),
     }
 
+    if not results:
+        print("\nNenhuma arquitetura atende aos requisitos.")
+        return
+
     save_csv(results, output_filename, metadata)
 
     # -------------------------------------------------
@@ -248,8 +384,83 @@ def main():
         help="Nome do CSV de saída"
     )
 
+    parser.add_argument(
+        "--rf-mode",
+        choices=RF_MODES,
+        default=None,
+        help=(
+            "Critério RF: tabela de fechamento (default), link budget exato "
+            "ou ambos; --joint usa sempre o link budget exato"
+        )
+    )
+
+    parser.add_argument(
+        "--antenna-pattern",
+        type=str,
+        default=None,
+        help="Diagrama de ganho do satélite (.csv ou .npz, theta/phi em graus)"
+    )
+
+    parser.add_argument(
+        "--attitude",
+        choices=ATTITUDE_MODES,
+        default="nadir",
+        help="Modelo de atitude para o off-boresight"
+    )
+
+    parser.add_argument(
+        "--joint",
+        action="store_true",
+        help="Avalia uplink e downlink; requisitos aplicados ao critério joint"
+    )
+
+    parser.add_argument(
+        "--rate-model",
+        choices=("shannon", "modcod"),
+        default=None,
+        help="Adiciona volume de dados/dia (limite de Shannon ou MODCOD VDES)"
+    )
+
+    parser.add_argument(
+        "--losses",
+        choices=("none", "vhf"),
+        default="none",
+        help="Perdas de propagação: cintilação, Faraday e atmosfera (vhf)"
+    )
+
+    parser.add_argument(
+        "--epoch-utc",
+        type=float,
+        default=0.0,
+        help="Hora UTC de t = 0 [h] (hora local das perdas ionosféricas)"
+    )
+
+    parser.add_argument(
+        "--early-stop",
+        action="store_true",
+        help="Abandona cada arquitetura assim que viola --max-gap ou "
+             "--min-availability (rejeitadas não entram no CSV)"
+    )
+
     args = parser.parse_args()
 
+    if args.early_stop and args.joint:
+        parser.error("--early-stop não suporta --joint")
+
+    if args.early_stop and (
+        args.max_gap is None and args.min_availability is None
+    ):
+        parser.error("--early-stop requer --max-gap e/ou --min-availability")
+
+    if args.joint and args.rf_mode not in (None, "exact"):
+        parser.error("--joint avalia o link budget exato (--rf-mode exact)")
+
+    if args.joint and args.rate_model is not None:
+        parser.error("--rate-model não suporta --joint")
+
+    if args.rf_mode is None:
+        args.rf_mode = "exact" if args.joint else "table"
+
     timeline = TimeArray(
         0.0,
         args.duration * 3600.0,
@@ -269,6 +480,22 @@ def main():
         max_gap_requirement=args.max_gap,
         min_availability_requirement=args.min_availability,
         output_filename=args.output,
+        rf_mode=args.rf_mode,
+        pattern=(
+            load_antenna_pattern(args.antenna_pattern)
+            if args.antenna_pattern else None
+        ),
+        attitude=args.attitude,
+        joint=args.joint,
+        rate_model=(
+            VDES_SAT_MODCODS if args.rate_model == "modcod"
+            else args.rate_model
+        ),
+        loss_chain=(
+            default_vhf_loss_chain(epoch_utc_h=args.epoch_utc)
+            if args.losses == "vhf" else None
+        ),
+        early_stop=args.early_stop,
     )
 
 
@@ -0,0 +1,121 @@
+import argparse
+import csv
+import os
+
+from sat_sim.analysis.monte_carlo import run_local_monte_carlo
+from sat_sim.orbits.constellation import WALKER_PATTERNS
+
+
+# -------------------------------------------------
+# Default station (sternula)
+# -------------------------------------------------
+DEFAULT_LAT = 57.02868
+DEFAULT_LON = 9.94350
+
+
+def parse_bounds(text):
+    """
+    'lo:hi' -> (lo, hi)
+    """
+    lo, hi = (float(v) for v in text.split(":"))
+    return lo, hi
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo of local coverage under RAAN0, "
+                    "plane phase and epoch uncertainty"
+    )
+
+    parser.add_argument("--lat", type=float, default=DEFAULT_LAT)
+    parser.add_argument("--lon", type=float, default=DEFAULT_LON)
+
+    parser.add_argument("--altitude", type=float, default=550.0)
+    parser.add_argument("--inclination", type=float, default=97.6)
+    parser.add_argument("--planes", type=int, default=3)
+    parser.add_argument("--sats-per-plane", type=int, default=4)
+    parser.add_argument("--phasing", type=int, default=0)
+    parser.add_argument("--pattern", choices=tuple(WALKER_PATTERNS),
+                        default="delta")
+
+    parser.add_argument("--duration", type=float, default=24.0)
+    parser.add_argument("--dt", type=float, default=60.0)
+    parser.add_argument("--min-elevation", type=float, default=0.0)
+
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=64)
+
+    parser.add_argument("--raan0", type=str, default="0:360",
+                        help="Faixa de RAAN0 [deg] lo:hi")
+    parser.add_argument("--phase", type=str, default="0:360",
+                        help="Faixa de deslocamento de fase [deg] lo:hi")
+    parser.add_argument("--epoch", type=str, default="0:24",
+                        help="Faixa de época [h] lo:hi")
+    parser.add_argument(
+        "--global-phase",
+        action="store_true",
+        help="Um único deslocamento de fase para todos os planos"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="constellation_monte_carlo.csv",
+        help="Nome do CSV de saída (uma linha por amostra)"
+    )
+
+    args = parser.parse_args()
+
+    result = run_local_monte_carlo(
+        args.lat,
+        args.lon,
+        args.altitude,
+        args.inclination,
+        args.planes,
+        args.sats_per_plane,
+        args.duration,
+        args.dt,
+        args.min_elevation,
+        n_samples=args.samples,
+        seed=args.seed,
+        raan0_range_deg=parse_bounds(args.raan0),
+        phase_range_deg=parse_bounds(args.phase),
+        epoch_range_h=parse_bounds(args.epoch),
+        per_plane_phase=not args.global_phase,
+        phasing=args.phasing,
+        pattern=args.pattern,
+        batch_size=args.batch_size,
+    )
+
+    samples = result["samples"]
+    metrics = result["metrics"]
+
+    os.makedirs("results", exist_ok=True)
+    filepath = os.path.join("results", args.output)
+
+    with open(filepath, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["raan0_deg", "epoch_h"]
+            + [f"phase_offset_p{p}_deg" for p in range(args.planes)]
+            + list(metrics)
+        )
+
+        for i in range(args.samples):
+            writer.writerow(
+                [samples["raan0_deg"][i], samples["epoch_h"][i]]
+                + list(samples["phase_offset_deg"][i])
+                + [values[i] for values in metrics.values()]
+            )
+
+    print(f"\nCSV salvo em: {filepath}\n")
+
+    for name, summary in result["summary"].items():
+        stats = " | ".join(f"{k} = {v:.2f}" for k, v in summary.items())
+        print(f"{name}: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import os
+
+import numpy as np
+
+from sat_sim.constants import R_EARTH, DEG2RAD
+from sat_sim.time import TimeArray
+from sat_sim.orbits.constellation import generate_constellation
+from sat_sim.orbits.elements import coe_to_rv
+from sat_sim.orbits.propagator import propagate_orbit
+from sat_sim.coverage.grid import iter_grid_coverage_frames
+from sat_sim.visualization.animation import write_coverage_animation
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Animação da cobertura instantânea ao longo do dia"
+    )
+
+    parser.add_argument("--n-planes", type=int, default=2)
+    parser.add_argument("--sats-per-plane", type=int, default=2)
+    parser.add_argument("--altitude", type=float, default=550.0)
+    parser.add_argument("--inclination", type=float, default=98.0)
+    parser.add_argument("--duration", type=float, default=24.0)
+    parser.add_argument("--dt", type=float, default=60.0)
+    parser.add_argument("--min-elev", type=float, default=10.0)
+    parser.add_argument("--resolution", type=float, default=5.0)
+
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=5,
+        help="Passos agregados por quadro (1 = instantâneo)"
+    )
+
+    parser.add_argument("--fps", type=int, default=10)
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join("results", "coverage_animation.mp4"),
+        help="Arquivo .mp4/.gif ou diretório para sequência PNG"
+    )
+
+    args = parser.parse_args()
+
+    constellation_coe = generate_constellation(
+        altitude=R_EARTH + args.altitude * 1000.0,
+        inclination=args.inclination * DEG2RAD,
+        n_planes=args.n_planes,
+        sats_per_plane=args.sats_per_plane
+    )
+
+    constellation = [coe_to_rv(coe) for coe in constellation_coe]
+
+    timeline = TimeArray(
+        0.0,
+        args.duration * 3600.0,
+        args.dt
+    )
+
+    lat_grid = np.arange(-90, 90 + args.resolution, args.resolution)
+    lon_grid = np.arange(-180, 180 + args.resolution, args.resolution)
+
+    frames = iter_grid_coverage_frames(
+        constellation=constellation,
+        timeline=timeline,
+        propagate_fn=lambda r0, v0, tl: propagate_orbit(
+            r0, v0, tl, use_j2=True
+        ),
+        min_elevation_rad=args.min_elev * DEG2RAD,
+        lat_grid_deg=lat_grid,
+        lon_grid_deg=lon_grid,
+        window_steps=args.window
+    )
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    n_frames = write_coverage_animation(
+        frames,
+        args.output,
+        fps=args.fps,
+        title=f"Cobertura — {args.n_planes}×{args.sats_per_plane}"
+    )
+
+    print(f"{n_frames} quadros salvos em: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+
+from sat_sim.analysis.dt_convergence import (
+    DEFAULT_AVAILABILITY_TOLERANCE_PCT,
+    DEFAULT_DT_CANDIDATES_S,
+    DEFAULT_GAP_TOLERANCE_MIN,
+)
+from sat_sim.analysis.sweep_executor import sweep_architectures
+from sat_sim.analysis.sweep_local_geom import local_geom_dt_convergence
+
+
+# -------------------------------------------------
+# Default station (sternula)
+# -------------------------------------------------
+DEFAULT_LAT = 57.02868
+DEFAULT_LON = 9.94350
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Time-step convergence study of the local access "
+                    "metrics (worst gap, availability)"
+    )
+
+    parser.add_argument("--lat", type=float, default=DEFAULT_LAT)
+    parser.add_argument("--lon", type=float, default=DEFAULT_LON)
+
+    parser.add_argument("--altitude", type=float, default=550.0)
+    parser.add_argument("--inclination", type=float, default=98.0)
+    parser.add_argument("--duration", type=float, default=24.0)
+    parser.add_argument("--min-elevation", type=float, default=0.0)
+    parser.add_argument("--n-max", type=int, default=16)
+
+    parser.add_argument(
+        "--dt",
+        type=float,
+        nargs="+",
+        default=list(DEFAULT_DT_CANDIDATES_S),
+        help="Passos candidatos [s]; o menor é a referência"
+    )
+    parser.add_argument("--gap-tolerance", type=float,
+                        default=DEFAULT_GAP_TOLERANCE_MIN,
+                        help="Tolerância do pior gap [min]")
+    parser.add_argument("--availability-tolerance", type=float,
+                        default=DEFAULT_AVAILABILITY_TOLERANCE_PCT,
+                        help="Tolerância da disponibilidade [%%]")
+
+    args = parser.parse_args()
+
+    result = local_geom_dt_convergence(
+        args.lat,
+        args.lon,
+        args.altitude,
+        args.inclination,
+        args.duration,
+        args.min_elevation,
+        sweep_architectures(args.n_max),
+        dt_candidates_s=args.dt,
+        gap_tolerance_min=args.gap_tolerance,
+        availability_tolerance_pct=args.availability_tolerance,
+    )
+
+    print(
+        f"\n{len(result['probes'])} arquiteturas-sonda, "
+        f"referência dt = {result['reference_dt_s']:g} s\n"
+    )
+    print(f"{'dt [s]':>8} {'gap err [min]':>14} {'avail err [%]':>14}")
+
+    for step in result["steps"]:
+        flag = "" if step["converged"] else "  (fora da tolerância)"
+        print(
+            f"{step['dt_s']:8g} {step['max_gap_error_min']:14.2f} "
+            f"{step['max_availability_error_pct']:14.2f}{flag}"
+        )
+
+    print(f"\nPasso escolhido: dt = {result['dt_s']:g} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import csv
+import os
+
+from sat_sim.analysis.result_store import merge_shards
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Merge, validate and deduplicate sharded sweep results"
+    )
+
+    parser.add_argument(
+        "scenario_dir",
+        type=str,
+        help="Diretório do cenário no store (<store>/<scenario_hash>)"
+    )
+
+    parser.add_argument(
+        "--sort",
+        type=str,
+        default=None,
+        help="Coluna para ordenar o CSV (ex.: worst_gap_roi_min)"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="merged_sweep_results.csv",
+        help="Nome do CSV de saída"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        rows = merge_shards(args.scenario_dir)
+    except ValueError as exc:
+        parser.exit(1, f"Merge falhou: {exc}\n")
+
+    if args.sort is not None:
+        rows.sort(key=lambda row: row[args.sort])
+
+    os.makedirs("results", exist_ok=True)
+    filepath = os.path.join("results", args.output)
+
+    fieldnames = list(dict.fromkeys(name for row in rows for name in row))
+
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"{len(rows)} arquiteturas em {args.scenario_dir}")
+    print(f"CSV salvo em: {filepath}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import csv
+import os
+
+from sat_sim.constants import R_EARTH, DEG2RAD
+from sat_sim.time import TimeArray
+from sat_sim.ground.stations import GroundStation
+from sat_sim.orbits.constellation import generate_constellation
+from sat_sim.orbits.elements import coe_to_rv
+from sat_sim.orbits.propagator import propagate_orbit
+from sat_sim.coverage.engine import propagate_constellation_ecef
+from sat_sim.access.pass_profiles import compute_pass_profiles
+
+
+# -------------------------------------------------
+# Default station (sternula)
+# -------------------------------------------------
+DEFAULT_STATION = "57.02868,9.94350"
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Doppler, delay and range-rate statistics for every pass"
+    )
+
+    parser.add_argument(
+        "--station",
+        action="append",
+        default=None,
+        help="Estação lat,lon (repetível; default: Sternula)"
+    )
+
+    parser.add_argument("--n-planes", type=int, default=2)
+    parser.add_argument("--sats-per-plane", type=int, default=2)
+    parser.add_argument("--altitude", type=float, default=550.0)
+    parser.add_argument("--inclination", type=float, default=98.0)
+
+    parser.add_argument("--duration", type=float, default=24.0)
+    parser.add_argument("--dt", type=float, default=10.0)
+
+    parser.add_argument("--frequency", type=float, default=162e6)
+    parser.add_argument("--min-elevation", type=float, default=0.0)
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="pass_doppler_profiles.csv",
+        help="Nome do CSV de saída (uma linha por passe)"
+    )
+
+    args = parser.parse_args()
+
+    stations = [
+        GroundStation(*(float(v) for v in text.split(",")))
+        for text in (args.station or [DEFAULT_STATION])
+    ]
+
+    timeline = TimeArray(0.0, args.duration * 3600.0, args.dt)
+
+    constellation = [
+        coe_to_rv(coe) for coe in generate_constellation(
+            altitude=R_EARTH + args.altitude * 1000.0,
+            inclination=args.inclination * DEG2RAD,
+            n_planes=args.n_planes,
+            sats_per_plane=args.sats_per_plane
+        )
+    ]
+
+    ephemeris, velocity = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        lambda r0, v0, tl: propagate_orbit(r0, v0, tl, use_j2=True),
+        with_velocity=True
+    )
+
+    result = compute_pass_profiles(
+        ephemeris,
+        velocity,
+        stations,
+        timeline,
+        frequency_hz=args.frequency,
+        min_elevation_rad=args.min_elevation * DEG2RAD
+    )
+
+    passes = result["passes"]
+
+    os.makedirs("results", exist_ok=True)
+    filepath = os.path.join("results", args.output)
+
+    with open(filepath, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(passes.keys())
+        writer.writerows(zip(*passes.values()))
+
+    print(f"{len(passes['station'])} passes | CSV salvo em: {filepath}\n")
+
+    summary = result["stations"]
+    for i, station in enumerate(args.station or [DEFAULT_STATION]):
+        print(
+            f"{station} | {summary['n_passes'][i]:4d} passes | "
+            f"|Doppler| max = {summary['max_abs_doppler_hz'][i]:7.1f} Hz | "
+            f"|dDoppler/dt| max = "
+            f"{summary['max_abs_doppler_rate_hz_s'][i]:5.1f} Hz/s | "
+            f"atraso max = {1e3 * summary['max_delay_s'][i]:5.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import csv
+import itertools
+import os
+
+import numpy as np
+
+from sat_sim.constants import R_EARTH, DEG2RAD
+from sat_sim.time import TimeArray
+from sat_sim.ground.stations import GroundStation
+from sat_sim.orbits.constellation import generate_constellation
+from sat_sim.orbits.elements import coe_to_rv
+from sat_sim.orbits.propagator import propagate_orbit
+from sat_sim.analysis.rf_param_sweep import CUBE_AXES, compute_rf_parameter_sweep
+from sat_sim.rf.vdes.link_budget import DEFAULT_SAT_UPLINK_PARAMS
+
+
+# -------------------------------------------------
+# Default station (sternula)
+# -------------------------------------------------
+DEFAULT_LAT = 57.02868
+DEFAULT_LON = 9.94350
+
+
+def parse_range(text):
+    """
+    'v' -> [v];  'start:stop:step' -> start, start+step, ..., stop
+    """
+    if text is None:
+        return None
+
+    parts = [float(p) for p in text.split(":")]
+
+    if len(parts) == 1:
+        return np.array(parts)
+
+    start, stop, step = parts
+    return np.arange(start, stop + 0.5 * step, step)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="VDES uplink RF trade: margin cubes from one geometry run"
+    )
+
+    parser.add_argument("--lat", type=float, default=DEFAULT_LAT)
+    parser.add_argument("--lon", type=float, default=DEFAULT_LON)
+
+    parser.add_argument("--n-planes", type=int, default=2)
+    parser.add_argument("--sats-per-plane", type=int, default=2)
+    parser.add_argument("--altitude", type=float, default=550.0)
+    parser.add_argument("--inclination", type=float, default=98.0)
+
+    parser.add_argument("--duration", type=float, default=24.0)
+    parser.add_argument("--dt", type=float, default=30.0)
+
+    parser.add_argument("--eirp", type=str, default=None,
+                        help="EIRP [dBW]: valor ou start:stop:step")
+    parser.add_argument("--gt", type=str, default=None,
+                        help="G/T [dB/K]: valor ou start:stop:step")
+    parser.add_argument("--losses", type=str, default=None,
+                        help="Perdas [dB]: valor ou start:stop:step")
+    parser.add_argument("--snr-min", type=str, default=None,
+                        help="C/N mínimo [dB]: valor ou start:stop:step")
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="rf_margin_sweep.csv",
+        help="Nome do CSV de saída"
+    )
+
+    args = parser.parse_args()
+
+    timeline = TimeArray(0.0, args.duration * 3600.0, args.dt)
+
+    constellation = [
+        coe_to_rv(coe) for coe in generate_constellation(
+            altitude=R_EARTH + args.altitude * 1000.0,
+            inclination=args.inclination * DEG2RAD,
+            n_planes=args.n_planes,
+            sats_per_plane=args.sats_per_plane
+        )
+    ]
+
+    cubes = compute_rf_parameter_sweep(
+        constellation,
+        timeline,
+        GroundStation(args.lat, args.lon),
+        lambda r0, v0, tl: propagate_orbit(r0, v0, tl, use_j2=True),
+        params=DEFAULT_SAT_UPLINK_PARAMS,
+        eirp_dbw=parse_range(args.eirp),
+        gt_rx_db_per_k=parse_range(args.gt),
+        system_losses_db=parse_range(args.losses),
+        snr_min_db=parse_range(args.snr_min)
+    )
+
+    axes = cubes["axes"]
+    shape = cubes["availability_percent"].shape
+
+    rows = []
+    for idx in itertools.product(*(range(n) for n in shape)):
+        row = {name: axes[name][i] for name, i in zip(CUBE_AXES, idx)}
+        row["availability_percent"] = cubes["availability_percent"][idx]
+        row["worst_gap_min"] = cubes["worst_gap_s"][idx] / 60.0
+        rows.append(row)
+
+    os.makedirs("results", exist_ok=True)
+    filepath = os.path.join("results", args.output)
+
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"{len(rows)} combinações avaliadas com uma única propagação")
+    print(f"CSV salvo em: {filepath}")
+
+
+if __name__ == "__main__":
+    main()
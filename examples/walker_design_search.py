@@ -0,0 +1,121 @@
+import argparse
+import csv
+import os
+
+from sat_sim.analysis.design_search import (
+    DESIGN_FIELDS,
+    DesignSpace,
+    run_local_design_search,
+)
+from sat_sim.orbits.constellation import WALKER_PATTERNS
+
+
+# -------------------------------------------------
+# Default station (sternula)
+# -------------------------------------------------
+DEFAULT_LAT = 57.02868
+DEFAULT_LON = 9.94350
+
+
+def parse_bounds(text, cast=float):
+    """
+    'lo:hi' -> (lo, hi)
+    """
+    lo, hi = (cast(v) for v in text.split(":"))
+    return lo, hi
+
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description="Walker design search (altitude, inclination, P, S, F): "
+                    "Latin hypercube seeding + evolutionary refinement"
+    )
+
+    parser.add_argument("--lat", type=float, default=DEFAULT_LAT)
+    parser.add_argument("--lon", type=float, default=DEFAULT_LON)
+
+    parser.add_argument("--duration", type=float, default=24.0)
+    parser.add_argument("--dt", type=float, default=60.0)
+    parser.add_argument("--min-elevation", type=float, default=0.0)
+
+    parser.add_argument("--altitude", type=str, default="400:1200",
+                        help="Faixa de altitude [km] lo:hi")
+    parser.add_argument("--inclination", type=str, default="40:100",
+                        help="Faixa de inclinação [deg] lo:hi")
+    parser.add_argument("--planes", type=str, default="1:12")
+    parser.add_argument("--sats-per-plane", type=str, default="1:12")
+    parser.add_argument("--max-total", type=int, default=None)
+    parser.add_argument("--pattern", choices=tuple(WALKER_PATTERNS),
+                        default="delta")
+
+    parser.add_argument(
+        "--max-gap",
+        type=float,
+        default=None,
+        help="Requisito de gap [min]: minimiza satélites que o atendem "
+             "(sem requisito: minimiza o pior gap)"
+    )
+
+    parser.add_argument("--budget", type=int, default=60,
+                        help="Número máximo de simulações")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="walker_design_search.csv",
+        help="Nome do CSV de saída (todas as avaliações)"
+    )
+
+    args = parser.parse_args()
+
+    space = DesignSpace(
+        altitude_km=parse_bounds(args.altitude),
+        inclination_deg=parse_bounds(args.inclination),
+        n_planes=parse_bounds(args.planes, int),
+        sats_per_plane=parse_bounds(args.sats_per_plane, int),
+        max_total_sats=args.max_total,
+        pattern=args.pattern,
+    )
+
+    result = run_local_design_search(
+        args.lat,
+        args.lon,
+        args.duration,
+        args.dt,
+        args.min_elevation,
+        space=space,
+        max_gap_requirement_min=args.max_gap,
+        max_evaluations=args.budget,
+        seed=args.seed,
+        n_workers=args.workers,
+        progress=lambda done, total: print(f"{done}/{total} designs"),
+    )
+
+    history = sorted(result["history"], key=lambda row: row["score"])
+
+    os.makedirs("results", exist_ok=True)
+    filepath = os.path.join("results", args.output)
+
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=history[0].keys())
+        writer.writeheader()
+        writer.writerows(history)
+
+    print(f"\nCSV salvo em: {filepath}\n")
+
+    best = result["best"]
+    design = ", ".join(f"{k} = {best[k]}" for k in DESIGN_FIELDS)
+
+    print(f"Melhor design ({best['pattern']}): {design}")
+    print(
+        f"{best['total_sats']} sats | "
+        f"gap = {best['worst_gap_min']:.1f} min | "
+        f"availability = {best['availability_percent']:.1f}%"
+    )
+
+
+if __name__ == "__main__":
+    main()
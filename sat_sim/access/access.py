@@ -19,4 +19,31 @@ def is_visible(
     
     elev = np.arcsin(sin_e)
 
-    return elev >= min_elevation_rad
\ No newline at end of file
+    return elev >= min_elevation_rad
+
+
+def visibility_matrix(
+    r_sat_ecef,
+    r_gs_ecef,
+    zenith_unit,
+    min_elevation_rad
+) -> np.ndarray:
+    """
+    Versão vetorizada de is_visible.
+
+    r_sat_ecef: [n_sats, 3]
+    r_gs_ecef, zenith_unit: [n_gs, 3]
+
+    Retorna matriz booleana [n_gs, n_sats].
+    """
+    r_sat_ecef = np.atleast_2d(r_sat_ecef)
+    r_gs_ecef = np.atleast_2d(r_gs_ecef)
+    zenith_unit = np.atleast_2d(zenith_unit)
+
+    rho = r_sat_ecef[None, :, :] - r_gs_ecef[:, None, :]
+    rho_norm = np.linalg.norm(rho, axis=-1)
+
+    sin_e = np.einsum("gsk,gk->gs", rho, zenith_unit) / rho_norm
+    sin_e = np.clip(sin_e, -1.0, 1.0)
+
+    return np.arcsin(sin_e) >= min_elevation_rad
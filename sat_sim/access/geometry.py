@@ -1,4 +1,5 @@
 import numpy as np
+from sat_sim.constants import OMEGA_EARTH
 
 def elevation_angle(
     r_sat_ecef: np.ndarray,
@@ -13,3 +14,83 @@ def elevation_angle(
 
     sin_e = np.dot(rho_hat, zenith_unit)
     return np.arcsin(sin_e)
+
+
+def slant_range_elevation(
+    r_sat_ecef: np.ndarray,
+    r_gs_ecef: np.ndarray,
+    zenith_unit: np.ndarray
+):
+    """
+    Versão vetorizada: distância [m] e elevação [rad] do satélite vista
+    da estação.
+
+    r_sat_ecef tem shape (..., 3); r_gs_ecef e zenith_unit (3,) ou
+    compatíveis por broadcast. Retorna (distance_m, elevation_rad) com
+    shape (...).
+    """
+    rho = np.asarray(r_sat_ecef) - r_gs_ecef
+    distance = np.linalg.norm(rho, axis=-1)
+
+    sin_e = np.sum(rho * zenith_unit, axis=-1) / distance
+    elevation = np.arcsin(np.clip(sin_e, -1.0, 1.0))
+
+    return distance, elevation
+
+
+ATTITUDE_MODES = ("nadir", "yaw_steered")
+
+
+def nadir_pointing_angles(
+    r_sat_ecef: np.ndarray,
+    r_gs_ecef: np.ndarray,
+    v_sat_ecef: np.ndarray = None,
+    attitude: str = "nadir"
+):
+    """
+    Ângulos da estação no referencial do corpo de um satélite com
+    boresight apontado para o nadir.
+
+    Eixos do corpo: Z = nadir; X = direção de voo projetada (velocidade
+    inercial em "nadir"; velocidade relativa à Terra em "yaw_steered",
+    que compensa a rotação da Terra); Y = Z x X.
+
+    r_sat_ecef e v_sat_ecef têm shape (..., 3); v_sat_ecef é a velocidade
+    inercial expressa em eixos ECEF. Retorna (off_boresight_rad, phi_rad)
+    com shape (...). Sem v_sat_ecef, phi = 0 (suficiente para diagramas
+    axissimétricos).
+    """
+    if attitude not in ATTITUDE_MODES:
+        raise ValueError(f"Atitude inválida: '{attitude}'")
+
+    r_sat = np.asarray(r_sat_ecef, dtype=float)
+
+    z_body = -r_sat / np.linalg.norm(r_sat, axis=-1, keepdims=True)
+
+    los = np.asarray(r_gs_ecef) - r_sat
+    los = los / np.linalg.norm(los, axis=-1, keepdims=True)
+
+    los_z = np.sum(los * z_body, axis=-1)
+    off_boresight = np.arccos(np.clip(los_z, -1.0, 1.0))
+
+    if v_sat_ecef is None:
+        return off_boresight, np.zeros_like(off_boresight)
+
+    v = np.asarray(v_sat_ecef, dtype=float)
+
+    if attitude == "yaw_steered":
+        # v - omega x r, com omega = OMEGA_EARTH * z
+        v = v.copy()
+        v[..., 0] += OMEGA_EARTH * r_sat[..., 1]
+        v[..., 1] -= OMEGA_EARTH * r_sat[..., 0]
+
+    y_body = np.cross(z_body, v)
+    y_body = y_body / np.linalg.norm(y_body, axis=-1, keepdims=True)
+    x_body = np.cross(y_body, z_body)
+
+    phi = np.arctan2(
+        np.sum(los * y_body, axis=-1),
+        np.sum(los * x_body, axis=-1)
+    )
+
+    return off_boresight, phi
@@ -0,0 +1,214 @@
+import numpy as np
+
+from sat_sim.constants import C_LIGHT, OMEGA_EARTH
+
+
+def earth_relative_velocity(r_sat_ecef, v_sat_ecef):
+    """
+    Velocidade relativa à Terra em ECEF: v - omega x r, onde v é a
+    velocidade inercial expressa em eixos ECEF (como retornada por
+    propagate_constellation_ecef(with_velocity=True)).
+    """
+    r = np.asarray(r_sat_ecef, dtype=float)
+    v = np.array(v_sat_ecef, dtype=float)
+
+    v[..., 0] += OMEGA_EARTH * r[..., 1]
+    v[..., 1] -= OMEGA_EARTH * r[..., 0]
+
+    return v
+
+
+def link_profiles(
+    r_sat_ecef,
+    v_sat_ecef,
+    r_gs_ecef,
+    zenith_gs,
+    dt,
+    frequency_hz=162e6
+):
+    """
+    Perfis vetorizados satélite-estação para todos os instantes.
+
+    r_sat_ecef, v_sat_ecef: [n_steps, n_sats, 3]
+    r_gs_ecef, zenith_gs:   [n_stations, 3]
+
+    Retorna dicionário com arrays [n_steps, n_stations, n_sats]:
+        range_m, range_rate_m_s, delay_s, doppler_hz,
+        doppler_rate_hz_s (diferenças finitas no tempo), elevation_rad
+    """
+    r_sat = np.asarray(r_sat_ecef, dtype=float)[:, None, :, :]
+    v_rel = earth_relative_velocity(r_sat_ecef, v_sat_ecef)[:, None, :, :]
+
+    r_gs = np.asarray(r_gs_ecef, dtype=float)[None, :, None, :]
+    zenith = np.asarray(zenith_gs, dtype=float)[None, :, None, :]
+
+    rho = r_sat - r_gs
+    distance = np.linalg.norm(rho, axis=-1)
+
+    range_rate = np.sum(rho * v_rel, axis=-1) / distance
+
+    sin_e = np.sum(rho * zenith, axis=-1) / distance
+    elevation = np.arcsin(np.clip(sin_e, -1.0, 1.0))
+
+    doppler = -frequency_hz * range_rate / C_LIGHT
+
+    if len(doppler) > 1:
+        doppler_rate = np.gradient(doppler, dt, axis=0)
+    else:
+        doppler_rate = np.zeros_like(doppler)
+
+    return {
+        "range_m": distance,
+        "range_rate_m_s": range_rate,
+        "delay_s": distance / C_LIGHT,
+        "doppler_hz": doppler,
+        "doppler_rate_hz_s": doppler_rate,
+        "elevation_rad": elevation,
+    }
+
+
+def find_passes(visible):
+    """
+    Identifica passes (sequências contíguas de instantes visíveis) em uma
+    máscara [n_steps, n_pairs], sem laços.
+
+    Retorna (pair, start, stop, sample_order), onde pair/start/stop têm
+    shape [n_passes] (stop exclusivo) e sample_order são os índices
+    achatados [pair * n_steps + k] das amostras visíveis, agrupados
+    passe a passe.
+    """
+    visible = np.asarray(visible, dtype=bool)
+    n_steps = visible.shape[0]
+
+    # [n_pairs, n_steps]: cada linha é a série temporal de um par
+    rows = np.ascontiguousarray(visible.T)
+    padded = np.pad(rows, ((0, 0), (1, 1)))
+
+    edges = np.diff(padded.astype(np.int8), axis=1)
+    pair, start = np.nonzero(edges == 1)
+    _, stop = np.nonzero(edges == -1)
+
+    sample_order = np.flatnonzero(rows.ravel())
+
+    return pair, start, stop, sample_order
+
+
+def compute_pass_profiles(
+    ephemeris_ecef,
+    velocity_ecef,
+    stations,
+    timeline,
+    frequency_hz=162e6,
+    min_elevation_rad=0.0,
+    keep_profiles=False
+):
+    """
+    Alcance, atraso, Doppler e taxa de Doppler de todos os passes de todos
+    os satélites sobre um conjunto de estações, em forma vetorizada.
+
+    ephemeris_ecef, velocity_ecef: [n_steps, n_sats, 3]
+    (propagate_constellation_ecef(..., with_velocity=True)).
+    stations: lista de GroundStation.
+
+    Retorna dicionário:
+        passes    arrays [n_passes]: station, satellite, t_start_s,
+                  t_end_s, duration_s, max_elevation_deg, min_range_m,
+                  min_delay_s, max_delay_s, doppler_min_hz, doppler_max_hz,
+                  max_abs_doppler_hz, max_abs_doppler_rate_hz_s
+        stations  arrays [n_stations]: n_passes, mean_duration_s,
+                  max_abs_doppler_hz, max_abs_doppler_rate_hz_s,
+                  max_delay_s
+        profiles  (keep_profiles=True) arrays [n_steps, n_stations, n_sats]
+                  de link_profiles
+    """
+    r_gs = np.array([s.position_ecef() for s in stations])
+    zenith = r_gs / np.linalg.norm(r_gs, axis=-1, keepdims=True)
+
+    profiles = link_profiles(
+        ephemeris_ecef,
+        velocity_ecef,
+        r_gs,
+        zenith,
+        timeline.dt,
+        frequency_hz
+    )
+
+    n_steps, n_stations, n_sats = profiles["range_m"].shape
+
+    visible = profiles["elevation_rad"] >= min_elevation_rad
+    pair, start, stop, order = find_passes(visible.reshape(n_steps, -1))
+
+    # Amostras visíveis agrupadas por passe: [n_pairs * n_steps] -> passe
+    def samples(name):
+        return np.moveaxis(profiles[name], 0, -1).reshape(-1)[order]
+
+    offsets = np.concatenate(([0], np.cumsum(stop - start)[:-1]))
+
+    def reduce(ufunc, name, transform=None):
+        values = samples(name)
+        if transform is not None:
+            values = transform(values)
+        if len(offsets) == 0:
+            return np.zeros(0)
+        return ufunc.reduceat(values, offsets)
+
+    times = timeline.times
+    station_idx, sat_idx = np.divmod(pair, n_sats)
+
+    passes = {
+        "station": station_idx,
+        "satellite": sat_idx,
+        "t_start_s": times[start],
+        "t_end_s": times[stop - 1] + timeline.dt,
+        "duration_s": (stop - start) * timeline.dt,
+        "max_elevation_deg": np.degrees(
+            reduce(np.maximum, "elevation_rad")
+        ),
+        "min_range_m": reduce(np.minimum, "range_m"),
+        "min_delay_s": reduce(np.minimum, "delay_s"),
+        "max_delay_s": reduce(np.maximum, "delay_s"),
+        "doppler_min_hz": reduce(np.minimum, "doppler_hz"),
+        "doppler_max_hz": reduce(np.maximum, "doppler_hz"),
+        "max_abs_doppler_hz": reduce(np.maximum, "doppler_hz", np.abs),
+        "max_abs_doppler_rate_hz_s": reduce(
+            np.maximum,
+            "doppler_rate_hz_s",
+            np.abs
+        ),
+    }
+
+    n_passes = np.bincount(station_idx, minlength=n_stations)
+
+    def station_max(values):
+        out = np.full(n_stations, -np.inf)
+        np.maximum.at(out, station_idx, values)
+        return np.where(n_passes > 0, out, np.nan)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_duration = np.where(
+            n_passes > 0,
+            np.bincount(
+                station_idx,
+                weights=passes["duration_s"],
+                minlength=n_stations
+            ) / n_passes,
+            np.nan
+        )
+
+    result = {
+        "passes": passes,
+        "stations": {
+            "n_passes": n_passes,
+            "mean_duration_s": mean_duration,
+            "max_abs_doppler_hz": station_max(passes["max_abs_doppler_hz"]),
+            "max_abs_doppler_rate_hz_s": station_max(
+                passes["max_abs_doppler_rate_hz_s"]
+            ),
+            "max_delay_s": station_max(passes["max_delay_s"]),
+        },
+    }
+
+    if keep_profiles:
+        result["profiles"] = profiles
+
+    return result
@@ -0,0 +1,99 @@
+import numpy as np
+
+
+class RequirementMonitor:
+    """
+    Acompanha, bloco a bloco, a máscara de acesso de uma arquitetura e
+    detecta o primeiro instante em que um requisito não pode mais ser
+    atendido:
+    - max_gap_s: um gap (passos consecutivos sem acesso) maior que o
+      requisito já foi observado
+    - min_availability_percent: mesmo com acesso em todos os passos
+      restantes a disponibilidade final ficaria abaixo do alvo
+
+    Convenções de gap iguais às de access.intervals (gap = n * dt,
+    incluindo gaps inicial e final).
+    """
+
+    def __init__(
+        self,
+        n_steps,
+        dt,
+        max_gap_s=None,
+        min_availability_percent=None
+    ):
+        self.n_steps = int(n_steps)
+        self.dt = float(dt)
+        self.max_gap_s = max_gap_s
+        self.min_availability_percent = min_availability_percent
+
+        self.evaluated_steps = 0
+        self.visible_steps = 0
+        self.worst_gap_steps = 0
+        self.violation = None
+
+        self._gap_steps = 0
+
+    @property
+    def active(self):
+        return (
+            self.max_gap_s is not None
+            or self.min_availability_percent is not None
+        )
+
+    def update(self, visible):
+        """
+        Acrescenta a máscara [n] dos próximos passos. Retorna True se um
+        requisito foi violado (motivo em self.violation).
+        """
+        visible = np.asarray(visible, dtype=bool)
+        n = len(visible)
+
+        idx = np.flatnonzero(visible)
+
+        if len(idx) == 0:
+            self._gap_steps += n
+            block_gap = self._gap_steps
+        else:
+            inner = np.diff(idx) - 1
+            block_gap = max(
+                self._gap_steps + idx[0],
+                int(inner.max()) if len(inner) else 0
+            )
+            self._gap_steps = n - 1 - idx[-1]
+            block_gap = max(block_gap, self._gap_steps)
+
+        self.worst_gap_steps = max(self.worst_gap_steps, block_gap)
+        self.visible_steps += len(idx)
+        self.evaluated_steps += n
+
+        if (
+            self.max_gap_s is not None
+            and self.worst_gap_steps * self.dt > self.max_gap_s
+        ):
+            self.violation = "max_gap"
+
+        elif self.min_availability_percent is not None:
+            remaining = self.n_steps - self.evaluated_steps
+            best = 100.0 * (self.visible_steps + remaining) / self.n_steps
+
+            if best < self.min_availability_percent:
+                self.violation = "availability"
+
+        return self.violation is not None
+
+    def rejected_metrics(self):
+        """
+        Métricas parciais de uma arquitetura rejeitada: worst_gap_s e
+        availability_percent são limites inferiores (apenas os passos
+        avaliados), evaluated_s é o tempo simulado até a rejeição.
+        """
+        return {
+            "availability_percent": (
+                100.0 * self.visible_steps / self.n_steps
+            ),
+            "worst_gap_s": self.worst_gap_steps * self.dt,
+            "mean_revisit_s": np.nan,
+            "rejected": self.violation,
+            "evaluated_s": self.evaluated_steps * self.dt,
+        }
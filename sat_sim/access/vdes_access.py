@@ -1,13 +1,29 @@
 # sat_sim/access/vdes_access.py
 
+import warnings
+
 import numpy as np
-from sat_sim.rf.vdes.link_budget import compute_vdes_sat_uplink
+from sat_sim.constants import R_EARTH
+from sat_sim.access.geometry import (
+    nadir_pointing_angles,
+    slant_range_elevation
+)
+from sat_sim.rf.vdes.closure import build_uplink_closure_table
+from sat_sim.rf.vdes.losses import local_time_hours
+from sat_sim.rf.vdes.link_budget import (
+    DEFAULT_SAT_DOWNLINK_PARAMS,
+    DEFAULT_SAT_UPLINK_PARAMS,
+    compute_vdes_sat_downlink_array,
+    compute_vdes_sat_uplink,
+    compute_vdes_sat_uplink_array
+)
 
 
 def is_vdes_sat_uplink_available(
     r_sat_eci: np.ndarray,
     r_sat_ecef: np.ndarray,
     station,
+    pattern=None,
 ):
     r_gs = station.position_ecef()
 
@@ -24,9 +40,316 @@ def is_vdes_sat_uplink_available(
             "reason": "below_horizon"
         }
 
-    result = compute_vdes_sat_uplink(
-        distance_m=distance_m,
-        off_boresight_rad=0.0
+    if pattern is None:
+        return compute_vdes_sat_uplink(
+            distance_m=distance_m,
+            off_boresight_rad=0.0
+        )
+
+    # Apontamento nadir; phi = 0 (diagrama tratado no plano X do corpo)
+    off_boresight, _ = nadir_pointing_angles(r_sat_ecef, r_gs)
+
+    result = compute_vdes_sat_uplink_array(
+        distance_m,
+        off_boresight_rad=off_boresight,
+        pattern=pattern
+    )
+
+    return {
+        "cn_db": result["cn_db"][()],
+        "margin_db": result["margin_db"][()],
+        "is_closed": result["is_closed"][()]
+    }
+
+
+def _pattern_angles(r_sat_ecef, r_gs, v_sat_ecef, attitude, *patterns):
+    """
+    (off_boresight, phi) para os diagramas dados; (0, 0) sem nenhum.
+    phi só é calculado se algum diagrama não for axissimétrico.
+    """
+    patterns = [p for p in patterns if p is not None]
+    if not patterns:
+        return 0.0, 0.0
+
+    needs_phi = not all(p.axisymmetric for p in patterns)
+
+    if needs_phi and v_sat_ecef is None:
+        raise ValueError(
+            "Diagrama não axissimétrico requer v_sat_ecef (atitude)"
+        )
+
+    return nadir_pointing_angles(
+        r_sat_ecef,
+        r_gs,
+        v_sat_ecef if needs_phi else None,
+        attitude
     )
 
-    return result
+
+def _chain_losses(loss_chain, station, elevation_rad, times_s):
+    """
+    Perdas da LossChain [dB] com shape de elevation_rad; 0 sem cadeia.
+    times_s [n_steps] corresponde ao primeiro eixo das efemérides.
+    """
+    if loss_chain is None:
+        return 0.0
+
+    if times_s is None:
+        local_time = local_time_hours(station.lon, 0.0, loss_chain.epoch_utc_h)
+    else:
+        local_time = local_time_hours(
+            station.lon,
+            times_s,
+            loss_chain.epoch_utc_h
+        ).reshape((-1,) + (1,) * (np.ndim(elevation_rad) - 1))
+
+    return loss_chain(elevation_rad, station.lat, local_time)
+
+
+def vdes_sat_uplink_budget(
+    r_sat_ecef: np.ndarray,
+    station,
+    params=DEFAULT_SAT_UPLINK_PARAMS,
+    pattern=None,
+    v_sat_ecef=None,
+    attitude="nadir",
+    loss_chain=None,
+    times_s=None,
+):
+    """
+    Versão vetorizada de is_vdes_sat_uplink_available.
+
+    r_sat_ecef: efemérides ECEF com shape (..., 3), ex. [n_steps, n_sats, 3].
+    Retorna structured array (cn_db, margin_db, is_closed) com shape (...);
+    amostras abaixo do horizonte têm is_closed = False.
+
+    Com pattern (AntennaPattern), off-boresight e azimute vêm do modelo de
+    atitude (nadir_pointing_angles) para todos os pares de uma vez;
+    diagramas não axissimétricos exigem v_sat_ecef.
+
+    loss_chain (LossChain) adiciona perdas de propagação por amostra
+    (elevação, latitude da estação, hora local); times_s [n_steps] são
+    os instantes do primeiro eixo de r_sat_ecef.
+    """
+    r_gs = station.position_ecef()
+    zenith = r_gs / np.linalg.norm(r_gs)
+
+    distance_m, elevation_rad = slant_range_elevation(
+        r_sat_ecef,
+        r_gs,
+        zenith
+    )
+
+    off_boresight, phi = _pattern_angles(
+        r_sat_ecef,
+        r_gs,
+        v_sat_ecef,
+        attitude,
+        pattern
+    )
+
+    return compute_vdes_sat_uplink_array(
+        distance_m,
+        off_boresight_rad=off_boresight,
+        elevation_rad=elevation_rad,
+        params=params,
+        phi_rad=phi,
+        pattern=pattern,
+        propagation_losses_db=_chain_losses(
+            loss_chain,
+            station,
+            elevation_rad,
+            times_s
+        )
+    )
+
+
+def vdes_sat_link_budgets(
+    r_sat_ecef: np.ndarray,
+    station,
+    uplink_params=DEFAULT_SAT_UPLINK_PARAMS,
+    downlink_params=DEFAULT_SAT_DOWNLINK_PARAMS,
+    uplink_pattern=None,
+    downlink_pattern=None,
+    v_sat_ecef=None,
+    attitude="nadir",
+    loss_chain=None,
+    times_s=None,
+):
+    """
+    Uplink e downlink a partir de uma única geometria (distância,
+    elevação, ângulos de antena e perdas de propagação calculados uma
+    vez; a mesma loss_chain vale para os dois sentidos).
+
+    Retorna {"uplink": ..., "downlink": ...}, structured arrays com
+    shape (...) como vdes_sat_uplink_budget.
+    """
+    r_gs = station.position_ecef()
+    zenith = r_gs / np.linalg.norm(r_gs)
+
+    distance_m, elevation_rad = slant_range_elevation(
+        r_sat_ecef,
+        r_gs,
+        zenith
+    )
+
+    off_boresight, phi = _pattern_angles(
+        r_sat_ecef,
+        r_gs,
+        v_sat_ecef,
+        attitude,
+        uplink_pattern,
+        downlink_pattern
+    )
+
+    losses_db = _chain_losses(loss_chain, station, elevation_rad, times_s)
+
+    return {
+        "uplink": compute_vdes_sat_uplink_array(
+            distance_m,
+            off_boresight_rad=off_boresight,
+            elevation_rad=elevation_rad,
+            params=uplink_params,
+            phi_rad=phi,
+            pattern=uplink_pattern,
+            propagation_losses_db=losses_db
+        ),
+        "downlink": compute_vdes_sat_downlink_array(
+            distance_m,
+            off_boresight_rad=off_boresight,
+            elevation_rad=elevation_rad,
+            params=downlink_params,
+            phi_rad=phi,
+            pattern=downlink_pattern,
+            propagation_losses_db=losses_db
+        ),
+    }
+
+
+def vdes_sat_downlink_budget(
+    r_sat_ecef: np.ndarray,
+    station,
+    params=DEFAULT_SAT_DOWNLINK_PARAMS,
+    pattern=None,
+    v_sat_ecef=None,
+    attitude="nadir",
+    loss_chain=None,
+    times_s=None,
+):
+    """
+    Downlink VDE-SAT vetorizado (satélite -> navio); convenções de
+    vdes_sat_uplink_budget, com pattern = diagrama TX do satélite.
+    """
+    return vdes_sat_link_budgets(
+        r_sat_ecef,
+        station,
+        downlink_params=params,
+        downlink_pattern=pattern,
+        v_sat_ecef=v_sat_ecef,
+        attitude=attitude,
+        loss_chain=loss_chain,
+        times_s=times_s
+    )["downlink"]
+
+
+RF_MODES = ("exact", "table", "check")
+
+
+def vdes_sat_uplink_closed(
+    r_sat_ecef: np.ndarray,
+    station,
+    params=DEFAULT_SAT_UPLINK_PARAMS,
+    mode="exact",
+    table=None,
+    pattern=None,
+    v_sat_ecef=None,
+    attitude="nadir",
+    loss_chain=None,
+    times_s=None,
+):
+    """
+    Máscara booleana de fechamento do uplink, shape (...).
+
+    mode:
+    - "exact": link budget completo em cada amostra
+    - "table": teste geométrico distância <= alcance máximo(elevação)
+      com a tabela de fechamento (build_uplink_closure_table)
+    - "check": calcula ambos, avisa se divergirem e retorna o exato
+
+    Sem table, a tabela é construída para a altitude média das efemérides
+    (e o mesmo pattern); diagramas não axissimétricos usam a tabela por
+    azimute com o phi da atitude (exige v_sat_ecef, como no "exact").
+    pattern, v_sat_ecef, attitude, loss_chain e times_s: ver
+    vdes_sat_uplink_budget. Com loss_chain, o teste da
+    tabela usa a distância equivalente distância * 10^(perdas / 20).
+    """
+    if mode not in RF_MODES:
+        raise ValueError(f"rf mode inválido: '{mode}'")
+
+    if mode == "exact":
+        return vdes_sat_uplink_budget(
+            r_sat_ecef,
+            station,
+            params,
+            pattern,
+            v_sat_ecef,
+            attitude,
+            loss_chain,
+            times_s
+        )["is_closed"]
+
+    r_gs = station.position_ecef()
+    zenith = r_gs / np.linalg.norm(r_gs)
+
+    distance_m, elevation_rad = slant_range_elevation(
+        r_sat_ecef,
+        r_gs,
+        zenith
+    )
+
+    if table is None:
+        altitude_m = np.mean(np.linalg.norm(r_sat_ecef, axis=-1)) - R_EARTH
+        table = build_uplink_closure_table(
+            params,
+            round(altitude_m, -2),
+            pattern=pattern
+        )
+
+    losses_db = _chain_losses(loss_chain, station, elevation_rad, times_s)
+
+    # Azimute no corpo (atitude) para tabelas por phi e para o "check"
+    off_boresight, phi = _pattern_angles(
+        r_sat_ecef,
+        r_gs,
+        v_sat_ecef,
+        attitude,
+        pattern
+    )
+
+    closed = table.is_closed(
+        distance_m * 10.0 ** (np.asarray(losses_db) / 20.0),
+        elevation_rad,
+        phi
+    )
+
+    if mode == "check":
+        exact = compute_vdes_sat_uplink_array(
+            distance_m,
+            off_boresight_rad=off_boresight,
+            elevation_rad=elevation_rad,
+            params=params,
+            phi_rad=phi,
+            pattern=pattern,
+            propagation_losses_db=losses_db
+        )["is_closed"]
+
+        n_diff = np.count_nonzero(closed != exact)
+        if n_diff:
+            warnings.warn(
+                f"Tabela de fechamento diverge do link budget em "
+                f"{n_diff} de {exact.size} amostras"
+            )
+
+        return exact
+
+    return closed
@@ -0,0 +1,334 @@
+# sat_sim/analysis/design_search.py
+
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+
+from sat_sim.constants import R_EARTH, DEG2RAD
+from sat_sim.time import TimeArray
+from sat_sim.ground.stations import GroundStation
+from sat_sim.orbits.constellation import WalkerShell, generate_shells
+from sat_sim.orbits.elements import coe_to_rv
+from sat_sim.orbits.propagator import propagate_orbit
+from sat_sim.access.access import visibility_matrix
+from sat_sim.coverage.engine import propagate_constellation_ecef
+from sat_sim.analysis.local_rf_metrics import closed_link_metrics
+from sat_sim.analysis.sweep_executor import run_architecture_sweep
+
+
+# Ordem dos campos de um design (n_planes e sats_per_plane primeiro, como
+# nas arquiteturas do sweep_executor)
+DESIGN_FIELDS = (
+    "n_planes",
+    "sats_per_plane",
+    "phasing",
+    "altitude_km",
+    "inclination_deg",
+)
+
+
+@dataclass(frozen=True)
+class DesignSpace:
+    """
+    Limites do espaço de projeto Walker (inclusivos). max_total_sats
+    limita n_planes * sats_per_plane (n_planes e depois sats_per_plane
+    são reduzidos, sem sair dos limites inferiores).
+    """
+    altitude_km: tuple = (400.0, 1200.0)
+    inclination_deg: tuple = (40.0, 100.0)
+    n_planes: tuple = (1, 12)
+    sats_per_plane: tuple = (1, 12)
+    max_total_sats: int = None
+    pattern: str = "delta"
+
+    def __post_init__(self):
+        min_total = self.n_planes[0] * self.sats_per_plane[0]
+
+        if self.max_total_sats is not None and self.max_total_sats < min_total:
+            raise ValueError(
+                f"max_total_sats ({self.max_total_sats}) menor que o "
+                f"mínimo do espaço de projeto ({min_total})"
+            )
+
+    def decode(self, u):
+        """
+        Ponto do hipercubo unitário [5] -> design (n_planes,
+        sats_per_plane, phasing, altitude_km, inclination_deg).
+        Altitude e inclinação são arredondadas a 0.1 km / 0.1 deg.
+        """
+        u = np.clip(np.asarray(u, dtype=float), 0.0, 1.0 - 1e-12)
+
+        def integer(bounds, x):
+            lo, hi = bounds
+            return int(lo + np.floor(x * (hi - lo + 1)))
+
+        def real(bounds, x):
+            lo, hi = bounds
+            return round(float(lo + x * (hi - lo)), 1)
+
+        n_planes = integer(self.n_planes, u[0])
+        sats_per_plane = integer(self.sats_per_plane, u[1])
+
+        if self.max_total_sats is not None:
+            n_planes = min(
+                n_planes,
+                self.max_total_sats // self.sats_per_plane[0]
+            )
+            sats_per_plane = min(
+                sats_per_plane,
+                self.max_total_sats // n_planes
+            )
+
+        return (
+            n_planes,
+            sats_per_plane,
+            int(np.floor(u[2] * n_planes)),
+            real(self.altitude_km, u[3]),
+            real(self.inclination_deg, u[4]),
+        )
+
+
+def latin_hypercube(n_samples, n_dims, rng):
+    """
+    Amostragem por hipercubo latino em [0, 1)^n_dims: cada dimensão tem
+    exatamente uma amostra por estrato de largura 1/n_samples.
+    """
+    strata = np.stack([
+        rng.permutation(n_samples) for _ in range(n_dims)
+    ], axis=1)
+
+    return (strata + rng.random((n_samples, n_dims))) / n_samples
+
+
+def evaluate_local_design(
+    n_planes,
+    sats_per_plane,
+    phasing,
+    altitude_km,
+    inclination_deg,
+    station,
+    timeline,
+    min_elev_rad,
+    pattern="delta",
+    base_shells=()
+):
+    """
+    Métricas geométricas locais de um design Walker (J2), opcionalmente
+    somado a camadas fixas base_shells (WalkerShell).
+    """
+    shell = WalkerShell(
+        altitude=R_EARTH + altitude_km * 1000.0,
+        inclination=inclination_deg * DEG2RAD,
+        n_planes=n_planes,
+        sats_per_plane=sats_per_plane,
+        phasing=phasing,
+        pattern=pattern
+    )
+
+    constellation = [
+        coe_to_rv(coe)
+        for coe in generate_shells(tuple(base_shells) + (shell,))
+    ]
+
+    ephemeris = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        lambda r0, v0, tl: propagate_orbit(r0, v0, tl, use_j2=True)
+    )
+
+    n_steps, n_sats, _ = ephemeris.shape
+
+    visible = visibility_matrix(
+        ephemeris.reshape(-1, 3),
+        station.position_ecef(),
+        station.zenith_unit_vector(),
+        min_elev_rad
+    ).reshape(n_steps, n_sats)
+
+    metrics = closed_link_metrics(visible, timeline)
+
+    return {
+        **dict(zip(DESIGN_FIELDS, (
+            n_planes,
+            sats_per_plane,
+            phasing,
+            altitude_km,
+            inclination_deg,
+        ))),
+        "pattern": pattern,
+        "total_sats": n_sats,
+        "worst_gap_min": metrics["worst_gap_s"] / 60.0,
+        "availability_percent": metrics["availability_percent"],
+        "mean_revisit_min": metrics["mean_revisit_s"] / 60.0,
+    }
+
+
+def gap_objective(max_gap_requirement_min=None):
+    """
+    Objetivo default (minimizar):
+    - sem requisito: pior gap [min]
+    - com requisito: total de satélites (desempate pelo gap relativo ao
+      requisito, < 0.5); designs que não atendem valem 1000 + excesso de
+      gap [min]
+    """
+    def objective(row):
+        if max_gap_requirement_min is None:
+            return row["worst_gap_min"]
+
+        excess = row["worst_gap_min"] - max_gap_requirement_min
+
+        if excess > 0:
+            return 1000.0 + excess
+
+        return row["total_sats"] + 0.5 * (
+            row["worst_gap_min"] / max_gap_requirement_min
+        )
+
+    return objective
+
+
+def search_walker_designs(
+    evaluate_fn,
+    space=DesignSpace(),
+    objective=None,
+    max_evaluations=60,
+    n_initial=None,
+    seed=0,
+    mutation_sigma=0.15,
+    n_workers=None,
+    progress=None
+):
+    """
+    Busca de designs Walker com número limitado de simulações.
+
+    1. Semeadura por hipercubo latino (n_initial, default ~40 % do
+       orçamento) no espaço de 5 dimensões de DesignSpace.
+    2. Refinamento evolutivo (mu + lambda): pais por torneio entre todos
+       os designs avaliados, crossover uniforme e mutação gaussiana no
+       hipercubo unitário (sigma decrescente). Designs já avaliados não
+       são simulados de novo.
+
+    evaluate_fn(*design) -> linha de métricas (ex.: partial de
+    evaluate_local_design); cada geração é avaliada em lote com
+    run_architecture_sweep (n_workers > 1: em paralelo).
+    objective(linha) -> float a minimizar (default: gap_objective()).
+
+    Retorna dicionário:
+        best       melhor linha (com "score")
+        history    todas as linhas avaliadas, com "score" e "generation"
+    """
+    if objective is None:
+        objective = gap_objective()
+
+    rng = np.random.default_rng(seed)
+    n_dims = len(DESIGN_FIELDS)
+
+    if n_initial is None:
+        n_initial = max(2, int(0.4 * max_evaluations))
+    n_initial = min(n_initial, max_evaluations)
+
+    evaluated = {}
+    history = []
+    unit = {}
+
+    def evaluate_batch(points, generation):
+        designs = []
+        for u in points:
+            design = space.decode(u)
+            if design not in evaluated and design not in designs:
+                designs.append(design)
+                unit[design] = np.asarray(u)
+
+        designs = designs[:max_evaluations - len(evaluated)]
+
+        rows = run_architecture_sweep(
+            evaluate_fn,
+            designs,
+            n_workers=n_workers
+        )
+
+        for design, row in zip(designs, rows):
+            row = {**row, "score": objective(row), "generation": generation}
+            evaluated[design] = row
+            history.append(row)
+
+        if progress is not None:
+            progress(len(evaluated), max_evaluations)
+
+        return len(designs)
+
+    evaluate_batch(latin_hypercube(n_initial, n_dims, rng), 0)
+
+    generation = 0
+    stalled = 0
+    batch_size = max(2, n_initial // 2)
+
+    while len(evaluated) < max_evaluations and stalled < 5:
+        generation += 1
+        sigma = mutation_sigma * 0.85 ** (generation - 1)
+
+        designs = list(evaluated)
+        scores = np.array([evaluated[d]["score"] for d in designs])
+
+        def tournament():
+            i, j = rng.integers(len(designs), size=2)
+            return unit[designs[i if scores[i] <= scores[j] else j]]
+
+        children = []
+        for _ in range(batch_size):
+            a, b = tournament(), tournament()
+            mask = rng.random(n_dims) < 0.5
+            child = np.where(mask, a, b) + rng.normal(0.0, sigma, n_dims)
+            children.append(np.clip(child, 0.0, 1.0 - 1e-12))
+
+        # Sem designs novos por várias gerações: espaço esgotado
+        stalled = 0 if evaluate_batch(children, generation) else stalled + 1
+
+    best = min(history, key=lambda row: row["score"])
+
+    return {
+        "best": best,
+        "history": history,
+    }
+
+
+def run_local_design_search(
+    station_lat_deg,
+    station_lon_deg,
+    duration_h,
+    dt_s,
+    min_elev_deg,
+    space=DesignSpace(),
+    max_gap_requirement_min=None,
+    max_evaluations=60,
+    seed=0,
+    n_workers=None,
+    base_shells=(),
+    progress=None
+):
+    """
+    search_walker_designs com avaliação geométrica local
+    (evaluate_local_design) e objetivo gap_objective.
+    """
+    evaluate = partial(
+        evaluate_local_design,
+        station=GroundStation(
+            lat_deg=station_lat_deg,
+            lon_deg=station_lon_deg
+        ),
+        timeline=TimeArray(0.0, duration_h * 3600.0, dt_s),
+        min_elev_rad=min_elev_deg * DEG2RAD,
+        pattern=space.pattern,
+        base_shells=tuple(base_shells),
+    )
+
+    return search_walker_designs(
+        evaluate,
+        space=space,
+        objective=gap_objective(max_gap_requirement_min),
+        max_evaluations=max_evaluations,
+        seed=seed,
+        n_workers=n_workers,
+        progress=progress
+    )
@@ -0,0 +1,137 @@
+# sat_sim/analysis/dt_convergence.py
+
+import numpy as np
+
+from sat_sim.analysis.lattice_sweep import walker_lattice
+
+
+# Passos candidatos [s] (faixa aceita pelo app)
+DEFAULT_DT_CANDIDATES_S = (
+    10.0, 15.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 180.0, 300.0
+)
+
+DEFAULT_GAP_TOLERANCE_MIN = 1.0
+DEFAULT_AVAILABILITY_TOLERANCE_PCT = 0.5
+
+# Limite de pontos x passos das efemérides das sondas no menor dt
+# (~240 MB por array [n_steps, n_points, 3])
+DEFAULT_MAX_PROBE_POINT_STEPS = 10_000_000
+
+# Sondas do dt automático limitadas a 1/16 dos pontos x passos do sweep
+# no menor dt: com todos os candidatos avaliados (soma de dt_min / dt
+# ~3.2), o estudo custa ~1/5 de um sweep no passo de referência
+DEFAULT_PROBE_FRACTION = 16
+
+
+def probe_architectures(architectures, max_points):
+    """
+    Arquiteturas-sonda do estudo de convergência: todas, se o reticulado
+    Walker que as contém tem no máximo max_points pontos; senão o maior
+    subconjunto igualmente espaçado na ordem por total de satélites
+    (inclui a menor e a maior) dentro do limite.
+    """
+    ordered = sorted(
+        architectures,
+        key=lambda arch: (arch[0] * arch[1], tuple(arch))
+    )
+
+    if not ordered:
+        return []
+
+    def spaced(n_probes):
+        index = np.linspace(0, len(ordered) - 1, n_probes).round().astype(int)
+        return [ordered[i] for i in dict.fromkeys(index)]
+
+    # Busca binária no número de sondas (ao menos uma)
+    low, high = 1, len(ordered)
+
+    while low < high:
+        middle = (low + high + 1) // 2
+
+        if len(walker_lattice(spaced(middle))[0]) <= max_points:
+            low = middle
+        else:
+            high = middle - 1
+
+    return spaced(low)
+
+
+def dt_convergence(
+    evaluate_fn,
+    dt_candidates_s=DEFAULT_DT_CANDIDATES_S,
+    gap_tolerance_min=DEFAULT_GAP_TOLERANCE_MIN,
+    availability_tolerance_pct=DEFAULT_AVAILABILITY_TOLERANCE_PCT
+):
+    """
+    Estudo de convergência do passo de tempo de uma métrica de acesso.
+
+    evaluate_fn(dt_s) -> lista de linhas (mesma ordem para todo dt) com
+    worst_gap_min e availability_percent. O menor candidato é a
+    referência; os demais são avaliados em ordem crescente até o primeiro
+    cujo maior erro absoluto (pior gap ou disponibilidade) sai da
+    tolerância. Parar no primeiro fora da tolerância evita escolher um
+    passo grosso que só coincide com a referência por aliasing.
+
+    O erro medido inclui a amostragem da visibilidade e a integração
+    (nos sweeps o passo RK4 é o próprio dt), então evaluate_fn deve usar
+    o mesmo caminho de cálculo do sweep.
+
+    Retorna dicionário:
+        dt_s             maior passo dentro da tolerância (ele e todos os
+                         menores)
+        reference_dt_s   passo de referência
+        steps            lista de {dt_s, max_gap_error_min,
+                         max_availability_error_pct, converged}
+    """
+    candidates = sorted({float(dt) for dt in dt_candidates_s})
+
+    if not candidates:
+        raise ValueError("Nenhum passo de tempo candidato")
+
+    def metrics(rows):
+        return tuple(
+            np.array([row[name] for row in rows], dtype=float)
+            for name in ("worst_gap_min", "availability_percent")
+        )
+
+    gap_reference, availability_reference = metrics(evaluate_fn(candidates[0]))
+
+    chosen = candidates[0]
+    steps = [{
+        "dt_s": chosen,
+        "max_gap_error_min": 0.0,
+        "max_availability_error_pct": 0.0,
+        "converged": True,
+    }]
+
+    for dt_s in candidates[1:]:
+        gap, availability = metrics(evaluate_fn(dt_s))
+
+        gap_error = float(np.max(np.abs(gap - gap_reference), initial=0.0))
+        availability_error = float(np.max(
+            np.abs(availability - availability_reference),
+            initial=0.0
+        ))
+
+        converged = (
+            gap_error <= gap_tolerance_min
+            and availability_error <= availability_tolerance_pct
+        )
+
+        steps.append({
+            "dt_s": dt_s,
+            "max_gap_error_min": gap_error,
+            "max_availability_error_pct": availability_error,
+            "converged": converged,
+        })
+
+        if not converged:
+            break
+
+        chosen = dt_s
+
+    return {
+        "dt_s": chosen,
+        "reference_dt_s": candidates[0],
+        "steps": steps,
+    }
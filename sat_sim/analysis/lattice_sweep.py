@@ -0,0 +1,166 @@
+# sat_sim/analysis/lattice_sweep.py
+
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+from sat_sim.constants import R_EARTH, DEG2RAD
+from sat_sim.time import TimeArray
+from sat_sim.orbits.elements import ClassicalOrbitalElements, coe_to_rv
+from sat_sim.orbits.propagator import propagate_orbits_batch
+from sat_sim.frames.transforms import eci_to_ecef_batch
+from sat_sim.access.access import visibility_matrix
+from sat_sim.coverage.engine import stations_ecef
+
+
+SWEEP_MODES = ("architecture", "lattice")
+
+
+def lattice_members(n_planes, sats_per_plane):
+    """
+    Pontos (RAAN, fase) da arquitetura Walker, como frações de volta,
+    na mesma ordem de generate_constellation.
+    """
+    return [
+        (Fraction(p, n_planes), Fraction(s, sats_per_plane))
+        for p in range(n_planes)
+        for s in range(sats_per_plane)
+    ]
+
+
+def walker_lattice(architectures):
+    """
+    Reticulado (RAAN, fase) que contém todas as arquiteturas.
+
+    Arquiteturas diferentes compartilham pontos (ex.: 2x2 ⊂ 4x4), então
+    cada ponto é propagado uma única vez. Retorna (points, members):
+    points é uma tupla ordenada de pares de Fraction e members[i] são os
+    índices em points dos satélites de architectures[i].
+    """
+    architectures = list(architectures)
+
+    points = sorted({
+        point
+        for arch in architectures
+        for point in lattice_members(*arch)
+    })
+    index = {point: i for i, point in enumerate(points)}
+
+    members = [
+        np.array([index[point] for point in lattice_members(*arch)])
+        for arch in architectures
+    ]
+
+    return tuple(points), members
+
+
+def lattice_constellation(points, altitude_km, inclination_deg):
+    """
+    Estados iniciais (r0, v0) dos pontos do reticulado (órbitas
+    circulares, como generate_constellation com raan0 = 0).
+    """
+    return [
+        coe_to_rv(ClassicalOrbitalElements(
+            a=R_EARTH + altitude_km * 1000.0,
+            e=0.0,
+            i=inclination_deg * DEG2RAD,
+            raan=2 * np.pi * float(raan),
+            argp=0.0,
+            nu=2 * np.pi * float(phase)
+        ))
+        for raan, phase in points
+    ]
+
+
+def _lattice_states(
+    points,
+    altitude_km,
+    inclination_deg,
+    duration_h,
+    dt_s,
+    with_velocity=True
+):
+    """
+    Efemérides ECEF dos pontos do reticulado, sem cache (J2, RK4
+    vetorizado com passo dt_s, a mesma integração de propagate_orbit).
+    """
+    timeline = TimeArray(0.0, duration_h * 3600.0, dt_s)
+
+    r0, v0 = zip(*lattice_constellation(points, altitude_km, inclination_deg))
+
+    rs, vs = propagate_orbits_batch(
+        np.array(r0),
+        np.array(v0),
+        timeline,
+        use_j2=True
+    )
+
+    r_ecef = eci_to_ecef_batch(rs, timeline.times)
+
+    if not with_velocity:
+        return r_ecef
+
+    return r_ecef, eci_to_ecef_batch(vs, timeline.times)
+
+
+@lru_cache(maxsize=4)
+def lattice_ephemeris(points, altitude_km, inclination_deg, duration_h, dt_s):
+    """
+    Efemérides ECEF (r, v) [n_steps, n_points, 3] dos pontos do
+    reticulado, propagadas uma vez (J2) e mantidas em cache entre sweeps.
+    """
+    r_ecef, v_ecef = _lattice_states(
+        points,
+        altitude_km,
+        inclination_deg,
+        duration_h,
+        dt_s
+    )
+
+    r_ecef.setflags(write=False)
+    v_ecef.setflags(write=False)
+
+    return r_ecef, v_ecef
+
+
+@lru_cache(maxsize=16)
+def lattice_visibility(
+    points,
+    station_lat_deg,
+    station_lon_deg,
+    altitude_km,
+    inclination_deg,
+    duration_h,
+    dt_s,
+    min_elev_deg
+):
+    """
+    Máscara de visibilidade geométrica [n_steps, n_points] da estação para
+    cada ponto do reticulado (em cache). A máscara de uma arquitetura é o
+    OR das colunas de seus membros. Apenas a máscara fica em cache (as
+    efemérides não são mantidas em memória).
+    """
+    ephemeris = _lattice_states(
+        points,
+        altitude_km,
+        inclination_deg,
+        duration_h,
+        dt_s,
+        with_velocity=False
+    )
+
+    r_gs, zenith = stations_ecef(station_lat_deg, station_lon_deg)
+
+    n_steps, n_points, _ = ephemeris.shape
+
+    visible = visibility_matrix(
+        ephemeris.reshape(-1, 3),
+        r_gs,
+        zenith,
+        min_elev_deg * DEG2RAD
+    ).reshape(n_steps, n_points)
+
+    visible.setflags(write=False)
+
+    return visible
@@ -2,57 +2,239 @@
 
 import numpy as np
 
-from sat_sim.frames.transforms import eci_to_ecef
 from sat_sim.access.intervals import (
     compute_access_intervals,
     max_gap,
     revisit_times
 )
-from sat_sim.access.vdes_access import is_vdes_sat_uplink_available
+from sat_sim.access.vdes_access import (
+    vdes_sat_link_budgets,
+    vdes_sat_uplink_budget,
+    vdes_sat_uplink_closed
+)
+from sat_sim.analysis.data_volume import integrate_data_volume
+from sat_sim.access.requirements import RequirementMonitor
+from sat_sim.coverage.engine import (
+    iter_propagated_blocks,
+    propagate_constellation_ecef,
+)
+from sat_sim.rf.vdes.link_budget import (
+    DEFAULT_SAT_DOWNLINK_PARAMS,
+    DEFAULT_SAT_UPLINK_PARAMS
+)
+from sat_sim.rf.vdes.throughput import achievable_rate_bps
 
 
 def compute_local_rf_metrics(
     constellation,
     timeline,
     station,
-    propagate_fn
+    propagate_fn,
+    params=DEFAULT_SAT_UPLINK_PARAMS,
+    rf_mode="table",
+    pattern=None,
+    attitude="nadir",
+    rate_model=None,
+    loss_chain=None,
+    max_gap_s=None,
+    min_availability_percent=None,
+    block_s=3600.0
 ):
     """
     Calcula métricas RF locais:
     - disponibilidade (%)
     - gap máximo (s)
     - revisit médio (s)
+    - volume de dados (com rate_model)
+
+    O link budget é avaliado de uma vez para todos os (instante, satélite).
+    rf_mode: "table" (tabela de fechamento, default como no sweep),
+    "exact" ou "check" (ver vdes_sat_uplink_closed). pattern: diagrama
+    de antena do satélite (AntennaPattern) com atitude "nadir" ou
+    "yaw_steered".
+
+    rate_model ("shannon" ou ModcodTable) converte o C/N das amostras
+    com link fechado em taxa e adiciona data_volume_bits e
+    data_volume_per_day_bits (ver integrate_data_volume).
+    loss_chain (LossChain): perdas de propagação por amostra.
+
+    Com max_gap_s e/ou min_availability_percent a constelação é propagada
+    e avaliada em blocos de block_s segundos e a avaliação termina assim
+    que um requisito deixa de ser atingível (RequirementMonitor). Nesse
+    caso retorna métricas parciais com "rejected" ("max_gap" ou
+    "availability") e "evaluated_s"; arquiteturas que atendem retornam as
+    mesmas métricas da avaliação completa, com "rejected" = None.
     """
+    link_kwargs = {
+        "params": params,
+        "rf_mode": rf_mode,
+        "pattern": pattern,
+        "attitude": attitude,
+        "rate_model": rate_model,
+        "loss_chain": loss_chain,
+    }
+
+    monitor = RequirementMonitor(
+        len(timeline.times),
+        timeline.dt,
+        max_gap_s=max_gap_s,
+        min_availability_percent=min_availability_percent
+    )
 
-    # Propagar todos satélites
-    propagated = []
-    for r0, v0 in constellation:
-        rs, _ = propagate_fn(r0, v0, timeline)
-        propagated.append(rs)
+    if monitor.active:
+        return _monitored_rf_metrics(
+            constellation,
+            timeline,
+            station,
+            propagate_fn,
+            monitor,
+            block_s,
+            link_kwargs
+        )
 
-    closed_times = []
+    # Propagar todos satélites -> [n_steps, n_sats, 3] ECEF
+    ephemeris, velocity = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn,
+        with_velocity=True
+    )
 
-    for k, t in enumerate(timeline.times):
+    closed, rate = uplink_link_samples(
+        ephemeris,
+        velocity,
+        timeline,
+        station,
+        **link_kwargs
+    )
 
-        closed_any = False
+    return closed_link_metrics(closed, timeline, rate)
 
-        for rs in propagated:
 
-            r_eci = rs[k]
-            r_ecef = eci_to_ecef(r_eci, t)
+def _monitored_rf_metrics(
+    constellation,
+    timeline,
+    station,
+    propagate_fn,
+    monitor,
+    block_s,
+    link_kwargs
+):
+    closed_blocks = []
+    rate_blocks = []
 
-            res = is_vdes_sat_uplink_available(
-                r_sat_eci=r_eci,
-                r_sat_ecef=r_ecef,
-                station=station
-            )
+    for start, stop, ephemeris, velocity in iter_propagated_blocks(
+        constellation,
+        timeline,
+        propagate_fn,
+        block_steps=round(block_s / timeline.dt)
+    ):
+        closed, rate = uplink_link_samples(
+            ephemeris,
+            velocity,
+            timeline.window(start, stop),
+            station,
+            **link_kwargs
+        )
 
-            if res.get("is_closed", False):
-                closed_any = True
-                break
+        if monitor.update(closed.any(axis=1)):
+            return monitor.rejected_metrics()
 
-        if closed_any:
-            closed_times.append(t)
+        closed_blocks.append(closed)
+        rate_blocks.append(rate)
+
+    rate = (
+        None if link_kwargs["rate_model"] is None
+        else np.concatenate(rate_blocks)
+    )
+
+    metrics = closed_link_metrics(
+        np.concatenate(closed_blocks),
+        timeline,
+        rate
+    )
+    metrics["rejected"] = None
+
+    return metrics
+
+
+def uplink_link_samples(
+    ephemeris,
+    velocity,
+    timeline,
+    station,
+    params=DEFAULT_SAT_UPLINK_PARAMS,
+    rf_mode="table",
+    pattern=None,
+    attitude="nadir",
+    rate_model=None,
+    loss_chain=None
+):
+    """
+    Máscara de link fechado e taxa alcançável [n_steps, n_sats] (taxa
+    None sem rate_model) para efemérides já propagadas. Argumentos como
+    em compute_local_rf_metrics.
+
+    Com rate_model, o C/N vem do próprio link budget no modo "exact" e,
+    nos demais, é calculado apenas para as amostras com link fechado.
+    """
+    link_kwargs = dict(
+        pattern=pattern,
+        attitude=attitude,
+        loss_chain=loss_chain
+    )
+
+    if rate_model is not None and rf_mode == "exact":
+        budget = vdes_sat_uplink_budget(
+            ephemeris,
+            station,
+            params,
+            v_sat_ecef=velocity,
+            times_s=timeline.times,
+            **link_kwargs
+        )
+        closed = budget["is_closed"]
+        cn_db = budget["cn_db"][closed]
+
+    else:
+        closed = vdes_sat_uplink_closed(
+            ephemeris,
+            station,
+            params=params,
+            mode=rf_mode,
+            v_sat_ecef=velocity,
+            times_s=timeline.times,
+            **link_kwargs
+        )
+
+        if rate_model is None:
+            return closed, None
+
+        steps, sats = np.nonzero(closed)
+
+        cn_db = vdes_sat_uplink_budget(
+            ephemeris[steps, sats],
+            station,
+            params,
+            v_sat_ecef=None if velocity is None else velocity[steps, sats],
+            times_s=timeline.times[steps],
+            **link_kwargs
+        )["cn_db"]
+
+    rate = np.zeros(closed.shape)
+    rate[closed] = achievable_rate_bps(cn_db, params.bandwidth_hz, rate_model)
+
+    return closed, rate
+
+
+def closed_link_metrics(closed, timeline, rate_bps=None):
+    """
+    Métricas locais a partir da máscara de link fechado [n_steps, n_sats]
+    (e, opcionalmente, da taxa [n_steps, n_sats] em bit/s). Permite
+    avaliar arquiteturas a partir de máscaras por satélite já calculadas.
+    """
+    closed_any = closed.any(axis=1)
+    closed_times = list(timeline.times[closed_any])
 
     availability = 100.0 * len(closed_times) / len(timeline.times)
 
@@ -73,8 +255,76 @@ def compute_local_rf_metrics(
         worst_gap = timeline.times[-1]
         mean_revisit = 0.0
 
-    return {
+    metrics = {
         "availability_percent": availability,
         "worst_gap_s": worst_gap,
-        "mean_revisit_s": mean_revisit
+        "mean_revisit_s": mean_revisit,
+        "n_passes": len(intervals)
+    }
+
+    if rate_bps is not None:
+        volume = integrate_data_volume(rate_bps, timeline)
+        duration_days = (timeline.times[-1] + timeline.dt) / 86400.0
+
+        metrics["data_volume_bits"] = volume["total_volume_bits"]
+        metrics["data_volume_per_day_bits"] = (
+            volume["total_volume_bits"] / duration_days
+        )
+
+    return metrics
+
+
+LINK_DIRECTIONS = ("uplink", "downlink", "joint")
+
+
+def compute_local_rf_link_metrics(
+    constellation,
+    timeline,
+    station,
+    propagate_fn,
+    uplink_params=DEFAULT_SAT_UPLINK_PARAMS,
+    downlink_params=DEFAULT_SAT_DOWNLINK_PARAMS,
+    uplink_pattern=None,
+    downlink_pattern=None,
+    attitude="nadir",
+    loss_chain=None
+):
+    """
+    Disponibilidade combinada uplink/downlink em uma única propagação e
+    geometria (vdes_sat_link_budgets).
+
+    "joint" = algum satélite fecha os dois sentidos no mesmo instante.
+    Retorna {direção: {availability_percent, worst_gap_s,
+    mean_revisit_s, n_passes}} para uplink, downlink e joint, com as
+    convenções de closed_link_metrics.
+    """
+    ephemeris, velocity = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn,
+        with_velocity=True
+    )
+
+    budgets = vdes_sat_link_budgets(
+        ephemeris,
+        station,
+        uplink_params=uplink_params,
+        downlink_params=downlink_params,
+        uplink_pattern=uplink_pattern,
+        downlink_pattern=downlink_pattern,
+        v_sat_ecef=velocity,
+        attitude=attitude,
+        loss_chain=loss_chain,
+        times_s=timeline.times
+    )
+
+    up = budgets["uplink"]["is_closed"]
+    down = budgets["downlink"]["is_closed"]
+
+    # Uma máscara [n_steps, n_sats] por direção
+    closed = {"uplink": up, "downlink": down, "joint": up & down}
+
+    return {
+        direction: closed_link_metrics(closed[direction], timeline)
+        for direction in LINK_DIRECTIONS
     }
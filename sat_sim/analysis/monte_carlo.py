@@ -0,0 +1,245 @@
+# sat_sim/analysis/monte_carlo.py
+
+import numpy as np
+
+from sat_sim.constants import R_EARTH, DEG2RAD, OMEGA_EARTH
+from sat_sim.time import TimeArray
+from sat_sim.orbits.constellation import generate_constellation
+from sat_sim.orbits.elements import coe_to_rv
+from sat_sim.orbits.propagator import propagate_orbits_batch
+from sat_sim.coverage.engine import stations_ecef
+from sat_sim.coverage.gap_stats import GapStatistics
+
+
+SUMMARY_PERCENTILES = (5, 50, 95)
+
+
+def sample_uncertainty(
+    n_samples,
+    n_planes,
+    rng,
+    raan0_range_deg=(0.0, 360.0),
+    phase_range_deg=(0.0, 360.0),
+    epoch_range_h=(0.0, 24.0),
+    per_plane_phase=True
+):
+    """
+    Amostras uniformes de RAAN0 [deg], deslocamento de fase [deg] (por
+    plano, ou um único valor repetido em todos os planos) e época [h].
+
+    Retorna dicionário com raan0_deg [N], phase_offset_deg [N, n_planes]
+    e epoch_h [N].
+    """
+    def uniform(bounds, size):
+        return rng.uniform(bounds[0], bounds[1], size)
+
+    raan0 = uniform(raan0_range_deg, n_samples)
+
+    if per_plane_phase:
+        phase = uniform(phase_range_deg, (n_samples, n_planes))
+    else:
+        phase = np.repeat(
+            uniform(phase_range_deg, (n_samples, 1)),
+            n_planes,
+            axis=1
+        )
+
+    return {
+        "raan0_deg": raan0,
+        "phase_offset_deg": phase,
+        "epoch_h": uniform(epoch_range_h, n_samples),
+    }
+
+
+def _sample_states(
+    altitude_km,
+    inclination_deg,
+    n_planes,
+    sats_per_plane,
+    raan0_deg,
+    phase_offset_deg,
+    phasing,
+    pattern
+):
+    """
+    Estados iniciais [N * n_sats, 3] de todas as amostras (amostra
+    externa, satélite interno).
+    """
+    r0 = []
+    v0 = []
+
+    for raan0, offsets in zip(raan0_deg, phase_offset_deg):
+        constellation = generate_constellation(
+            altitude=R_EARTH + altitude_km * 1000.0,
+            inclination=inclination_deg * DEG2RAD,
+            n_planes=n_planes,
+            sats_per_plane=sats_per_plane,
+            raan0=raan0 * DEG2RAD,
+            phasing=phasing,
+            pattern=pattern
+        )
+
+        for idx, coe in enumerate(constellation):
+            coe.nu += offsets[idx // sats_per_plane] * DEG2RAD
+            r, v = coe_to_rv(coe)
+            r0.append(r)
+            v0.append(v)
+
+    return np.array(r0), np.array(v0)
+
+
+def _batch_coverage(rs, timeline, epoch_s, r_gs, zenith, sin_min, n_sats):
+    """
+    Máscara de cobertura [n_steps, N] de um lote de amostras.
+
+    A época entra apenas na rotação ECI -> ECEF: ângulo
+    OMEGA_EARTH * (t + epoch).
+    """
+    n_steps = len(timeline.times)
+    n_samples = len(epoch_s)
+
+    rs = rs.reshape(n_steps, n_samples, n_sats, 3)
+
+    theta = OMEGA_EARTH * (timeline.times[:, None] + epoch_s[None, :])
+    c = np.cos(theta)[..., None]
+    s = np.sin(theta)[..., None]
+
+    x = c * rs[..., 0] + s * rs[..., 1] - r_gs[0]
+    y = -s * rs[..., 0] + c * rs[..., 1] - r_gs[1]
+    z = rs[..., 2] - r_gs[2]
+
+    rho_norm = np.sqrt(x * x + y * y + z * z)
+    up = x * zenith[0] + y * zenith[1] + z * zenith[2]
+
+    return np.any(up >= sin_min * rho_norm, axis=-1)
+
+
+def summarize_samples(values, percentiles=SUMMARY_PERCENTILES):
+    """
+    Média, desvio padrão, mínimo, máximo e percentis de uma amostra.
+    """
+    values = np.asarray(values, dtype=float)
+
+    summary = {
+        "mean": float(np.mean(values)),
+        "std": float(np.std(values)),
+        "min": float(np.min(values)),
+        "max": float(np.max(values)),
+    }
+
+    for q in percentiles:
+        summary[f"p{q}"] = float(np.percentile(values, q))
+
+    return summary
+
+
+def run_local_monte_carlo(
+    station_lat_deg,
+    station_lon_deg,
+    altitude_km,
+    inclination_deg,
+    n_planes,
+    sats_per_plane,
+    duration_h,
+    dt_s,
+    min_elev_deg,
+    n_samples=100,
+    seed=0,
+    raan0_range_deg=(0.0, 360.0),
+    phase_range_deg=(0.0, 360.0),
+    epoch_range_h=(0.0, 24.0),
+    per_plane_phase=True,
+    phasing=0,
+    pattern="delta",
+    batch_size=64
+):
+    """
+    Monte Carlo de robustez da cobertura local de uma arquitetura Walker
+    sob incerteza de RAAN0, fase dos planos e época.
+
+    Todas as amostras de um lote (batch_size) são propagadas juntas
+    (propagate_orbits_batch, J2) e a visibilidade é avaliada de uma vez
+    para [n_steps, amostras, satélites]; gaps e revisits por amostra vêm
+    de GapStatistics (uma "célula" por amostra). O custo é próximo ao de
+    uma única propagação em lote, não ao de N execuções seriais.
+
+    A época desloca a rotação da Terra (ECI -> ECEF com t + época); para
+    a geometria local ela equivale a um deslocamento de RAAN0, mas é
+    amostrada à parte para rastreabilidade.
+
+    Retorna dicionário:
+        samples   raan0_deg, phase_offset_deg, epoch_h
+        metrics   arrays [N]: worst_gap_min, availability_percent,
+                  mean_revisit_min
+        summary   summarize_samples de cada métrica
+    """
+    rng = np.random.default_rng(seed)
+
+    samples = sample_uncertainty(
+        n_samples,
+        n_planes,
+        rng,
+        raan0_range_deg=raan0_range_deg,
+        phase_range_deg=phase_range_deg,
+        epoch_range_h=epoch_range_h,
+        per_plane_phase=per_plane_phase
+    )
+
+    timeline = TimeArray(0.0, duration_h * 3600.0, dt_s)
+    n_sats = n_planes * sats_per_plane
+
+    r_gs, zenith = stations_ecef(station_lat_deg, station_lon_deg)
+    sin_min = np.sin(min_elev_deg * DEG2RAD)
+
+    parts = []
+
+    for start in range(0, n_samples, batch_size):
+        batch = slice(start, min(start + batch_size, n_samples))
+
+        r0, v0 = _sample_states(
+            altitude_km,
+            inclination_deg,
+            n_planes,
+            sats_per_plane,
+            samples["raan0_deg"][batch],
+            samples["phase_offset_deg"][batch],
+            phasing,
+            pattern
+        )
+
+        rs, _ = propagate_orbits_batch(r0, v0, timeline, use_j2=True)
+
+        covered = _batch_coverage(
+            rs,
+            timeline,
+            samples["epoch_h"][batch] * 3600.0,
+            r_gs[0],
+            zenith[0],
+            sin_min,
+            n_sats
+        )
+
+        stats = GapStatistics(covered.shape[1], timeline.dt)
+        for visible in covered:
+            stats.update(visible)
+        stats.finalize()
+
+        parts.append(stats)
+
+    stats = GapStatistics.concatenate(parts)
+
+    metrics = {
+        "worst_gap_min": stats.max["gap"] / 60.0,
+        "availability_percent": 100.0 * stats.coverage_fraction(),
+        "mean_revisit_min": stats.mean("revisit") / 60.0,
+    }
+
+    return {
+        "samples": samples,
+        "metrics": metrics,
+        "summary": {
+            name: summarize_samples(values[np.isfinite(values)])
+            for name, values in metrics.items()
+            if np.isfinite(values).any()
+        },
+    }
@@ -0,0 +1,182 @@
+# sat_sim/analysis/pareto.py
+
+import numpy as np
+
+from sat_sim.analysis.sweep_executor import SweepCancelled, sweep_architectures
+
+
+# Objetivos: chave da linha de resultado -> sentido ("min" ou "max")
+PARETO_OBJECTIVES = {
+    "total_sats": "min",
+    "worst_gap_min": "min",
+    "availability_percent": "max",
+}
+
+
+def _objective_matrix(rows, objectives):
+    """
+    Matriz [n_rows, n_objectives] com todos os objetivos em sentido de
+    minimização.
+    """
+    return np.array([
+        [
+            row[key] if sense == "min" else -row[key]
+            for key, sense in objectives.items()
+        ]
+        for row in rows
+    ], dtype=float).reshape(len(rows), len(objectives))
+
+
+def pareto_front(rows, objectives=PARETO_OBJECTIVES):
+    """
+    Linhas não dominadas (ordem original preservada).
+
+    a domina b se a é melhor ou igual em todos os objetivos e
+    estritamente melhor em ao menos um. Empates exatos são mantidos.
+    """
+    if not rows:
+        return []
+
+    values = _objective_matrix(rows, objectives)
+
+    better_eq = np.all(values[:, None, :] <= values[None, :, :], axis=-1)
+    strictly = np.any(values[:, None, :] < values[None, :, :], axis=-1)
+
+    dominated = np.any(better_eq & strictly, axis=0)
+
+    return [row for row, d in zip(rows, dominated) if not d]
+
+
+def is_sub_architecture(a, b):
+    """
+    True se os satélites da arquitetura Walker a = (n_planes,
+    sats_per_plane) são um subconjunto dos de b (mesmo reticulado RAAN/
+    fase, raan0 = 0): os planos e as fases de a são múltiplos dos de b.
+    """
+    return b[0] % a[0] == 0 and b[1] % a[1] == 0
+
+
+def pareto_architecture_search(
+    evaluate_fn,
+    n_max,
+    progress=None,
+    cancel=None,
+    store=None
+):
+    """
+    Fronteira de Pareto (total de satélites, pior gap, disponibilidade)
+    sobre as arquiteturas de sweep_architectures(n_max), sem avaliar as
+    que são comprovadamente dominadas.
+
+    Monotonicidade: se a ⊆ b (is_sub_architecture), a cobertura de b
+    contém a de a, então gap(a) >= gap(b) e disponibilidade(a) <=
+    disponibilidade(b). Cada superconjunto avaliado limita o melhor
+    desempenho possível de a; se uma arquitetura já avaliada, com no
+    máximo o mesmo número de satélites, é ao menos tão boa quanto esse
+    limite (e estritamente melhor em algo), a é dominada e não é avaliada.
+
+    Ordem: primeiro as arquiteturas maximais (sem superconjunto até
+    n_max), que fornecem os limites; depois as demais, ambas por número
+    de satélites crescente. Sem superconjunto avaliado o limite é o
+    trivial (gap 0, 100 %): acima da saturação da cobertura nada é
+    avaliado.
+
+    evaluate_fn(n_planes, sats_per_plane) -> linha com total_sats,
+    worst_gap_min e availability_percent (ex.: linha de
+    run_sweep_local_geom_analysis). O revisit médio não é monótono nessa
+    ordem: é apenas reportado nas linhas da fronteira.
+
+    store (ResultStore): arquiteturas já gravadas vêm do store e as
+    avaliadas são gravadas (ver run_architecture_sweep).
+
+    Retorna dicionário:
+        front       linhas não dominadas, por total de satélites
+        evaluated   número de arquiteturas avaliadas
+        skipped     número de arquiteturas descartadas sem avaliação
+    """
+    architectures = sweep_architectures(n_max)
+    total = len(architectures)
+
+    # Todo superconjunto tem ao menos o dobro de satélites
+    maximal = sorted(
+        (a for a in architectures if 2 * a[0] * a[1] > n_max),
+        key=lambda a: a[0] * a[1]
+    )
+    others = sorted(
+        (a for a in architectures if 2 * a[0] * a[1] <= n_max),
+        key=lambda a: a[0] * a[1]
+    )
+
+    results = {}
+    skipped = 0
+
+    def bound(arch):
+        # Melhor desempenho possível de arch: limites dos superconjuntos
+        supersets = [
+            row for b, row in results.items()
+            if b != arch and is_sub_architecture(arch, b)
+        ]
+
+        if not supersets:
+            return None
+
+        return (
+            max(row["worst_gap_min"] for row in supersets),
+            min(row["availability_percent"] for row in supersets),
+        )
+
+    def dominated(arch, limit):
+        n_sats = arch[0] * arch[1]
+        gap_limit, availability_limit = limit
+
+        for b, row in results.items():
+            if row["total_sats"] > n_sats:
+                continue
+
+            if (
+                row["worst_gap_min"] > gap_limit
+                or row["availability_percent"] < availability_limit
+            ):
+                continue
+
+            if (
+                row["total_sats"] < n_sats
+                or row["worst_gap_min"] < gap_limit
+                or row["availability_percent"] > availability_limit
+            ):
+                return True
+
+        return False
+
+    for arch in maximal + others:
+        if cancel is not None and cancel():
+            raise SweepCancelled(
+                f"Busca cancelada ({len(results) + skipped}/{total})"
+            )
+
+        # Sem superconjunto avaliado: limite trivial (gap 0, 100 %)
+        limit = bound(arch) or (0.0, 100.0)
+
+        if dominated(arch, limit):
+            skipped += 1
+        elif store is not None and arch in store:
+            results[arch] = store.get(arch)
+        else:
+            results[arch] = evaluate_fn(*arch)
+
+            if store is not None:
+                store.append(arch, results[arch])
+
+        if progress is not None:
+            progress(len(results) + skipped, total)
+
+    front = pareto_front(
+        [results[a] for a in architectures if a in results]
+    )
+    front.sort(key=lambda row: row["total_sats"])
+
+    return {
+        "front": front,
+        "evaluated": len(results),
+        "skipped": skipped,
+    }
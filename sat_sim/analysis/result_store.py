@@ -0,0 +1,355 @@
+# sat_sim/analysis/result_store.py
+
+import dataclasses
+import glob
+import hashlib
+import json
+import math
+import os
+
+import numpy as np
+
+
+# Coluna com a chave da arquitetura (JSON da tupla) em cada fragmento
+ARCHITECTURE_COLUMN = "_architecture"
+
+DEFAULT_STORE_DIR = os.path.join("results", "sweep_store")
+
+# Versão do formato das linhas gravadas; faz parte do cenário, então
+# alterar colunas/semântica das métricas invalida stores antigos
+STORE_SCHEMA_VERSION = 1
+
+
+def _plain(value):
+    # Escalares numpy -> Python (JSON / Arrow)
+    return value.item() if hasattr(value, "item") else value
+
+
+def architecture_key(arch):
+    """
+    Chave textual de uma arquitetura (n_planes, sats_per_plane, ...).
+    """
+    return json.dumps([_plain(v) for v in arch])
+
+
+def _scenario_value(value):
+    """
+    Serialização JSON de parâmetros do cenário: arrays pelo hash do
+    conteúdo (o repr trunca arrays grandes), dataclasses campo a campo
+    (ex.: AntennaPattern, LossChain e seus termos); demais objetos pelo
+    repr.
+    """
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+
+        return {
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+            "sha1": hashlib.sha1(value.tobytes()).hexdigest(),
+        }
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "type": type(value).__name__,
+            **{
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+            },
+        }
+
+    return repr(value)
+
+
+def scenario_hash(scenario):
+    """
+    Hash curto (16 hex) de um dicionário de parâmetros do cenário (ver
+    _scenario_value para objetos não serializáveis em JSON).
+    """
+    text = json.dumps(scenario, sort_keys=True, default=_scenario_value)
+
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def _write_json(path, data):
+    # Escrita atômica (vários processos podem abrir o mesmo cenário)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True, default=_scenario_value)
+
+    os.replace(tmp_path, path)
+
+
+def _fragments(path):
+    return sorted(glob.glob(os.path.join(path, "part-*.parquet")))
+
+
+def _read_fragment(path):
+    """
+    Lista de (chave, linha) de um fragmento. Colunas ausentes na linha
+    original (fragmentos com várias linhas) voltam como null e são
+    descartadas.
+    """
+    import pyarrow.parquet as pq
+
+    rows = []
+
+    for row in pq.read_table(path).to_pylist():
+        key = row.pop(ARCHITECTURE_COLUMN)
+        rows.append((
+            key,
+            {name: value for name, value in row.items() if value is not None}
+        ))
+
+    return rows
+
+
+def _write_fragment(path, rows):
+    """
+    Grava [(chave, linha)] em um fragmento Parquet (escrita atômica).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = [{ARCHITECTURE_COLUMN: key, **row} for key, row in rows]
+
+    # Linhas podem ter colunas diferentes (ex.: arquiteturas rejeitadas)
+    columns = list(dict.fromkeys(name for row in rows for name in row))
+
+    # Prefixo "_": ignorado por pandas.read_parquet(diretório)
+    tmp_path = os.path.join(
+        os.path.dirname(path),
+        "_" + os.path.basename(path) + ".tmp"
+    )
+
+    pq.write_table(
+        pa.table({
+            name: [row.get(name) for row in rows] for name in columns
+        }),
+        tmp_path
+    )
+    os.replace(tmp_path, path)
+
+
+def _shard_tag(shard):
+    return "" if shard is None else f"shard{shard[0]}of{shard[1]}-"
+
+
+class ResultStore:
+    """
+    Armazenamento colunar (Parquet, pyarrow) de resultados de sweep, um
+    diretório por cenário: <root>/<scenario_hash>/ (parâmetros em
+    _scenario.json; o diretório também pode ser lido diretamente com
+    pandas.read_parquet). O cenário inclui STORE_SCHEMA_VERSION.
+
+    Cada arquitetura concluída é gravada em um fragmento próprio
+    (part-NNNNNN.parquet, escrita atômica), então uma interrupção perde no
+    máximo a arquitetura em andamento. Ao reabrir o mesmo cenário as
+    arquiteturas já gravadas são carregadas e não precisam ser avaliadas
+    de novo; como n_max não faz parte do cenário, um sweep maior reutiliza
+    o anterior.
+
+    shard = (i, N): fragmentos nomeados part-shard<i>of<N>-NNNNNN.parquet,
+    para que vários processos (máquinas com sistema de arquivos
+    compartilhado) gravem no mesmo cenário; ver merge_shards.
+    """
+
+    def __init__(self, root, scenario, shard=None):
+        self.scenario = {
+            **scenario,
+            "schema_version": STORE_SCHEMA_VERSION,
+        }
+        self.key = scenario_hash(self.scenario)
+        self.path = os.path.join(root, self.key)
+        self.shard = shard
+
+        os.makedirs(self.path, exist_ok=True)
+
+        meta_path = os.path.join(self.path, "_scenario.json")
+        if not os.path.exists(meta_path):
+            _write_json(meta_path, self.scenario)
+
+        tag = _shard_tag(shard)
+
+        self._rows = {}
+        self._next_part = 0
+
+        for path in _fragments(self.path):
+            for key, row in _read_fragment(path):
+                self._rows[key] = row
+
+            index = os.path.basename(path)[len("part-"):-len(".parquet")]
+            if index.startswith(tag) and index[len(tag):].isdigit():
+                self._next_part = max(
+                    self._next_part,
+                    int(index[len(tag):]) + 1
+                )
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, arch):
+        return architecture_key(arch) in self._rows
+
+    def get(self, arch):
+        return dict(self._rows[architecture_key(arch)])
+
+    def append(self, arch, row):
+        """
+        Grava a linha de resultado de uma arquitetura (novo fragmento).
+        """
+        key = architecture_key(arch)
+        row = {name: _plain(value) for name, value in row.items()}
+
+        _write_fragment(
+            os.path.join(
+                self.path,
+                f"part-{_shard_tag(self.shard)}{self._next_part:06d}.parquet"
+            ),
+            [(key, row)]
+        )
+
+        self._next_part += 1
+        self._rows[key] = row
+
+    def write_manifest(self, architectures):
+        """
+        Registra as arquiteturas atribuídas a este shard
+        (_shard-<i>-of-<N>.json), usadas por merge_shards para validar.
+        """
+        index, count = self.shard
+
+        _write_json(
+            os.path.join(self.path, f"_shard-{index}-of-{count}.json"),
+            {
+                "shard": index,
+                "n_shards": count,
+                "architectures": [
+                    architecture_key(arch) for arch in architectures
+                ],
+            }
+        )
+
+    def rows(self):
+        """
+        Linhas gravadas, na ordem de conclusão.
+        """
+        return [dict(row) for row in self._rows.values()]
+
+    def dataframe(self):
+        """
+        pandas.DataFrame com as linhas gravadas (mesmas colunas do
+        DataFrame montado a partir da lista de resultados do sweep).
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.rows())
+
+    def compact(self):
+        """
+        Junta todos os fragmentos em um único part-000000.parquet.
+        Não deve ser chamado com outros processos gravando no cenário.
+        """
+        if len(_fragments(self.path)) > 1:
+            _compact(self.path, list(self._rows.items()))
+            self._next_part = max(self._next_part, 1)
+
+
+def _compact(path, rows):
+    merged = os.path.join(path, "part-merged.parquet")
+    _write_fragment(merged, rows)
+
+    for fragment in _fragments(path):
+        if fragment != merged:
+            os.remove(fragment)
+
+    os.replace(merged, os.path.join(path, "part-000000.parquet"))
+
+
+def _same_row(a, b):
+    if a.keys() != b.keys():
+        return False
+
+    def same(x, y):
+        if isinstance(x, float) and isinstance(y, float):
+            # Tolerância de arredondamento (ex.: modos de sweep diferentes)
+            return math.isclose(x, y, rel_tol=1e-9) or (
+                math.isnan(x) and math.isnan(y)
+            )
+
+        return x == y
+
+    return all(same(a[name], b[name]) for name in a)
+
+
+def merge_shards(path):
+    """
+    Junta os fragmentos dos shards de um cenário (diretório
+    <root>/<scenario_hash>) em um único part-000000.parquet.
+
+    Validação (ValueError):
+    - manifestos de todos os shards 1..N presentes, com o mesmo N
+    - toda arquitetura atribuída a um shard tem resultado
+    - resultados duplicados da mesma arquitetura são idênticos
+    Duplicatas idênticas (ex.: shard reexecutado) são removidas.
+
+    Retorna a lista de linhas, na ordem das atribuições dos shards
+    (arquiteturas fora dos manifestos, de sweeps anteriores do mesmo
+    cenário, vêm no fim).
+    """
+    manifests = []
+
+    for manifest_path in sorted(
+        glob.glob(os.path.join(path, "_shard-*-of-*.json"))
+    ):
+        with open(manifest_path) as f:
+            manifests.append(json.load(f))
+
+    if not manifests:
+        raise ValueError(f"Nenhum manifesto de shard em '{path}'")
+
+    counts = {m["n_shards"] for m in manifests}
+    if len(counts) > 1:
+        raise ValueError(
+            f"Shards com números totais diferentes: {sorted(counts)}"
+        )
+
+    n_shards = counts.pop()
+    missing = sorted(
+        set(range(1, n_shards + 1)) - {m["shard"] for m in manifests}
+    )
+    if missing:
+        raise ValueError(f"Shards ausentes (de {n_shards}): {missing}")
+
+    rows = {}
+
+    for fragment in _fragments(path):
+        for key, row in _read_fragment(fragment):
+            if key in rows and not _same_row(rows[key], row):
+                raise ValueError(
+                    f"Resultados conflitantes para a arquitetura {key}"
+                )
+            rows[key] = row
+
+    order = []
+
+    for manifest in sorted(manifests, key=lambda m: m["shard"]):
+        absent = [key for key in manifest["architectures"] if key not in rows]
+
+        if absent:
+            raise ValueError(
+                f"Shard {manifest['shard']}/{n_shards} incompleto: "
+                f"{len(absent)} arquitetura(s) sem resultado "
+                f"(ex.: {absent[0]})"
+            )
+
+        order.extend(manifest["architectures"])
+
+    order = list(dict.fromkeys(order + list(rows)))
+
+    _compact(path, [(key, rows[key]) for key in order])
+
+    return [dict(rows[key]) for key in order]
@@ -0,0 +1,160 @@
+# sat_sim/analysis/rf_param_sweep.py
+
+import numpy as np
+
+from sat_sim.access.geometry import slant_range_elevation
+from sat_sim.access.vdes_access import vdes_sat_uplink_budget
+from sat_sim.coverage.engine import propagate_constellation_ecef
+from sat_sim.coverage.gap_stats import GapStatistics
+from sat_sim.rf.vdes.link_budget import DEFAULT_SAT_UPLINK_PARAMS
+
+
+CUBE_AXES = ("eirp_dbw", "gt_rx_db_per_k", "system_losses_db", "snr_min_db")
+
+
+def best_link_margin(margin_db, elevation_rad):
+    """
+    Melhor margem [dB] entre os satélites em cada instante, a partir de
+    margens e elevações [n_steps, n_sats]. Satélites abaixo do horizonte
+    não contam (-inf).
+    """
+    margin = np.where(elevation_rad > 0.0, margin_db, -np.inf)
+
+    return margin.max(axis=-1)
+
+
+def margin_offsets(params, **axes):
+    """
+    Variação da margem [dB] em relação a params para cada combinação dos
+    eixos (EIRP, G/T, perdas, C/N mínimo). Eixos omitidos usam o valor
+    de params. Retorna (cube [n_eirp, n_gt, n_losses, n_snr], axes).
+    """
+    values = {
+        name: np.atleast_1d(
+            np.asarray(
+                axes.get(name) if axes.get(name) is not None
+                else getattr(params, name),
+                dtype=float
+            )
+        )
+        for name in CUBE_AXES
+    }
+
+    eirp, gt, losses, snr = np.ix_(*(values[name] for name in CUBE_AXES))
+
+    offsets = (
+        (eirp - params.eirp_dbw)
+        + (gt - params.gt_rx_db_per_k)
+        - (losses - params.system_losses_db)
+        - (snr - params.snr_min_db)
+    )
+
+    return offsets, values
+
+
+def link_margin_cubes(
+    best_margin_db,
+    dt,
+    params,
+    **axes
+):
+    """
+    Disponibilidade e gaps para todas as combinações de parâmetros a
+    partir da melhor margem por instante (best_link_margin).
+
+    Frequência, banda e diagrama ficam fixos (os de params): os demais
+    termos apenas deslocam a margem, e o link fecha quando
+    best_margin + offset >= 0. Cada offset distinto é tratado como uma
+    "célula" do GapStatistics, em uma única passada no tempo.
+    """
+    offsets, values = margin_offsets(params, **axes)
+
+    unique, inverse = np.unique(offsets, return_inverse=True)
+    inverse = inverse.reshape(offsets.shape)
+
+    stats = GapStatistics(n_cells=len(unique), dt=dt)
+
+    for margin in best_margin_db:
+        stats.update(margin + unique >= 0.0)
+
+    stats.finalize()
+
+    return {
+        "axes": values,
+        "margin_offset_db": offsets,
+        "availability_percent": 100.0 * stats.coverage_fraction()[inverse],
+        "worst_gap_s": stats.max["gap"][inverse],
+        "mean_revisit_s": stats.mean("revisit")[inverse],
+        "n_passes": stats.count["pass"][inverse],
+    }
+
+
+def compute_rf_parameter_sweep(
+    constellation,
+    timeline,
+    station,
+    propagate_fn,
+    params=DEFAULT_SAT_UPLINK_PARAMS,
+    eirp_dbw=None,
+    gt_rx_db_per_k=None,
+    system_losses_db=None,
+    snr_min_db=None,
+    pattern=None,
+    attitude="nadir",
+    loss_chain=None
+):
+    """
+    Trade RF do uplink a partir de uma única propagação e geometria.
+
+    Cada eixo (EIRP, G/T, perdas, C/N mínimo) aceita escalar ou array;
+    None usa o valor de params. Retorna dicionário com:
+        axes                  valores de cada eixo
+        best_margin_db        [n_steps] melhor margem com params
+        margin_offset_db      cubo [n_eirp, n_gt, n_losses, n_snr]
+        availability_percent  cubo
+        worst_gap_s           cubo
+        mean_revisit_s        cubo (NaN sem revisit)
+        n_passes              cubo
+
+    Os gaps seguem as convenções de GapStatistics (sem acesso, o gap é
+    a duração total).
+    """
+    ephemeris, velocity = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn,
+        with_velocity=True
+    )
+
+    budget = vdes_sat_uplink_budget(
+        ephemeris,
+        station,
+        params,
+        pattern=pattern,
+        v_sat_ecef=velocity,
+        attitude=attitude,
+        loss_chain=loss_chain,
+        times_s=timeline.times
+    )
+
+    r_gs = station.position_ecef()
+    _, elevation = slant_range_elevation(
+        ephemeris,
+        r_gs,
+        r_gs / np.linalg.norm(r_gs)
+    )
+
+    best_margin = best_link_margin(budget["margin_db"], elevation)
+
+    result = link_margin_cubes(
+        best_margin,
+        timeline.dt,
+        params,
+        eirp_dbw=eirp_dbw,
+        gt_rx_db_per_k=gt_rx_db_per_k,
+        system_losses_db=system_losses_db,
+        snr_min_db=snr_min_db
+    )
+    result["best_margin_db"] = best_margin
+
+    return result
@@ -0,0 +1,218 @@
+# sat_sim/analysis/screening.py
+
+import numpy as np
+
+from sat_sim.constants import R_EARTH, DEG2RAD, OMEGA_EARTH, J2
+from sat_sim.orbits.circular import j2_raan_rate, mean_motion
+from sat_sim.orbits.constellation import generate_constellation
+from sat_sim.coverage.engine import stations_ecef
+
+
+SCREENING_STATUS = ("feasible", "infeasible", "uncertain")
+
+# Folga angular [deg] sobre a geometria circular ideal (oscilação do
+# plano osculador por J2, ~0.1 deg)
+DEFAULT_MARGIN_DEG = 0.5
+
+# Margens de primeira ordem em J2, calibradas empiricamente (fator ~1.3
+# sobre o maior desvio observado com propagate_orbit partindo de
+# elementos osculadores); não são limites demonstrados:
+# - raio: a +- _J2_RADIAL * J2 (R/a)^2 a
+# - argumento de latitude: desvio da taxa secular J2 cresce no máximo
+#   _J2_ALONG_TRACK_RATE * n J2 (R/a)^2 [rad/s] (movimentos médios
+#   osculadores diferentes por satélite)
+_J2_RADIAL = 5.0
+_J2_ALONG_TRACK_RATE = 3.5
+
+
+def coverage_half_angle(a, min_elevation_rad):
+    """
+    Semi-ângulo central [rad] do círculo de cobertura de um satélite a
+    raio a [m] com máscara de elevação (Terra esférica).
+    """
+    return (
+        np.arccos(R_EARTH * np.cos(min_elevation_rad) / a)
+        - min_elevation_rad
+    )
+
+
+def street_half_width(half_angle, half_spacing):
+    """
+    Semi-largura [rad] da faixa de cobertura contínua (street of coverage)
+    de um plano cujos satélites adjacentes estão a no máximo
+    2 * half_spacing (igualmente espaçados: pi / S):
+    cos(c) = cos(lambda) / cos(half_spacing). NaN onde os círculos não se
+    sobrepõem (half_spacing >= lambda).
+    """
+    half_spacing = np.asarray(half_spacing, dtype=float)
+
+    with np.errstate(invalid="ignore"):
+        return np.where(
+            half_spacing < half_angle,
+            np.arccos(np.cos(half_angle) / np.cos(half_spacing)),
+            np.nan
+        )
+
+
+def street_coverage_masks(
+    n_planes,
+    sats_per_plane,
+    altitude_km,
+    inclination_deg,
+    station_lat_deg,
+    station_lon_deg,
+    timeline,
+    min_elev_deg,
+    pattern="delta",
+    phasing=0,
+    raan0_deg=0.0,
+    margin_deg=DEFAULT_MARGIN_DEG
+):
+    """
+    Limites analíticos da visibilidade de uma constelação Walker, por
+    passo e estação, sem propagar satélites.
+
+    Cada satélite está no grande círculo do seu plano (RAAN com deriva J2
+    secular, Terra girando), com argumento de latitude dentro de uma
+    janela u_nominal(t) +- e(t) (taxa secular J2; e cresce linearmente
+    com t). Com lambda o semi-ângulo de cobertura:
+    - necessário: a janela de algum satélite tem um ponto a <= lambda da
+      estação;
+    - suficiente: a janela inteira de algum satélite está a <= lambda da
+      estação, ou a estação está dentro da street of coverage de algum
+      plano (semi-largura c com cos(c) = cos(lambda) / cos(pi/S + e):
+      o satélite mais próximo ao longo do plano está a no máximo
+      pi/S + e).
+
+    lambda do necessário usa o raio máximo sob J2 e o do suficiente o
+    mínimo, ambos com folga margin_deg. Retorna (necessary, sufficient),
+    arrays booleanos [n_steps, n_stations] com
+    sufficient <= visível <= necessary enquanto os desvios J2 ficarem
+    dentro das margens empíricas (_J2_RADIAL, _J2_ALONG_TRACK_RATE).
+    """
+    a = R_EARTH + altitude_km * 1000.0
+    inclination = inclination_deg * DEG2RAD
+    min_elevation = min_elev_deg * DEG2RAD
+    margin = margin_deg * DEG2RAD
+    times = timeline.times
+
+    j2_scale = J2 * (R_EARTH / a) ** 2
+    radial = _J2_RADIAL * j2_scale * a
+
+    outer_angle = coverage_half_angle(a + radial, min_elevation) + margin
+    inner_angle = coverage_half_angle(a - radial, min_elevation) - margin
+
+    # Janela ao longo do plano: [n_steps, 1, 1]
+    window = (
+        margin
+        + _J2_ALONG_TRACK_RATE * mean_motion(a) * j2_scale * times
+    )[:, None, None]
+
+    # Taxa secular do argumento de latitude (órbita circular)
+    u_rate = mean_motion(a) * (
+        1.0 + 1.5 * j2_scale * (3.0 - 4.0 * np.sin(inclination) ** 2)
+    )
+
+    constellation = generate_constellation(
+        altitude=a,
+        inclination=inclination,
+        n_planes=n_planes,
+        sats_per_plane=sats_per_plane,
+        raan0=raan0_deg * DEG2RAD,
+        phasing=phasing,
+        pattern=pattern
+    )
+
+    raan0 = np.array([coe.raan for coe in constellation])
+    u0 = np.array([coe.argp + coe.nu for coe in constellation])
+
+    _, zenith = stations_ecef(station_lat_deg, station_lon_deg)
+
+    # Base do plano de cada satélite em ECEF: [n_steps, n_sats, 3]
+    raan = (
+        raan0[None, :]
+        + (j2_raan_rate(a, inclination) - OMEGA_EARTH) * times[:, None]
+    )
+    cos_raan = np.cos(raan)
+    sin_raan = np.sin(raan)
+
+    node = np.stack([cos_raan, sin_raan, np.zeros_like(raan)], axis=-1)
+    in_plane = np.stack([
+        -sin_raan * np.cos(inclination),
+        cos_raan * np.cos(inclination),
+        np.full_like(raan, np.sin(inclination)),
+    ], axis=-1)
+
+    # Estação em coordenadas do plano: [n_steps, n_sats, n_stations]
+    sp = node @ zenith.T
+    sq = in_plane @ zenith.T
+
+    # cos(distância central) = rho * cos(u - phi)
+    rho = np.hypot(sp, sq)
+    offset = np.abs(
+        np.angle(np.exp(1j * (
+            u0[None, :, None] + u_rate * times[:, None, None]
+            - np.arctan2(sq, sp)
+        )))
+    )
+
+    near = rho * np.cos(np.maximum(offset - window, 0.0))
+    far = rho * np.cos(np.minimum(offset + window, np.pi))
+
+    necessary = np.any(near >= np.cos(outer_angle), axis=1)
+
+    # Street of coverage: satélites adjacentes a no máximo 2 (pi/S + e)
+    street = street_half_width(
+        inner_angle,
+        np.pi / sats_per_plane + window[:, 0, 0]
+    )[:, None, None]
+
+    # NaN (sem street) compara como False; rho = cos(distância ao plano)
+    sufficient = (
+        np.any(far >= np.cos(inner_angle), axis=1)
+        | np.any(rho >= np.cos(street), axis=1)
+    )
+
+    return necessary, sufficient
+
+
+def classify_screening(
+    best,
+    worst,
+    max_gap_requirement_min=None,
+    min_availability_requirement_pct=None
+):
+    """
+    Classificação de uma arquitetura a partir das métricas (worst_gap_min,
+    availability_percent) das máscaras necessary (best: melhor caso
+    possível) e sufficient (worst: pior caso possível):
+
+    - "infeasible": nem o melhor caso atende a algum requisito
+    - "feasible": o pior caso atende a todos
+    - "uncertain": precisa ser simulada
+    """
+    gap = max_gap_requirement_min
+    availability = min_availability_requirement_pct
+
+    if gap is None and availability is None:
+        return "uncertain"
+
+    if (
+        (gap is not None and best["worst_gap_min"] > gap)
+        or (
+            availability is not None
+            and best["availability_percent"] < availability
+        )
+    ):
+        return "infeasible"
+
+    if (
+        (gap is None or worst["worst_gap_min"] <= gap)
+        and (
+            availability is None
+            or worst["availability_percent"] >= availability
+        )
+    ):
+        return "feasible"
+
+    return "uncertain"
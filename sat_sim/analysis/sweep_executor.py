@@ -0,0 +1,232 @@
+# sat_sim/analysis/sweep_executor.py
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    wait,
+)
+
+import numpy as np
+
+
+# Intervalo [s] entre verificações de cancelamento enquanto espera workers
+_POLL_INTERVAL_S = 0.2
+
+
+class SweepCancelled(RuntimeError):
+    """
+    Sweep interrompido pelo callback de cancelamento.
+    """
+
+
+def sweep_architectures(n_max):
+    """
+    Pares (n_planes, sats_per_plane) com n_planes * sats_per_plane <= n_max,
+    na ordem histórica dos sweeps (n_planes externo, sats_per_plane interno).
+    """
+    return [
+        (n_planes, sats_per_plane)
+        for n_planes in range(1, n_max + 1)
+        for sats_per_plane in range(1, n_max // n_planes + 1)
+    ]
+
+
+def architecture_chunks(costs, n_workers, chunk_cost=None):
+    """
+    Agrupa arquiteturas em lotes de custo parecido.
+
+    costs: custo relativo de cada arquitetura (ex.: número de satélites).
+    As arquiteturas são ordenadas por custo decrescente (os lotes das
+    maiores são submetidos primeiro, as pequenas ficam para o fim e
+    equilibram a carga) e agrupadas em lotes consecutivos até chunk_cost
+    (default: ~4 lotes por worker). Retorna lista de listas de índices.
+    """
+    costs = np.asarray(costs, dtype=float)
+
+    if chunk_cost is None:
+        chunk_cost = costs.sum() / (4 * max(n_workers, 1))
+
+    chunks = []
+    current = []
+    current_cost = 0.0
+
+    for idx in np.argsort(-costs, kind="stable"):
+        if current and current_cost + costs[idx] > chunk_cost:
+            chunks.append(current)
+            current = []
+            current_cost = 0.0
+
+        current.append(int(idx))
+        current_cost += costs[idx]
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def parse_shard(text):
+    """
+    'i/N' -> (i, N), com 1 <= i <= N (shard i de N).
+    """
+    try:
+        index, count = (int(v) for v in text.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard inválido: '{text}' (esperado i/N)")
+
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard inválido: '{text}' (1 <= i <= N)")
+
+    return index, count
+
+
+def shard_architectures(architectures, shard, n_steps=1):
+    """
+    Arquiteturas atribuídas ao shard (i, N), na ordem original.
+
+    Atribuição determinística e balanceada pelo custo estimado (satélites
+    x passos de tempo): em ordem de custo decrescente (empates pela ordem
+    original), cada arquitetura vai para o shard de menor carga acumulada
+    (empates pelo menor índice). Todos os shards calculam a mesma
+    partição a partir da mesma lista, sem comunicação.
+    """
+    index, count = shard
+    architectures = list(architectures)
+
+    costs = np.array(
+        [arch[0] * arch[1] * n_steps for arch in architectures],
+        dtype=float
+    )
+
+    loads = np.zeros(count)
+    owner = np.empty(len(architectures), dtype=int)
+
+    for idx in np.argsort(-costs, kind="stable"):
+        target = int(np.argmin(loads))
+        owner[idx] = target
+        loads[target] += costs[idx]
+
+    return [
+        arch for arch, k in zip(architectures, owner) if k == index - 1
+    ]
+
+
+def _run_chunk(evaluate_fn, architectures):
+    return [evaluate_fn(*arch) for arch in architectures]
+
+
+def run_architecture_sweep(
+    evaluate_fn,
+    architectures,
+    n_workers=None,
+    progress=None,
+    cancel=None,
+    chunk_cost=None,
+    store=None
+):
+    """
+    Avalia evaluate_fn(*arch) para cada arquitetura (n_planes,
+    sats_per_plane, ...).
+
+    n_workers > 1 distribui lotes de arquiteturas (architecture_chunks,
+    custo ~ número de satélites) em um pool de processos; evaluate_fn deve
+    ser picklable (função de módulo ou functools.partial).
+
+    progress(done, total) é chamado no processo principal a cada
+    arquitetura (serial) ou lote (paralelo) concluído. cancel() -> True
+    interrompe o sweep (lotes pendentes são descartados) e levanta
+    SweepCancelled.
+
+    store (ResultStore): as arquiteturas já gravadas não são avaliadas
+    (a linha vem do store) e cada arquitetura concluída é gravada assim
+    que termina, no processo principal; um sweep interrompido retoma de
+    onde parou.
+
+    Os resultados retornam na ordem de architectures, independente da
+    ordem de conclusão.
+    """
+    architectures = list(architectures)
+    total = len(architectures)
+
+    results = [None] * total
+    todo = []
+
+    for i, arch in enumerate(architectures):
+        if store is not None and arch in store:
+            results[i] = store.get(arch)
+        else:
+            todo.append(i)
+
+    done = total - len(todo)
+
+    def cancelled():
+        return cancel is not None and cancel()
+
+    def finish(i, value):
+        results[i] = value
+
+        if store is not None:
+            store.append(architectures[i], value)
+
+    if n_workers is None or n_workers <= 1 or len(todo) <= 1:
+        for i in todo:
+            if cancelled():
+                raise SweepCancelled(f"Sweep cancelado ({done}/{total})")
+
+            finish(i, evaluate_fn(*architectures[i]))
+            done += 1
+
+            if progress is not None:
+                progress(done, total)
+
+        return results
+
+    # Custo ~ número de satélites (dois primeiros campos da arquitetura)
+    costs = [architectures[i][0] * architectures[i][1] for i in todo]
+    chunks = [
+        [todo[k] for k in chunk]
+        for chunk in architecture_chunks(costs, n_workers, chunk_cost)
+    ]
+
+    interrupted = True
+
+    pool = ProcessPoolExecutor(max_workers=min(n_workers, len(chunks)))
+
+    try:
+        pending = {
+            pool.submit(
+                _run_chunk,
+                evaluate_fn,
+                [architectures[i] for i in chunk]
+            ): chunk
+            for chunk in chunks
+        }
+
+        while pending:
+            if cancelled():
+                raise SweepCancelled(f"Sweep cancelado ({done}/{total})")
+
+            finished, _ = wait(
+                pending,
+                timeout=_POLL_INTERVAL_S,
+                return_when=FIRST_COMPLETED
+            )
+
+            for future in finished:
+                chunk = pending.pop(future)
+
+                for i, value in zip(chunk, future.result()):
+                    finish(i, value)
+
+                done += len(chunk)
+
+                if progress is not None:
+                    progress(done, total)
+
+        interrupted = False
+
+    finally:
+        # Cancelado: retorna sem esperar os lotes em execução
+        pool.shutdown(wait=not interrupted, cancel_futures=True)
+
+    return results
@@ -1,3 +1,5 @@
+from functools import partial
+
 import numpy as np
 
 from sat_sim.constants import R_EARTH, DEG2RAD
@@ -13,6 +15,376 @@ from sat_sim.access.intervals import (
     max_gap,
     revisit_times,
 )
+from sat_sim.analysis.sweep_executor import (
+    run_architecture_sweep,
+    shard_architectures,
+    sweep_architectures,
+)
+from sat_sim.analysis.pareto import pareto_architecture_search
+from sat_sim.analysis.result_store import ResultStore
+from sat_sim.analysis.screening import (
+    classify_screening,
+    street_coverage_masks,
+)
+from sat_sim.analysis.lattice_sweep import (
+    SWEEP_MODES,
+    lattice_visibility,
+    walker_lattice,
+)
+from sat_sim.analysis.dt_convergence import (
+    DEFAULT_AVAILABILITY_TOLERANCE_PCT,
+    DEFAULT_DT_CANDIDATES_S,
+    DEFAULT_GAP_TOLERANCE_MIN,
+    DEFAULT_MAX_PROBE_POINT_STEPS,
+    DEFAULT_PROBE_FRACTION,
+    dt_convergence,
+    probe_architectures,
+)
+
+
+def _evaluate_architecture(
+    n_planes,
+    sats_per_plane,
+    station,
+    timeline,
+    altitude_km,
+    inclination_deg,
+    min_elev_rad
+):
+    """
+    Métricas geométricas de uma arquitetura (executado nos workers).
+    """
+    constellation_coe = generate_constellation(
+        altitude=R_EARTH + altitude_km * 1000.0,
+        inclination=inclination_deg * DEG2RAD,
+        n_planes=n_planes,
+        sats_per_plane=sats_per_plane,
+    )
+
+    constellation = [
+        coe_to_rv(coe) for coe in constellation_coe
+    ]
+
+    # Propagação de todos satélites
+    propagated = []
+    for r0, v0 in constellation:
+        rs, _ = propagate_orbit(
+            r0,
+            v0,
+            timeline,
+            use_j2=True
+        )
+        propagated.append(rs)
+
+    visible_times = []
+
+    # Avaliação geométrica agregada
+    for k, t in enumerate(timeline.times):
+
+        visible_any = False
+
+        for rs in propagated:
+            r_eci = rs[k]
+            r_ecef = eci_to_ecef(r_eci, t)
+
+            if is_visible(r_ecef, station, min_elev_rad):
+                visible_any = True
+                break
+
+        if visible_any:
+            visible_times.append(t)
+
+    return _access_metrics(
+        n_planes,
+        sats_per_plane,
+        visible_times,
+        timeline
+    )
+
+
+def _evaluate_lattice_architecture(
+    n_planes,
+    sats_per_plane,
+    timeline,
+    visibility,
+    members
+):
+    """
+    Métricas geométricas a partir das máscaras do reticulado: OR das
+    colunas dos satélites da arquitetura, sem propagação.
+    """
+    visible_any = visibility[:, members[(n_planes, sats_per_plane)]].any(
+        axis=1
+    )
+
+    return _access_metrics(
+        n_planes,
+        sats_per_plane,
+        list(timeline.times[visible_any]),
+        timeline
+    )
+
+
+def _access_metrics(n_planes, sats_per_plane, visible_times, timeline):
+    """
+    Linha de resultado do sweep a partir dos instantes visíveis.
+    """
+    total_sats = n_planes * sats_per_plane
+
+    availability = 100.0 * len(visible_times) / len(timeline.times)
+
+    intervals = compute_access_intervals(
+        visible_times,
+        timeline.dt
+    )
+
+    if intervals:
+        worst_gap_s = max_gap(
+            intervals,
+            0.0,
+            timeline.times[-1] + timeline.dt
+        )
+
+        revisits = revisit_times(intervals)
+        mean_revisit_s = np.mean(revisits) if revisits else 0.0
+
+        durations = [
+            (t1 - t0) for (t0, t1) in intervals
+        ]
+        mean_pass_duration_s = (
+            np.mean(durations) if durations else 0.0
+        )
+
+        n_passes = len(intervals)
+
+    else:
+        worst_gap_s = timeline.times[-1]
+        mean_revisit_s = 0.0
+        mean_pass_duration_s = 0.0
+        n_passes = 0
+
+    return {
+        "n_planes": n_planes,
+        "sats_per_plane": sats_per_plane,
+        "total_sats": total_sats,
+        "worst_gap_min": worst_gap_s / 60.0,
+        "availability_percent": availability,
+        "mean_revisit_min": mean_revisit_s / 60.0,
+        "mean_pass_duration_min": mean_pass_duration_s / 60.0,
+        "n_passes": n_passes,
+    }
+
+
+def _screen_architectures(
+    architectures,
+    timeline,
+    station_lat_deg,
+    station_lon_deg,
+    altitude_km,
+    inclination_deg,
+    min_elev_deg,
+    max_gap_requirement_min,
+    min_availability_requirement_pct
+):
+    """
+    Triagem analítica (street of coverage) das arquiteturas.
+
+    Retorna (incertas, linhas das viáveis). As linhas viáveis não são
+    simuladas: métricas em NaN e limites analíticos de pior caso em
+    worst_gap_bound_min / availability_bound_percent (válidos sob as
+    margens J2 empíricas de street_coverage_masks).
+    """
+    uncertain = []
+    feasible = {}
+
+    for n_planes, sats_per_plane in architectures:
+        necessary, sufficient = street_coverage_masks(
+            n_planes,
+            sats_per_plane,
+            altitude_km,
+            inclination_deg,
+            station_lat_deg,
+            station_lon_deg,
+            timeline,
+            min_elev_deg
+        )
+
+        best, worst = (
+            _access_metrics(
+                n_planes,
+                sats_per_plane,
+                list(timeline.times[mask[:, 0]]),
+                timeline
+            )
+            for mask in (necessary, sufficient)
+        )
+
+        status = classify_screening(
+            best,
+            worst,
+            max_gap_requirement_min,
+            min_availability_requirement_pct
+        )
+
+        if status == "uncertain":
+            uncertain.append((n_planes, sats_per_plane))
+
+        elif status == "feasible":
+            feasible[(n_planes, sats_per_plane)] = {
+                **worst,
+                "worst_gap_min": np.nan,
+                "availability_percent": np.nan,
+                "mean_revisit_min": np.nan,
+                "mean_pass_duration_min": np.nan,
+                "n_passes": np.nan,
+                "worst_gap_bound_min": worst["worst_gap_min"],
+                "availability_bound_percent": worst["availability_percent"],
+                "screening": "feasible",
+            }
+
+    return uncertain, feasible
+
+
+def _meets_requirements(
+    row,
+    max_gap_requirement_min,
+    min_availability_requirement_pct
+):
+    if (
+        max_gap_requirement_min is not None
+        and row["worst_gap_min"] > max_gap_requirement_min
+    ):
+        return False
+
+    if (
+        min_availability_requirement_pct is not None
+        and row["availability_percent"] < min_availability_requirement_pct
+    ):
+        return False
+
+    return True
+
+
+def local_geom_dt_convergence(
+    station_lat_deg,
+    station_lon_deg,
+    altitude_km,
+    inclination_deg,
+    duration_h,
+    min_elev_deg,
+    architectures,
+    dt_candidates_s=DEFAULT_DT_CANDIDATES_S,
+    gap_tolerance_min=DEFAULT_GAP_TOLERANCE_MIN,
+    availability_tolerance_pct=DEFAULT_AVAILABILITY_TOLERANCE_PCT,
+    max_probe_point_steps=DEFAULT_MAX_PROBE_POINT_STEPS
+):
+    """
+    dt_convergence das métricas geométricas locais nas arquiteturas-sonda
+    (probe_architectures: todas as arquiteturas, se o reticulado no menor
+    dt couber em max_probe_point_steps pontos x passos).
+
+    As sondas são avaliadas pelo reticulado Walker, integrado com passo dt
+    como no sweep; as máscaras ficam em cache por dt (lattice_visibility),
+    então repetir o estudo com outras tolerâncias, ou um sweep "lattice"
+    das mesmas arquiteturas no dt escolhido, não propaga de novo.
+
+    Retorna o dicionário de dt_convergence com "probes".
+    """
+    n_steps = len(TimeArray(
+        0.0,
+        duration_h * 3600.0,
+        min(float(dt) for dt in dt_candidates_s)
+    ))
+
+    probes = probe_architectures(
+        architectures,
+        max(1, max_probe_point_steps // n_steps)
+    )
+    points, members = walker_lattice(probes)
+    members = dict(zip(probes, members))
+
+    def evaluate(dt_s):
+        timeline = TimeArray(0.0, duration_h * 3600.0, dt_s)
+
+        visibility = lattice_visibility(
+            points,
+            station_lat_deg,
+            station_lon_deg,
+            altitude_km,
+            inclination_deg,
+            duration_h,
+            dt_s,
+            min_elev_deg
+        )
+
+        return [
+            _evaluate_lattice_architecture(
+                n_planes,
+                sats_per_plane,
+                timeline,
+                visibility,
+                members
+            )
+            for n_planes, sats_per_plane in probes
+        ]
+
+    return {
+        **dt_convergence(
+            evaluate,
+            dt_candidates_s,
+            gap_tolerance_min,
+            availability_tolerance_pct
+        ),
+        "probes": probes,
+    }
+
+
+def _auto_dt(
+    station_lat_deg,
+    station_lon_deg,
+    altitude_km,
+    inclination_deg,
+    duration_h,
+    min_elev_deg,
+    architectures,
+    dt_candidates_s,
+    gap_tolerance_min,
+    availability_tolerance_pct
+):
+    """
+    Passo do sweep com dt_s="auto".
+
+    Se o reticulado de todas as arquiteturas no menor candidato cabe em
+    DEFAULT_MAX_PROBE_POINT_STEPS, a referência do estudo já seria o
+    sweep inteiro: o sweep usa direto o menor candidato. Senão o estudo
+    roda em sondas limitadas a 1/DEFAULT_PROBE_FRACTION dos pontos x
+    passos do sweep, bem mais barato que ele.
+    """
+    reference_dt_s = min(float(dt) for dt in dt_candidates_s)
+
+    sweep_point_steps = len(walker_lattice(architectures)[0]) * len(
+        TimeArray(0.0, duration_h * 3600.0, reference_dt_s)
+    )
+
+    if sweep_point_steps <= DEFAULT_MAX_PROBE_POINT_STEPS:
+        return reference_dt_s
+
+    return local_geom_dt_convergence(
+        station_lat_deg,
+        station_lon_deg,
+        altitude_km,
+        inclination_deg,
+        duration_h,
+        min_elev_deg,
+        architectures,
+        dt_candidates_s,
+        gap_tolerance_min,
+        availability_tolerance_pct,
+        max_probe_point_steps=min(
+            DEFAULT_MAX_PROBE_POINT_STEPS,
+            sweep_point_steps // DEFAULT_PROBE_FRACTION
+        )
+    )["dt_s"]
 
 
 def run_sweep_local_geom_analysis(
@@ -24,10 +396,66 @@ def run_sweep_local_geom_analysis(
     dt_s,
     min_elev_deg,
     n_max,
+    n_workers=None,
+    progress=None,
+    cancel=None,
+    sweep_mode="architecture",
+    pareto_only=False,
+    store_dir=None,
+    shard=None,
+    max_gap_requirement_min=None,
+    min_availability_requirement_pct=None,
+    screening=False,
+    dt_candidates_s=DEFAULT_DT_CANDIDATES_S,
+    dt_gap_tolerance_min=DEFAULT_GAP_TOLERANCE_MIN,
+    dt_availability_tolerance_pct=DEFAULT_AVAILABILITY_TOLERANCE_PCT,
 ):
     """
     Varre arquiteturas até n_max satélites e avalia desempenho geométrico.
 
+    n_workers > 1 avalia as arquiteturas em paralelo; progress(done, total)
+    e cancel() seguem run_architecture_sweep. A ordem dos resultados é a
+    mesma do sweep serial.
+
+    sweep_mode="lattice" propaga uma única vez cada ponto (RAAN, fase) do
+    reticulado Walker que contém todas as arquiteturas e avalia cada uma
+    pelo OR das máscaras de visibilidade dos seus membros (máscaras em
+    cache; n_workers é ignorado).
+
+    pareto_only=True retorna apenas a fronteira de Pareto (total de
+    satélites, pior gap, disponibilidade), sem avaliar as arquiteturas
+    comprovadamente dominadas (ver pareto_architecture_search; avaliação
+    sequencial, n_workers é ignorado).
+
+    store_dir: grava cada arquitetura concluída em um ResultStore
+    (Parquet) do cenário em store_dir e pula as já gravadas; sweeps
+    interrompidos ou com n_max maior retomam de onde pararam. Com
+    screening, as viáveis (só limites) também são gravadas e a triagem e
+    os requisitos fazem parte do cenário.
+
+    shard = (i, N): avalia apenas as arquiteturas do shard i de N
+    (shard_architectures, balanceado por satélites x passos). Com
+    store_dir, cada shard grava seus fragmentos e manifesto no mesmo
+    cenário; merge_shards junta e valida os resultados.
+
+    Com max_gap_requirement_min / min_availability_requirement_pct apenas
+    as arquiteturas que atendem aos requisitos são retornadas.
+    screening=True (com algum requisito) faz antes uma triagem analítica
+    (street of coverage, ver street_coverage_masks): as inviáveis são
+    descartadas e apenas as incertas são simuladas. As viáveis não são
+    simuladas: entram com as métricas em NaN e os limites de pior caso
+    em worst_gap_bound_min / availability_bound_percent (NaN nas
+    simuladas). As linhas ganham a coluna "screening" ("feasible" ou
+    "simulated").
+
+    dt_s="auto" escolhe o passo por local_geom_dt_convergence (sondas
+    entre as arquiteturas até n_max, candidatos dt_candidates_s): o maior
+    dt cujo pior gap e disponibilidade ficam a no máximo
+    dt_gap_tolerance_min / dt_availability_tolerance_pct do menor
+    candidato. Sweeps pequenos o bastante para o estudo cobrir todas as
+    arquiteturas usam direto o menor candidato (ver _auto_dt). As linhas
+    ganham a coluna "dt_s" com o passo escolhido.
+
     Retorna lista de dicionários:
         {
             "n_planes": int,
@@ -46,104 +474,177 @@ def run_sweep_local_geom_analysis(
         lon_deg=station_lon_deg
     )
 
+    auto_dt = dt_s == "auto"
+
+    if auto_dt:
+        dt_s = _auto_dt(
+            station_lat_deg,
+            station_lon_deg,
+            altitude_km,
+            inclination_deg,
+            duration_h,
+            min_elev_deg,
+            sweep_architectures(n_max),
+            dt_candidates_s,
+            dt_gap_tolerance_min,
+            dt_availability_tolerance_pct
+        )
+
     timeline = TimeArray(
         0.0,
         duration_h * 3600.0,
         dt_s
     )
 
-    min_elev_rad = min_elev_deg * DEG2RAD
+    if sweep_mode not in SWEEP_MODES:
+        raise ValueError(f"Modo de sweep inválido: '{sweep_mode}'")
 
-    results = []
+    if shard is not None and pareto_only:
+        raise ValueError("pareto_only não suporta shard")
 
-    for n_planes in range(1, n_max + 1):
-        for sats_per_plane in range(1, n_max + 1):
+    requirements = (
+        max_gap_requirement_min,
+        min_availability_requirement_pct,
+    )
 
-            total_sats = n_planes * sats_per_plane
-            if total_sats > n_max:
-                continue
+    if pareto_only and requirements != (None, None):
+        raise ValueError("pareto_only não suporta requisitos")
 
-            constellation_coe = generate_constellation(
-                altitude=R_EARTH + altitude_km * 1000.0,
-                inclination=inclination_deg * DEG2RAD,
-                n_planes=n_planes,
-                sats_per_plane=sats_per_plane,
-            )
+    architectures = sweep_architectures(n_max)
 
-            constellation = [
-                coe_to_rv(coe) for coe in constellation_coe
-            ]
+    if shard is not None:
+        architectures = shard_architectures(
+            architectures,
+            shard,
+            len(timeline.times)
+        )
 
-            # Propagação de todos satélites
-            propagated = []
-            for r0, v0 in constellation:
-                rs, _ = propagate_orbit(
-                    r0,
-                    v0,
-                    timeline,
-                    use_j2=True
-                )
-                propagated.append(rs)
+    candidates = architectures
+    feasible = {}
 
-            visible_times = []
+    # Sem requisitos nada é classificado: triagem seria custo puro
+    screening = screening and requirements != (None, None)
 
-            # Avaliação geométrica agregada
-            for k, t in enumerate(timeline.times):
+    if screening:
+        architectures, feasible = _screen_architectures(
+            candidates,
+            timeline,
+            station_lat_deg,
+            station_lon_deg,
+            altitude_km,
+            inclination_deg,
+            min_elev_deg,
+            *requirements
+        )
 
-                visible_any = False
+    if sweep_mode == "lattice" and architectures:
+        points, members = walker_lattice(architectures)
 
-                for rs in propagated:
-                    r_eci = rs[k]
-                    r_ecef = eci_to_ecef(r_eci, t)
+        evaluate = partial(
+            _evaluate_lattice_architecture,
+            timeline=timeline,
+            visibility=lattice_visibility(
+                points,
+                station_lat_deg,
+                station_lon_deg,
+                altitude_km,
+                inclination_deg,
+                duration_h,
+                dt_s,
+                min_elev_deg
+            ),
+            members=dict(zip(architectures, members)),
+        )
+        n_workers = None
 
-                    if is_visible(r_ecef, station, min_elev_rad):
-                        visible_any = True
-                        break
+    else:
+        evaluate = partial(
+            _evaluate_architecture,
+            station=station,
+            timeline=timeline,
+            altitude_km=altitude_km,
+            inclination_deg=inclination_deg,
+            min_elev_rad=min_elev_deg * DEG2RAD,
+        )
 
-                if visible_any:
-                    visible_times.append(t)
+    store = None
+    if store_dir is not None:
+        scenario = {
+            "analysis": "local_geom",
+            "station_lat_deg": station_lat_deg,
+            "station_lon_deg": station_lon_deg,
+            "altitude_km": altitude_km,
+            "inclination_deg": inclination_deg,
+            "duration_h": duration_h,
+            "dt_s": dt_s,
+            "min_elev_deg": min_elev_deg,
+        }
+
+        # Linhas viáveis da triagem (só limites) dependem dos requisitos
+        if screening:
+            scenario.update({
+                "screening": True,
+                "max_gap_requirement_min": max_gap_requirement_min,
+                "min_availability_requirement_pct": (
+                    min_availability_requirement_pct
+                ),
+            })
 
-            availability = 100.0 * len(visible_times) / len(timeline.times)
+        store = ResultStore(store_dir, scenario, shard=shard)
 
-            intervals = compute_access_intervals(
-                visible_times,
-                timeline.dt
-            )
+        # Viáveis entram no store e no manifesto como as simuladas
+        if shard is not None:
+            store.write_manifest(architectures + list(feasible))
 
-            if intervals:
-                worst_gap_s = max_gap(
-                    intervals,
-                    0.0,
-                    timeline.times[-1] + timeline.dt
-                )
+        for arch, row in feasible.items():
+            if arch not in store:
+                store.append(arch, row)
 
-                revisits = revisit_times(intervals)
-                mean_revisit_s = np.mean(revisits) if revisits else 0.0
+    if pareto_only:
+        results = pareto_architecture_search(
+            evaluate,
+            n_max,
+            progress=progress,
+            cancel=cancel,
+            store=store,
+        )["front"]
 
-                durations = [
-                    (t1 - t0) for (t0, t1) in intervals
-                ]
-                mean_pass_duration_s = (
-                    np.mean(durations) if durations else 0.0
-                )
+    else:
+        simulated = dict(zip(architectures, run_architecture_sweep(
+            evaluate,
+            architectures,
+            n_workers=n_workers,
+            progress=progress,
+            cancel=cancel,
+            store=store,
+        )))
 
-                n_passes = len(intervals)
+        results = []
+
+        for arch in candidates:
+            if arch in feasible:
+                row = feasible[arch]
+
+            elif arch in simulated:
+                row = simulated[arch]
+
+                if not _meets_requirements(row, *requirements):
+                    continue
+
+                if screening:
+                    row = {
+                        **row,
+                        "worst_gap_bound_min": np.nan,
+                        "availability_bound_percent": np.nan,
+                        "screening": "simulated",
+                    }
 
             else:
-                worst_gap_s = timeline.times[-1]
-                mean_revisit_s = 0.0
-                mean_pass_duration_s = 0.0
-                n_passes = 0
-
-            results.append({
-                "n_planes": n_planes,
-                "sats_per_plane": sats_per_plane,
-                "total_sats": total_sats,
-                "worst_gap_min": worst_gap_s / 60.0,
-                "availability_percent": availability,
-                "mean_revisit_min": mean_revisit_s / 60.0,
-                "mean_pass_duration_min": mean_pass_duration_s / 60.0,
-                "n_passes": n_passes,
-            })
+                continue
+
+            results.append(row)
+
+    if auto_dt:
+        results = [{**row, "dt_s": dt_s} for row in results]
 
     return results
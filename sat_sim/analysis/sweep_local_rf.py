@@ -1,4 +1,4 @@
-import numpy as np
+from functools import partial
 
 from sat_sim.constants import R_EARTH, DEG2RAD
 from sat_sim.time import TimeArray
@@ -6,7 +6,79 @@ from sat_sim.ground.stations import GroundStation
 from sat_sim.orbits.constellation import generate_constellation
 from sat_sim.orbits.elements import coe_to_rv
 from sat_sim.orbits.propagator import propagate_orbit
-from sat_sim.analysis.local_rf_metrics import compute_local_rf_metrics
+from sat_sim.analysis.local_rf_metrics import (
+    closed_link_metrics,
+    compute_local_rf_metrics,
+    uplink_link_samples,
+)
+from sat_sim.analysis.sweep_executor import (
+    run_architecture_sweep,
+    shard_architectures,
+    sweep_architectures,
+)
+from sat_sim.analysis.result_store import ResultStore
+from sat_sim.analysis.lattice_sweep import (
+    SWEEP_MODES,
+    lattice_ephemeris,
+    walker_lattice,
+)
+
+
+def _propagate_j2(r0, v0, timeline):
+    return propagate_orbit(r0, v0, timeline, use_j2=True)
+
+
+def _evaluate_architecture(
+    n_planes,
+    sats_per_plane,
+    station,
+    timeline,
+    altitude_km,
+    inclination_deg,
+    rf_kwargs
+):
+    """
+    Métricas RF de uma arquitetura (executado nos workers).
+    """
+    constellation_coe = generate_constellation(
+        altitude=R_EARTH + altitude_km * 1000.0,
+        inclination=inclination_deg * DEG2RAD,
+        n_planes=n_planes,
+        sats_per_plane=sats_per_plane
+    )
+
+    constellation = [
+        coe_to_rv(coe) for coe in constellation_coe
+    ]
+
+    return compute_local_rf_metrics(
+        constellation=constellation,
+        timeline=timeline,
+        station=station,
+        propagate_fn=_propagate_j2,
+        **rf_kwargs
+    )
+
+
+def _evaluate_lattice_architecture(
+    n_planes,
+    sats_per_plane,
+    timeline,
+    closed,
+    rate,
+    members
+):
+    """
+    Métricas RF a partir das amostras do reticulado (colunas dos membros),
+    sem propagação nem novo link budget.
+    """
+    idx = members[(n_planes, sats_per_plane)]
+
+    return closed_link_metrics(
+        closed[:, idx],
+        timeline,
+        None if rate is None else rate[:, idx]
+    )
 
 
 def run_sweep_local_rf_analysis(
@@ -18,10 +90,52 @@ def run_sweep_local_rf_analysis(
     dt_s,
     n_max,
     max_gap_requirement_min=None,
+    min_availability_requirement_pct=None,
+    rf_mode="table",
+    pattern=None,
+    attitude="nadir",
+    rate_model=None,
+    loss_chain=None,
+    n_workers=None,
+    progress=None,
+    cancel=None,
+    sweep_mode="architecture",
+    early_stop=True,
+    store_dir=None,
+    shard=None,
 ):
     """
     Varre arquiteturas até n_max satélites.
     Retorna lista de dicionários com métricas.
+
+    rf_mode="table" usa a tabela de fechamento RF (teste geométrico,
+    mesmo custo do sweep geométrico); "exact" avalia o link budget
+    completo e "check" compara os dois. pattern/attitude: diagrama de
+    antena do satélite (ver compute_local_rf_metrics). Com rate_model,
+    cada arquitetura inclui data_volume_mbit_per_day. loss_chain:
+    perdas de propagação (LossChain).
+
+    n_workers > 1 avalia as arquiteturas em paralelo; progress(done, total)
+    e cancel() seguem run_architecture_sweep. A ordem dos resultados é a
+    mesma do sweep serial.
+
+    sweep_mode="lattice" propaga e avalia o link uma única vez por ponto
+    (RAAN, fase) do reticulado Walker; cada arquitetura é o OR das
+    máscaras (e o melhor satélite, para a taxa) dos seus membros
+    (n_workers é ignorado).
+
+    Com max_gap_requirement_min / min_availability_requirement_pct apenas
+    as arquiteturas que atendem aos requisitos são retornadas. No modo
+    "architecture" com early_stop=True a avaliação de cada arquitetura é
+    interrompida assim que um requisito deixa de ser atingível (ver
+    compute_local_rf_metrics).
+
+    store_dir: métricas de cada arquitetura gravadas em um ResultStore
+    (Parquet) do cenário (ver run_sweep_local_geom_analysis); com
+    early_stop os requisitos fazem parte do cenário.
+
+    shard = (i, N): apenas as arquiteturas do shard i de N (ver
+    run_sweep_local_geom_analysis).
     """
 
     station = GroundStation(
@@ -35,48 +149,140 @@ def run_sweep_local_rf_analysis(
         dt_s
     )
 
+    architectures = sweep_architectures(n_max)
+
+    if shard is not None:
+        architectures = shard_architectures(
+            architectures,
+            shard,
+            len(timeline.times)
+        )
+
+    rf_kwargs = {
+        "rf_mode": rf_mode,
+        "pattern": pattern,
+        "attitude": attitude,
+        "rate_model": rate_model,
+        "loss_chain": loss_chain,
+    }
+
+    requirements = {
+        "max_gap_s": (
+            None if max_gap_requirement_min is None
+            else max_gap_requirement_min * 60.0
+        ),
+        "min_availability_percent": min_availability_requirement_pct,
+    }
+
+    if sweep_mode not in SWEEP_MODES:
+        raise ValueError(f"Modo de sweep inválido: '{sweep_mode}'")
+
+    if sweep_mode == "lattice":
+        points, members = walker_lattice(architectures)
+
+        ephemeris, velocity = lattice_ephemeris(
+            points,
+            altitude_km,
+            inclination_deg,
+            duration_h,
+            dt_s
+        )
+
+        closed, rate = uplink_link_samples(
+            ephemeris,
+            velocity,
+            timeline,
+            station,
+            **rf_kwargs
+        )
+
+        evaluate = partial(
+            _evaluate_lattice_architecture,
+            timeline=timeline,
+            closed=closed,
+            rate=rate,
+            members=dict(zip(architectures, members)),
+        )
+        n_workers = None
+
+    else:
+        evaluate = partial(
+            _evaluate_architecture,
+            station=station,
+            timeline=timeline,
+            altitude_km=altitude_km,
+            inclination_deg=inclination_deg,
+            rf_kwargs=(
+                {**rf_kwargs, **requirements} if early_stop else rf_kwargs
+            ),
+        )
+
+    store = None
+    if store_dir is not None:
+        scenario = {
+            "analysis": "local_rf",
+            "station_lat_deg": station_lat_deg,
+            "station_lon_deg": station_lon_deg,
+            "altitude_km": altitude_km,
+            "inclination_deg": inclination_deg,
+            "duration_h": duration_h,
+            "dt_s": dt_s,
+            **rf_kwargs,
+        }
+
+        # Linhas rejeitadas (parciais) dependem dos requisitos
+        if sweep_mode == "architecture" and early_stop and any(
+            value is not None for value in requirements.values()
+        ):
+            scenario.update(requirements)
+
+        store = ResultStore(store_dir, scenario, shard=shard)
+
+        if shard is not None:
+            store.write_manifest(architectures)
+
+    all_metrics = run_architecture_sweep(
+        evaluate,
+        architectures,
+        n_workers=n_workers,
+        progress=progress,
+        cancel=cancel,
+        store=store,
+    )
+
     results = []
 
-    for n_planes in range(1, n_max + 1):
-        for sats_per_plane in range(1, n_max + 1):
+    for (n_planes, sats_per_plane), metrics in zip(
+        architectures,
+        all_metrics
+    ):
+        if metrics.get("rejected"):
+            continue
 
-            total_sats = n_planes * sats_per_plane
-            if total_sats > n_max:
-                continue
+        worst_gap_min = metrics["worst_gap_s"] / 60.0
+        availability_pct = metrics["availability_percent"]
 
-            constellation_coe = generate_constellation(
-                altitude=R_EARTH + altitude_km * 1000.0,
-                inclination=inclination_deg * DEG2RAD,
-                n_planes=n_planes,
-                sats_per_plane=sats_per_plane
-            )
+        if max_gap_requirement_min is not None:
+            if worst_gap_min > max_gap_requirement_min:
+                continue
 
-            constellation = [
-                coe_to_rv(coe) for coe in constellation_coe
-            ]
-
-            metrics = compute_local_rf_metrics(
-                constellation=constellation,
-                timeline=timeline,
-                station=station,
-                propagate_fn=lambda r0, v0, tl: propagate_orbit(
-                    r0, v0, tl, use_j2=True
-                ),
-            )
+        if min_availability_requirement_pct is not None:
+            if availability_pct < min_availability_requirement_pct:
+                continue
 
-            worst_gap_min = metrics["worst_gap_s"] / 60.0
-            availability_pct = metrics["availability_percent"]
+        row = {
+            "n_planes": n_planes,
+            "sats_per_plane": sats_per_plane,
+            "total_sats": n_planes * sats_per_plane,
+            "worst_gap_min": worst_gap_min,
+            "availability_percent": availability_pct,
+        }
 
-            if max_gap_requirement_min is not None:
-                if worst_gap_min > max_gap_requirement_min:
-                    continue
+        if rate_model is not None:
+            row["data_volume_mbit_per_day"] = (
+                metrics["data_volume_per_day_bits"] / 1e6
+            )
 
-            results.append({
-                "n_planes": n_planes,
-                "sats_per_plane": sats_per_plane,
-                "total_sats": total_sats,
-                "worst_gap_min": worst_gap_min,
-                "availability_percent": availability_pct,
-            })
+        results.append(row)
 
     return results
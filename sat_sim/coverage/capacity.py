@@ -0,0 +1,399 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from sat_sim.coverage.engine import (
+    grid_stations_ecef,
+    stations_ecef,
+    cells_to_grid,
+    propagate_constellation_ecef,
+    iter_grid_visibility_matrix,
+    accumulate_grid_pass
+)
+
+
+@dataclass(frozen=True)
+class AlohaParams:
+    """
+    Acesso aleatório slotted-ALOHA do uplink VDE-SAT.
+
+    slot_s:              duração do slot (TDMA VDES: 2250 slots/min)
+    message_interval_s:  intervalo médio entre mensagens de um terminal
+    slots_per_message:   slots ocupados por mensagem
+    n_channels:          canais independentes (carga dividida igualmente)
+    """
+    slot_s: float = 60.0 / 2250
+    message_interval_s: float = 360.0
+    slots_per_message: int = 1
+    n_channels: int = 1
+
+
+def offered_load(n_terminals, params=AlohaParams()):
+    """
+    Carga oferecida G [mensagens/slot/canal] de n_terminals no footprint.
+    """
+    duty = params.slots_per_message * params.slot_s / params.message_interval_s
+
+    return np.asarray(n_terminals, dtype=float) * duty / params.n_channels
+
+
+def aloha_success_probability(load):
+    """
+    Probabilidade de uma transmissão não colidir: exp(-G) (tráfego
+    Poisson; exata para mensagens de um slot).
+    """
+    return np.exp(-np.asarray(load, dtype=float))
+
+
+def aloha_throughput(n_terminals, params=AlohaParams()):
+    """
+    Mensagens decodificadas por segundo em um satélite com n_terminals
+    no footprint: taxa oferecida x exp(-G).
+    """
+    n_terminals = np.asarray(n_terminals, dtype=float)
+    rate = n_terminals / params.message_interval_s
+
+    return rate * aloha_success_probability(offered_load(n_terminals, params))
+
+
+def region_labels(masks, grid_shape=None):
+    """
+    Rótulos inteiros [n_lat, n_lon] a partir de máscaras booleanas (ex.:
+    roi_cell_mask): célula recebe o índice da primeira máscara que a
+    contém, -1 fora de todas.
+    """
+    masks = [np.asarray(m, dtype=bool) for m in masks]
+    shape = masks[0].shape if grid_shape is None else tuple(grid_shape)
+
+    labels = np.full(shape, -1, dtype=np.int64)
+    for i, mask in enumerate(masks):
+        labels[(labels < 0) & mask] = i
+
+    return labels
+
+
+class AlohaCapacity:
+    """
+    Acumulador slotted-ALOHA, passo a passo, a partir da matriz de
+    visibilidade [n_terms, n_sats] (observer de accumulate_grid_pass).
+
+    weights [n_terms]: terminais por ponto; regions [n_terms]: rótulos
+    inteiros (-1 = nenhuma).
+
+    terminals_in_view [n_steps, n_sats]: carga de cada satélite já somada
+    sobre todos os terminais (terminal_load), que podem incluir pontos
+    fora dos acumulados (ex.: tráfego fora da ROI). Com ela os pontos são
+    independentes e o acumulador pode ser dividido em blocos (tile /
+    merge, passadas paralelas). None = carga dos próprios pontos,
+    calculada a cada passo; acopla todos os pontos (sem blocos).
+    """
+
+    def __init__(
+        self,
+        weights,
+        regions,
+        n_regions,
+        n_steps,
+        n_sats,
+        dt,
+        params=AlohaParams(),
+        terminals_in_view=None
+    ):
+        self.weights = np.asarray(weights, dtype=float)
+        self.regions = np.asarray(regions, dtype=np.int64)
+        self.n_regions = n_regions
+        self.dt = dt
+        self.params = params
+
+        self.rate = self.weights / params.message_interval_s
+        self.in_region = self.regions >= 0
+
+        self.load_given = terminals_in_view is not None
+        self.terminals_in_view = (
+            np.asarray(terminals_in_view, dtype=float) if self.load_given
+            else np.zeros((n_steps, n_sats))
+        )
+        self.region_throughput = np.zeros((n_steps, n_regions))
+        self.detection_sum = np.zeros(len(self.weights))
+
+    def update(self, k, vis):
+        if self.load_given:
+            n_view = self.terminals_in_view[k]
+        else:
+            n_view = self.weights @ vis
+            self.terminals_in_view[k] = n_view
+
+        load = offered_load(n_view, self.params)
+
+        # log P(colisão) por satélite; satélites sem terminais não contam
+        with np.errstate(divide="ignore"):
+            log_fail = np.where(load > 0, np.log(-np.expm1(-load)), 0.0)
+
+        # Mensagem detectada se algum satélite em visada a recebe
+        p_detect = -np.expm1(vis @ log_fail)
+
+        self.detection_sum += p_detect
+
+        self.region_throughput[k] = np.bincount(
+            self.regions[self.in_region],
+            weights=(self.rate * p_detect)[self.in_region],
+            minlength=self.n_regions
+        )
+
+    def tile(self, start, stop):
+        """
+        Acumulador vazio dos pontos [start, stop) (mesma carga).
+        """
+        if not self.load_given:
+            raise ValueError(
+                "AlohaCapacity sem terminals_in_view não pode ser dividida "
+                "em blocos (ver terminal_load)"
+            )
+
+        return AlohaCapacity(
+            self.weights[start:stop],
+            self.regions[start:stop],
+            self.n_regions,
+            *self.terminals_in_view.shape,
+            self.dt,
+            self.params,
+            self.terminals_in_view
+        )
+
+    def merge(self, parts):
+        """
+        Junta os blocos (tile, na ordem dos pontos) neste acumulador.
+        """
+        self.detection_sum = np.concatenate(
+            [part.detection_sum for part in parts]
+        )
+        self.region_throughput = np.sum(
+            [part.region_throughput for part in parts],
+            axis=0
+        )
+
+    def result(self):
+        """
+        Métricas de capacidade (chaves de compute_grid_capacity_metrics).
+        """
+        params = self.params
+        n_steps = len(self.terminals_in_view)
+
+        load = offered_load(self.terminals_in_view, params)
+        success = aloha_success_probability(load)
+
+        offered = np.bincount(
+            self.regions[self.in_region],
+            weights=self.rate[self.in_region],
+            minlength=self.n_regions
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            region_detection = np.where(
+                offered > 0,
+                self.region_throughput.mean(axis=0) / offered,
+                np.nan
+            )
+
+        return {
+            "terminals_in_view": self.terminals_in_view,
+            "offered_load": load,
+            "collision_probability": 1.0 - success,
+            "throughput_msg_s": (
+                self.terminals_in_view / params.message_interval_s * success
+            ),
+            "detection_probability": self.detection_sum / max(n_steps, 1),
+            "region_throughput_msg_s": self.region_throughput,
+            "region_detection_probability": region_detection,
+            "delivered_messages": float(
+                self.region_throughput.sum() * self.dt
+            ),
+            "offered_messages": float(offered.sum() * n_steps * self.dt),
+        }
+
+
+def terminal_load(
+    ephemeris,
+    r_terms,
+    zenith_terms,
+    min_elevation_rad,
+    weights,
+    dt,
+    n_workers=None
+):
+    """
+    Terminais em visada de cada satélite [n_steps, n_sats] (soma dos
+    pesos dos pontos visíveis), em uma passada de visibilidade própria
+    sobre os terminais (paralela com n_workers > 1).
+    """
+    _, weighted = accumulate_grid_pass(
+        ephemeris,
+        r_terms,
+        zenith_terms,
+        min_elevation_rad,
+        dt,
+        weights=weights,
+        n_workers=n_workers
+    )
+
+    return weighted.in_view
+
+
+def _capacity_pass(
+    ephemeris,
+    r_terms,
+    zenith_terms,
+    min_elevation_rad,
+    weights,
+    regions,
+    n_regions,
+    dt,
+    params
+):
+    capacity = AlohaCapacity(
+        weights,
+        regions,
+        n_regions,
+        *ephemeris.shape[:2],
+        dt,
+        params
+    )
+
+    for k, vis in iter_grid_visibility_matrix(
+        ephemeris,
+        r_terms,
+        zenith_terms,
+        min_elevation_rad
+    ):
+        capacity.update(k, vis)
+
+    return capacity.result()
+
+
+def compute_grid_capacity_metrics(
+    *,
+    constellation,
+    timeline,
+    propagate_fn,
+    min_elevation_rad,
+    lat_grid_deg,
+    lon_grid_deg,
+    weights,
+    params=AlohaParams(),
+    regions=None,
+    cell_mask=None
+):
+    """
+    Capacidade slotted-ALOHA do uplink com terminais distribuídos no grid.
+
+    weights [n_lat, n_lon]: número esperado de terminais por célula (ex.:
+    density_weights). regions [n_lat, n_lon]: rótulos inteiros >= 0
+    (region_labels), -1 fora; None = uma única região com todas as
+    células. Apenas células com peso > 0 (e em cell_mask) são avaliadas.
+
+    Retorna dicionário:
+        terminals_in_view            [n_steps, n_sats]
+        offered_load                 [n_steps, n_sats] G por canal
+        collision_probability        [n_steps, n_sats] 1 - exp(-G)
+        throughput_msg_s             [n_steps, n_sats] mensagens decodificadas
+                                     por satélite (duplicatas incluídas)
+        detection_probability        [n_lat, n_lon] média no tempo de
+                                     P(algum satélite recebe a mensagem)
+        region_throughput_msg_s      [n_steps, n_regions] mensagens únicas
+        region_detection_probability [n_regions]
+        delivered_messages           total esperado de mensagens únicas
+        offered_messages             total de mensagens transmitidas
+    """
+    n_lat = len(lat_grid_deg)
+    n_lon = len(lon_grid_deg)
+
+    weights = np.asarray(weights, dtype=float)
+
+    active = weights > 0
+    if cell_mask is not None:
+        active = active & np.asarray(cell_mask, dtype=bool)
+
+    if regions is None:
+        regions = np.zeros((n_lat, n_lon), dtype=np.int64)
+    regions = np.asarray(regions, dtype=np.int64)
+
+    r_cells, zenith_cells = grid_stations_ecef(
+        lat_grid_deg,
+        lon_grid_deg,
+        active
+    )
+
+    ephemeris = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn
+    )
+
+    result = _capacity_pass(
+        ephemeris,
+        r_cells,
+        zenith_cells,
+        min_elevation_rad,
+        weights[active],
+        regions[active],
+        max(int(regions.max()) + 1, 1),
+        timeline.dt,
+        params
+    )
+
+    result["detection_probability"] = cells_to_grid(
+        result["detection_probability"],
+        (n_lat, n_lon),
+        active
+    )
+
+    return result
+
+
+def compute_terminal_capacity_metrics(
+    *,
+    constellation,
+    timeline,
+    propagate_fn,
+    min_elevation_rad,
+    lat_deg,
+    lon_deg,
+    weights=None,
+    params=AlohaParams(),
+    regions=None
+):
+    """
+    Mesmo que compute_grid_capacity_metrics para uma lista de terminais
+    (lat_deg, lon_deg [n_terms]); weights opcional (default 1 terminal
+    por ponto) e regions [n_terms] com rótulos inteiros (-1 = nenhuma).
+    detection_probability é retornada por terminal [n_terms].
+    """
+    r_terms, zenith_terms = stations_ecef(lat_deg, lon_deg)
+    n_terms = len(r_terms)
+
+    weights = (
+        np.ones(n_terms) if weights is None
+        else np.asarray(weights, dtype=float)
+    )
+    regions = (
+        np.zeros(n_terms, dtype=np.int64) if regions is None
+        else np.asarray(regions, dtype=np.int64)
+    )
+
+    ephemeris = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn
+    )
+
+    return _capacity_pass(
+        ephemeris,
+        r_terms,
+        zenith_terms,
+        min_elevation_rad,
+        weights,
+        regions,
+        max(int(regions.max()) + 1, 1),
+        timeline.dt,
+        params
+    )
@@ -0,0 +1,324 @@
+import numpy as np
+
+from sat_sim.constants import DEG2RAD, R_EARTH
+from sat_sim.frames.transforms import eci_to_ecef_batch
+from sat_sim.access.access import visibility_matrix
+from sat_sim.coverage.gap_stats import GapStatistics
+
+
+def grid_stations_ecef(lat_grid_deg, lon_grid_deg, cell_mask=None):
+    """
+    Posições ECEF e vetores zenith das células do grid (Terra esférica).
+
+    As células são achatadas em ordem [lat, lon] (índice i * n_lon + j).
+    Com cell_mask [n_lat, n_lon], apenas as células marcadas são retornadas.
+    Retorna (r_cells [n_cells, 3], zenith [n_cells, 3]).
+    """
+    lat = np.asarray(lat_grid_deg, dtype=float) * DEG2RAD
+    lon = np.asarray(lon_grid_deg, dtype=float) * DEG2RAD
+
+    lat_2d, lon_2d = np.meshgrid(lat, lon, indexing="ij")
+
+    zenith = np.stack([
+        np.cos(lat_2d) * np.cos(lon_2d),
+        np.cos(lat_2d) * np.sin(lon_2d),
+        np.sin(lat_2d),
+    ], axis=-1).reshape(-1, 3)
+
+    if cell_mask is not None:
+        zenith = zenith[np.asarray(cell_mask, dtype=bool).ravel()]
+
+    return R_EARTH * zenith, zenith
+
+
+def stations_ecef(lat_deg, lon_deg):
+    """
+    Posições ECEF e vetores zenith de uma lista de pontos (lat, lon) em
+    graus, Terra esférica. Retorna (r [n, 3], zenith [n, 3]).
+    """
+    lat = np.atleast_1d(np.asarray(lat_deg, dtype=float)) * DEG2RAD
+    lon = np.atleast_1d(np.asarray(lon_deg, dtype=float)) * DEG2RAD
+
+    zenith = np.stack([
+        np.cos(lat) * np.cos(lon),
+        np.cos(lat) * np.sin(lon),
+        np.sin(lat),
+    ], axis=-1)
+
+    return R_EARTH * zenith, zenith
+
+
+def cells_to_grid(values, grid_shape, cell_mask=None, fill_value=np.nan):
+    """
+    Reconstrói o array [n_lat, n_lon, ...] a partir dos valores por célula.
+
+    Células fora de cell_mask recebem fill_value.
+    """
+    values = np.asarray(values)
+
+    if cell_mask is None:
+        return values.reshape(tuple(grid_shape) + values.shape[1:])
+
+    dtype = np.result_type(values.dtype, np.asarray(fill_value).dtype)
+    out = np.full(tuple(grid_shape) + values.shape[1:], fill_value, dtype=dtype)
+    out[np.asarray(cell_mask, dtype=bool)] = values
+
+    return out
+
+
+def propagate_constellation_ecef(
+    constellation,
+    timeline,
+    propagate_fn,
+    with_velocity=False
+):
+    """
+    Propaga todos os satélites uma vez e converte para ECEF.
+
+    Retorna efemérides [n_steps, n_sats, 3]. Com with_velocity=True
+    retorna (r_ecef, v_ecef), onde v_ecef é a velocidade inercial
+    expressa em eixos ECEF (usada pelos modelos de atitude).
+    """
+    positions = []
+    velocities = []
+
+    for r0, v0 in constellation:
+        rs, vs = propagate_fn(r0, v0, timeline)
+        positions.append(rs)
+        velocities.append(vs)
+
+    r_ecef = eci_to_ecef_batch(np.stack(positions, axis=1), timeline.times)
+
+    if not with_velocity:
+        return r_ecef
+
+    v_ecef = eci_to_ecef_batch(np.stack(velocities, axis=1), timeline.times)
+
+    return r_ecef, v_ecef
+
+
+def iter_propagated_blocks(
+    constellation,
+    timeline,
+    propagate_fn,
+    block_steps
+):
+    """
+    Propaga a constelação em blocos de block_steps instantes, retomando
+    cada bloco do estado final do anterior (mesma sequência de passos da
+    propagação completa), e gera (start, stop, r_ecef, v_ecef) com
+    efemérides [stop - start, n_sats, 3]. Permite interromper a avaliação
+    sem propagar a linha do tempo inteira.
+    """
+    n_steps = len(timeline.times)
+    block_steps = max(1, int(block_steps))
+
+    states = list(constellation)
+
+    for start in range(0, n_steps, block_steps):
+        stop = min(start + block_steps, n_steps)
+
+        # Um instante extra: estado inicial do próximo bloco
+        window = timeline.window(start, min(stop + 1, n_steps))
+
+        positions = []
+        velocities = []
+        next_states = []
+
+        for r0, v0 in states:
+            rs, vs = propagate_fn(r0, v0, window)
+            positions.append(rs[:stop - start])
+            velocities.append(vs[:stop - start])
+            next_states.append((rs[-1], vs[-1]))
+
+        states = next_states
+        times = timeline.times[start:stop]
+
+        yield (
+            start,
+            stop,
+            eci_to_ecef_batch(np.stack(positions, axis=1), times),
+            eci_to_ecef_batch(np.stack(velocities, axis=1), times),
+        )
+
+
+def iter_grid_visibility_matrix(
+    ephemeris_ecef,
+    r_cells,
+    zenith_cells,
+    min_elevation_rad
+):
+    """
+    Gera, passo a passo, a matriz de visibilidade célula x satélite.
+
+    Para cada instante k produz (k, vis[n_cells, n_sats]).
+    """
+    for k, r_sats in enumerate(ephemeris_ecef):
+        yield k, visibility_matrix(
+            r_sats,
+            r_cells,
+            zenith_cells,
+            min_elevation_rad
+        )
+
+
+def iter_grid_visibility(
+    ephemeris_ecef,
+    r_cells,
+    zenith_cells,
+    min_elevation_rad
+):
+    """
+    Gera, passo a passo, a máscara de cobertura das células.
+
+    Para cada instante k produz (k, visible[n_cells]), onde visible indica
+    se ao menos um satélite está acima da elevação mínima. Apenas um passo
+    é mantido em memória por vez.
+    """
+    for k, vis in iter_grid_visibility_matrix(
+        ephemeris_ecef,
+        r_cells,
+        zenith_cells,
+        min_elevation_rad
+    ):
+        yield k, vis.any(axis=1)
+
+
+class WeightedVisibility:
+    """
+    Acumulador, por passo, do peso (ex.: tráfego) das células em visada:
+    served [n_steps] = w @ visível e in_view [n_steps, n_sats] = w @ vis
+    (peso visto por cada satélite). Blocos disjuntos de células somam
+    (ver sum).
+    """
+
+    def __init__(self, weights, n_steps, n_sats):
+        self.weights = np.asarray(weights, dtype=float)
+        self.served = np.zeros(n_steps)
+        self.in_view = np.zeros((n_steps, n_sats))
+
+    def update(self, k, vis, visible):
+        self.in_view[k] = self.weights @ vis
+        self.served[k] = self.weights @ visible
+
+    @classmethod
+    def sum(cls, parts):
+        """
+        Junta acumuladores de blocos disjuntos de células.
+        """
+        merged = cls(
+            np.concatenate([p.weights for p in parts]),
+            *parts[0].in_view.shape
+        )
+        merged.served = np.sum([p.served for p in parts], axis=0)
+        merged.in_view = np.sum([p.in_view for p in parts], axis=0)
+
+        return merged
+
+
+def accumulate_grid_pass(
+    ephemeris_ecef,
+    r_cells,
+    zenith_cells,
+    min_elevation_rad,
+    dt,
+    bins=None,
+    weights=None,
+    n_workers=None,
+    tile_size=None,
+    observers=None
+):
+    """
+    Uma passada temporal sobre as células: GapStatistics e, com weights
+    [n_cells], WeightedVisibility, a partir da mesma matriz de
+    visibilidade de cada passo.
+
+    bins: {"gap": edges|None, "pass": ..., "revisit": ...}
+    n_workers > 1 divide as células em blocos processados em paralelo
+    (ver coverage.parallel); o resultado é idêntico ao serial.
+
+    observers: acumuladores com update(k, vis) que recebem a matriz de
+    visibilidade [n_cells, n_sats] de cada passo (ex.: AlohaCapacity).
+    Com n_workers > 1 cada bloco recebe observer.tile(start, stop) e o
+    observer original junta os blocos com merge(parts).
+
+    Retorna (stats, weighted); weighted é None sem weights.
+    """
+    bins = bins or {}
+    observers = observers or ()
+
+    if n_workers is not None and n_workers > 1:
+        from sat_sim.coverage.parallel import accumulate_tiled
+
+        return accumulate_tiled(
+            ephemeris_ecef,
+            r_cells,
+            zenith_cells,
+            min_elevation_rad,
+            dt,
+            bins,
+            weights=weights,
+            n_workers=n_workers,
+            tile_size=tile_size,
+            observers=observers
+        )
+
+    stats = GapStatistics(
+        n_cells=len(r_cells),
+        dt=dt,
+        gap_bins_s=bins.get("gap"),
+        pass_bins_s=bins.get("pass"),
+        revisit_bins_s=bins.get("revisit")
+    )
+
+    weighted = None
+    if weights is not None:
+        weighted = WeightedVisibility(weights, *ephemeris_ecef.shape[:2])
+
+    for k, vis in iter_grid_visibility_matrix(
+        ephemeris_ecef,
+        r_cells,
+        zenith_cells,
+        min_elevation_rad
+    ):
+        visible = vis.any(axis=1)
+
+        stats.update(visible)
+
+        if weighted is not None:
+            weighted.update(k, vis, visible)
+
+        for observer in observers:
+            observer.update(k, vis)
+
+    stats.finalize()
+
+    return stats, weighted
+
+
+def accumulate_gap_statistics(
+    ephemeris_ecef,
+    r_cells,
+    zenith_cells,
+    min_elevation_rad,
+    dt,
+    bins=None,
+    n_workers=None,
+    tile_size=None
+):
+    """
+    Percorre a linha do tempo e acumula GapStatistics para as células
+    (accumulate_grid_pass sem pesos).
+    """
+    stats, _ = accumulate_grid_pass(
+        ephemeris_ecef,
+        r_cells,
+        zenith_cells,
+        min_elevation_rad,
+        dt,
+        bins=bins,
+        n_workers=n_workers,
+        tile_size=tile_size
+    )
+
+    return stats
@@ -0,0 +1,228 @@
+import numpy as np
+
+
+def default_duration_bins(timeline, bin_width_s, max_duration_s=None):
+    """
+    Bordas de histograma [s] de 0 até a duração total da simulação
+    (ou max_duration_s), com largura múltipla de dt.
+    """
+    t_total = timeline.times[-1] + timeline.dt - timeline.times[0]
+
+    if max_duration_s is not None:
+        t_total = min(t_total, max_duration_s)
+
+    width = max(timeline.dt, timeline.dt * round(bin_width_s / timeline.dt))
+    n_bins = max(1, int(np.ceil(t_total / width)))
+
+    return np.arange(n_bins + 1) * width
+
+
+class GapStatistics:
+    """
+    Acumulador streaming de gaps, passes e revisits por célula.
+
+    Recebe a máscara de cobertura de cada passo (update) e mantém apenas o
+    estado corrente de cada célula, máximos, somas e histogramas de
+    contagem. Nenhum intervalo é armazenado.
+
+    Convenções iguais às de access.intervals:
+    - passe = sequência de passos visíveis, duração n * dt
+    - gap = sequência de passos sem acesso, incluindo gaps inicial e final
+    - revisit = tempo entre inícios de passes consecutivos
+
+    Durações acima da última borda de um histograma são contadas no
+    último bin (o máximo exato é mantido à parte).
+    """
+
+    KINDS = ("gap", "pass", "revisit")
+
+    def __init__(
+        self,
+        n_cells,
+        dt,
+        gap_bins_s=None,
+        pass_bins_s=None,
+        revisit_bins_s=None
+    ):
+        self.n_cells = n_cells
+        self.dt = float(dt)
+
+        self.bins = {
+            "gap": gap_bins_s,
+            "pass": pass_bins_s,
+            "revisit": revisit_bins_s,
+        }
+        self.histograms = {
+            kind: (
+                None if edges is None
+                else np.zeros((n_cells, len(edges) - 1), dtype=np.int32)
+            )
+            for kind, edges in self.bins.items()
+        }
+
+        self.max = {kind: np.zeros(n_cells) for kind in self.KINDS}
+        self.sum = {kind: np.zeros(n_cells) for kind in self.KINDS}
+        self.count = {
+            kind: np.zeros(n_cells, dtype=np.int64) for kind in self.KINDS
+        }
+
+        self.visible_steps = np.zeros(n_cells, dtype=np.int64)
+
+        self._n_steps = 0
+        self._prev = None
+        self._run_start = np.zeros(n_cells, dtype=np.int64)
+        self._last_pass_start = np.full(n_cells, -1, dtype=np.int64)
+
+    def _record(self, kind, cells, durations):
+        if len(cells) == 0:
+            return
+
+        np.maximum.at(self.max[kind], cells, durations)
+        np.add.at(self.sum[kind], cells, durations)
+        np.add.at(self.count[kind], cells, 1)
+
+        hist = self.histograms[kind]
+        if hist is not None:
+            edges = self.bins[kind]
+            idx = np.searchsorted(edges, durations, side="right") - 1
+            idx = np.clip(idx, 0, hist.shape[1] - 1)
+            np.add.at(hist, (cells, idx), 1)
+
+    def _start_passes(self, cells, k):
+        has_prev = self._last_pass_start[cells] >= 0
+        revisit_cells = cells[has_prev]
+
+        self._record(
+            "revisit",
+            revisit_cells,
+            (k - self._last_pass_start[revisit_cells]) * self.dt
+        )
+        self._last_pass_start[cells] = k
+
+    def update(self, visible):
+        """
+        Processa a máscara booleana [n_cells] do próximo passo.
+        """
+        visible = np.asarray(visible, dtype=bool)
+        k = self._n_steps
+
+        self.visible_steps += visible
+
+        if self._prev is None:
+            self._start_passes(np.flatnonzero(visible), k)
+        else:
+            changed = visible != self._prev
+
+            ended_pass = np.flatnonzero(changed & self._prev)
+            ended_gap = np.flatnonzero(changed & ~self._prev)
+
+            self._record(
+                "pass",
+                ended_pass,
+                (k - self._run_start[ended_pass]) * self.dt
+            )
+            self._record(
+                "gap",
+                ended_gap,
+                (k - self._run_start[ended_gap]) * self.dt
+            )
+            self._start_passes(ended_gap, k)
+
+            self._run_start[changed] = k
+
+        self._prev = visible
+        self._n_steps += 1
+
+    def finalize(self):
+        """
+        Fecha o passe ou gap em andamento no fim da janela.
+        """
+        if self._prev is None:
+            return
+
+        k = self._n_steps
+        in_pass = np.flatnonzero(self._prev)
+        in_gap = np.flatnonzero(~self._prev)
+
+        self._record("pass", in_pass, (k - self._run_start[in_pass]) * self.dt)
+        self._record("gap", in_gap, (k - self._run_start[in_gap]) * self.dt)
+
+        self._prev = None
+
+    @classmethod
+    def concatenate(cls, parts):
+        """
+        Junta acumuladores de blocos disjuntos de células (na ordem dada)
+        em um único acumulador. Todos devem estar finalizados.
+        """
+        first = parts[0]
+
+        merged = cls(
+            n_cells=sum(p.n_cells for p in parts),
+            dt=first.dt,
+            gap_bins_s=first.bins["gap"],
+            pass_bins_s=first.bins["pass"],
+            revisit_bins_s=first.bins["revisit"]
+        )
+
+        for kind in cls.KINDS:
+            merged.max[kind] = np.concatenate([p.max[kind] for p in parts])
+            merged.sum[kind] = np.concatenate([p.sum[kind] for p in parts])
+            merged.count[kind] = np.concatenate([p.count[kind] for p in parts])
+
+            if merged.histograms[kind] is not None:
+                merged.histograms[kind] = np.concatenate(
+                    [p.histograms[kind] for p in parts]
+                )
+
+        merged.visible_steps = np.concatenate([p.visible_steps for p in parts])
+        merged._n_steps = first._n_steps
+
+        return merged
+
+    def coverage_fraction(self):
+        return self.visible_steps / max(self._n_steps, 1)
+
+    def mean(self, kind):
+        """
+        Média por célula (NaN onde não houve ocorrência).
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(
+                self.count[kind] > 0,
+                self.sum[kind] / self.count[kind],
+                np.nan
+            )
+
+    def percentile(self, kind, q):
+        """
+        Percentil q (0-100) por célula, estimado a partir do histograma
+        com interpolação linear dentro do bin (limitado ao máximo exato).
+
+        Retorna NaN nas células sem ocorrências.
+        """
+        hist = self.histograms[kind]
+        if hist is None:
+            raise ValueError(f"Histograma '{kind}' não configurado")
+
+        edges = np.asarray(self.bins[kind], dtype=float)
+
+        total = hist.sum(axis=1)
+        cdf = np.cumsum(hist, axis=1)
+        target = (q / 100.0) * total
+
+        b = np.argmax(cdf >= target[:, None], axis=1)
+        rows = np.arange(self.n_cells)
+
+        in_bin = hist[rows, b]
+        below = cdf[rows, b] - in_bin
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = np.where(in_bin > 0, (target - below) / in_bin, 0.0)
+
+        value = edges[b] + frac * (edges[b + 1] - edges[b])
+
+        # A interpolação não deve ultrapassar o máximo exato observado
+        value = np.minimum(value, self.max[kind])
+
+        return np.where(total > 0, value, np.nan)
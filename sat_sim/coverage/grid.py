@@ -1,8 +1,12 @@
 import numpy as np
 
-from sat_sim.frames.transforms import eci_to_ecef
-from sat_sim.access.access import is_visible
-from sat_sim.ground.stations import GroundStation
+from sat_sim.coverage.engine import (
+    grid_stations_ecef,
+    cells_to_grid,
+    propagate_constellation_ecef,
+    iter_grid_visibility,
+    accumulate_gap_statistics
+)
 
 
 def compute_grid_coverage(
@@ -12,51 +16,119 @@ def compute_grid_coverage(
     propagate_fn,
     min_elevation_rad,
     lat_grid_deg,
-    lon_grid_deg
+    lon_grid_deg,
+    cell_mask=None,
+    n_workers=None
 ):
     """
     Calcula a fração de tempo coberta em cada ponto do grid.
     Retorna array [n_lat, n_lon] com valores em [0,1].
+
+    Com cell_mask (ex.: roi_cell_mask), apenas as células marcadas são
+    avaliadas; as demais recebem NaN.
+
+    n_workers > 1 distribui blocos de células em processos paralelos.
     """
 
     n_lat = len(lat_grid_deg)
     n_lon = len(lon_grid_deg)
 
-    coverage = np.zeros((n_lat, n_lon))
-    total_steps = len(timeline.times)
-
-    # Pré-criar estações do grid
-    stations = [
-        [
-            GroundStation(lat_deg=lat, lon_deg=lon)
-            for lon in lon_grid_deg
-        ]
-        for lat in lat_grid_deg
-    ]
+    # Células do grid (apenas as da máscara, se houver)
+    r_cells, zenith_cells = grid_stations_ecef(
+        lat_grid_deg,
+        lon_grid_deg,
+        cell_mask
+    )
 
     # Propagar todos os satélites uma vez
-    sat_states = []
+    ephemeris = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn
+    )
+
+    stats = accumulate_gap_statistics(
+        ephemeris,
+        r_cells,
+        zenith_cells,
+        min_elevation_rad,
+        timeline.dt,
+        n_workers=n_workers
+    )
+
+    return cells_to_grid(
+        stats.coverage_fraction(),
+        (n_lat, n_lon),
+        cell_mask
+    )
+
+
+def iter_grid_coverage_frames(
+    *,
+    constellation,
+    timeline,
+    propagate_fn,
+    min_elevation_rad,
+    lat_grid_deg,
+    lon_grid_deg,
+    window_steps=1,
+    cell_mask=None
+):
+    """
+    Gera quadros de cobertura resolvidos no tempo.
+
+    Para cada janela de window_steps passos produz (t_start, frame), onde
+    frame [n_lat, n_lon] é a fração da janela coberta em cada célula
+    (window_steps=1 -> cobertura instantânea 0/1). Apenas a janela
+    corrente é mantida em memória; o cubo tempo x grid nunca é montado.
+    """
+
+    n_lat = len(lat_grid_deg)
+    n_lon = len(lon_grid_deg)
+
+    window_steps = max(1, int(window_steps))
+
+    r_cells, zenith_cells = grid_stations_ecef(
+        lat_grid_deg,
+        lon_grid_deg,
+        cell_mask
+    )
 
-    for sat in constellation:
-        r0, v0 = sat
-        rs, _ = propagate_fn(r0, v0, timeline)
-        sat_states.append(rs)
+    ephemeris = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn
+    )
 
-    # Loop temporal
-    for k, t in enumerate(timeline.times):
-        for i in range(n_lat):
-            for j in range(n_lon):
-                station = stations[i][j]
+    window = np.zeros(len(r_cells))
+    n_in_window = 0
+    t_start = timeline.times[0]
 
-                visible = False
+    for k, visible in iter_grid_visibility(
+        ephemeris,
+        r_cells,
+        zenith_cells,
+        min_elevation_rad
+    ):
+        if n_in_window == 0:
+            t_start = timeline.times[k]
 
-                for rs in sat_states:
-                    r_ecef = eci_to_ecef(rs[k], t)
-                    if is_visible(r_ecef, station, min_elevation_rad):
-                        visible = True
-                        break
+        window += visible
+        n_in_window += 1
 
-                if visible:
-                    coverage[i, j] += 1
+        if n_in_window == window_steps:
+            yield t_start, cells_to_grid(
+                window / n_in_window,
+                (n_lat, n_lon),
+                cell_mask
+            )
+            window = np.zeros(len(r_cells))
+            n_in_window = 0
 
-    return coverage / total_steps
+    # Última janela incompleta
+    if n_in_window > 0:
+        yield t_start, cells_to_grid(
+            window / n_in_window,
+            (n_lat, n_lon),
+            cell_mask
+        )
@@ -1,12 +1,16 @@
 import numpy as np
 
-from sat_sim.frames.transforms import eci_to_ecef
-from sat_sim.access.access import is_visible
-from sat_sim.access.intervals import (
-    compute_access_intervals,
-    max_gap
+from sat_sim.coverage.engine import (
+    grid_stations_ecef,
+    cells_to_grid,
+    propagate_constellation_ecef,
+    accumulate_grid_pass
 )
-from sat_sim.ground.stations import GroundStation
+from sat_sim.coverage.capacity import AlohaCapacity, terminal_load
+from sat_sim.coverage.gap_stats import GapStatistics, default_duration_bins
+
+
+DEFAULT_PERCENTILES = (50, 95, 99)
 
 
 def compute_grid_max_gap(
@@ -16,57 +20,250 @@ def compute_grid_max_gap(
     propagate_fn,
     min_elevation_rad,
     lat_grid_deg,
-    lon_grid_deg
+    lon_grid_deg,
+    cell_mask=None,
+    n_workers=None
 ):
     """
     Calcula o gap máximo (em segundos) para cada célula do grid.
     Retorna array [n_lat, n_lon].
+
+    Com cell_mask (ex.: roi_cell_mask), apenas as células marcadas são
+    avaliadas; as demais recebem NaN.
+
+    n_workers > 1 distribui blocos de células em processos paralelos.
+    """
+
+    stats = compute_grid_gap_statistics(
+        constellation=constellation,
+        timeline=timeline,
+        propagate_fn=propagate_fn,
+        min_elevation_rad=min_elevation_rad,
+        lat_grid_deg=lat_grid_deg,
+        lon_grid_deg=lon_grid_deg,
+        cell_mask=cell_mask,
+        n_workers=n_workers,
+        gap_bins_s=False,
+        pass_bins_s=False,
+        revisit_bins_s=False
+    )
+
+    return stats["max_gap_s"]
+
+
+def compute_grid_gap_statistics(
+    *,
+    constellation,
+    timeline,
+    propagate_fn,
+    min_elevation_rad,
+    lat_grid_deg,
+    lon_grid_deg,
+    cell_mask=None,
+    n_workers=None,
+    gap_bins_s=None,
+    pass_bins_s=None,
+    revisit_bins_s=None,
+    percentiles=DEFAULT_PERCENTILES,
+    weights=None,
+    aloha_params=None,
+    regions=None
+):
+    """
+    Calcula, em uma única passada temporal, o gap máximo e a distribuição
+    de gaps, passes e revisits de cada célula do grid.
+
+    As distribuições são mantidas como histogramas por célula (sem guardar
+    intervalos). Bordas dos bins [s]:
+    - None  -> default (gap/revisit: 10 min; passe: dt até 1 h)
+    - False -> histograma desativado
+    - array -> bordas explícitas
+
+    Com cell_mask [n_lat, n_lon], apenas as células marcadas são avaliadas
+    e as demais recebem NaN. n_workers > 1 distribui blocos de células em
+    processos paralelos (efemérides em memória compartilhada).
+
+    weights [n_lat, n_lon] (ex.: density_weights): métricas ponderadas
+    acumuladas na mesma passada (células com peso 0 não contam).
+    Com aloha_params (AlohaParams), os pesos são também terminais
+    slotted-ALOHA e result["capacity"] traz as métricas de
+    compute_grid_capacity_metrics com as mesmas efemérides. A carga de
+    cada satélite soma todas as células com peso > 0 do grid, dentro ou
+    fora de cell_mask (terminal_load, passada de visibilidade própria);
+    detecção e vazão são das células avaliadas, com regions [n_lat,
+    n_lon] como em compute_grid_capacity_metrics (None = uma região com
+    as células avaliadas, ex. a ROI).
+
+    Retorna dicionário com arrays [n_lat, n_lon]:
+        max_gap_s, max_pass_s, coverage_fraction, n_passes,
+        mean_gap_s, mean_pass_s, mean_revisit_s,
+        {gap,pass,revisit}_percentiles_s: {q: array},
+        {gap,pass,revisit}_histogram: [n_lat, n_lon, n_bins],
+        {gap,pass,revisit}_bins_s: bordas usadas
+    e, com weights:
+        weighted_availability       fração do peso-tempo em visada [0,1]
+        weighted_mean_max_gap_s     média dos gaps máximos, ponderada
+        weighted_cells_worst_gap_s  maior gap entre células com peso > 0
+                                    (máximo simples, sem ponderação)
+        served_fraction             [n_steps] fração do peso em visada
+        weight_in_view              [n_steps, n_sats] peso visto por
+                                    satélite
     """
 
     n_lat = len(lat_grid_deg)
     n_lon = len(lon_grid_deg)
 
-    max_gap_grid = np.zeros((n_lat, n_lon))
+    bins = {
+        "gap": gap_bins_s,
+        "pass": pass_bins_s,
+        "revisit": revisit_bins_s,
+    }
+    defaults = {
+        "gap": default_duration_bins(timeline, 600.0),
+        "pass": default_duration_bins(timeline, timeline.dt, 3600.0),
+        "revisit": default_duration_bins(timeline, 600.0),
+    }
 
-    # Estações virtuais
-    stations = [
-        [
-            GroundStation(lat_deg=lat, lon_deg=lon)
-            for lon in lon_grid_deg
-        ]
-        for lat in lat_grid_deg
-    ]
+    for kind, edges in bins.items():
+        if edges is None:
+            bins[kind] = defaults[kind]
+        elif edges is False:
+            bins[kind] = None
+        else:
+            bins[kind] = np.asarray(edges, dtype=float)
+
+    r_cells, zenith_cells = grid_stations_ecef(
+        lat_grid_deg,
+        lon_grid_deg,
+        cell_mask
+    )
 
     # Propagar todos os satélites uma vez
-    sat_states = []
+    ephemeris = propagate_constellation_ecef(
+        constellation,
+        timeline,
+        propagate_fn
+    )
 
-    for sat in constellation:
-        r0, v0 = sat
-        rs, _ = propagate_fn(r0, v0, timeline)
-        sat_states.append(rs)
+    def cells(values):
+        values = np.asarray(values)
+        return (
+            values.ravel() if cell_mask is None
+            else values[np.asarray(cell_mask, dtype=bool)]
+        )
 
-    t_end = timeline.times[-1] + timeline.dt
+    cell_weights = None
+    if weights is not None:
+        cell_weights = cells(np.asarray(weights, dtype=float))
 
-    # Loop por célula
-    for i in range(n_lat):
-        for j in range(n_lon):
-            station = stations[i][j]
+    capacity = None
+    if aloha_params is not None:
+        if cell_weights is None:
+            raise ValueError("aloha_params requer weights (terminais)")
 
-            visible_times = []
+        if regions is None:
+            regions = np.zeros((n_lat, n_lon), dtype=np.int64)
+        regions = np.asarray(regions, dtype=np.int64)
 
-            for k, t in enumerate(timeline.times):
-                for rs in sat_states:
-                    r_ecef = eci_to_ecef(rs[k], t)
-                    if is_visible(r_ecef, station, min_elevation_rad):
-                        visible_times.append(t)
-                        break
+        # Carga: todo o tráfego do grid, não só o das células avaliadas
+        load_cells = np.asarray(weights, dtype=float) > 0
+        r_load, zenith_load = grid_stations_ecef(
+            lat_grid_deg,
+            lon_grid_deg,
+            load_cells
+        )
 
-            intervals = compute_access_intervals(
-                visible_times,
-                timeline.dt
+        capacity = AlohaCapacity(
+            cell_weights,
+            cells(regions),
+            max(int(regions.max()) + 1, 1),
+            *ephemeris.shape[:2],
+            timeline.dt,
+            aloha_params,
+            terminals_in_view=terminal_load(
+                ephemeris,
+                r_load,
+                zenith_load,
+                min_elevation_rad,
+                np.asarray(weights, dtype=float)[load_cells],
+                timeline.dt,
+                n_workers=n_workers
             )
+        )
+
+    stats, weighted = accumulate_grid_pass(
+        ephemeris,
+        r_cells,
+        zenith_cells,
+        min_elevation_rad,
+        timeline.dt,
+        bins=bins,
+        weights=cell_weights,
+        n_workers=n_workers,
+        observers=None if capacity is None else [capacity]
+    )
+
+    def to_grid(values):
+        return cells_to_grid(values, (n_lat, n_lon), cell_mask)
+
+    result = {
+        "max_gap_s": to_grid(stats.max["gap"]),
+        "max_pass_s": to_grid(stats.max["pass"]),
+        "coverage_fraction": to_grid(stats.coverage_fraction()),
+        "n_passes": to_grid(stats.count["pass"]),
+        "mean_gap_s": to_grid(stats.mean("gap")),
+        "mean_pass_s": to_grid(stats.mean("pass")),
+        "mean_revisit_s": to_grid(stats.mean("revisit")),
+    }
+
+    for kind in GapStatistics.KINDS:
+        if bins[kind] is None:
+            continue
+
+        result[f"{kind}_bins_s"] = bins[kind]
+        result[f"{kind}_histogram"] = to_grid(stats.histograms[kind])
+        result[f"{kind}_percentiles_s"] = {
+            q: to_grid(stats.percentile(kind, q)) for q in percentiles
+        }
+
+    if weighted is not None:
+        result.update(_weighted_metrics(stats, weighted))
+
+    if capacity is not None:
+        result["capacity"] = capacity.result()
+
+        # Como em compute_grid_capacity_metrics: NaN sem terminais
+        result["capacity"]["detection_probability"] = to_grid(np.where(
+            cell_weights > 0,
+            result["capacity"]["detection_probability"],
+            np.nan
+        ))
+
+    return result
+
+
+def _weighted_metrics(stats, weighted):
+    w = weighted.weights
+    w_total = w.sum()
+
+    coverage = stats.coverage_fraction()
+    cell_max_gap = stats.max["gap"]
+
+    if w_total > 0:
+        metrics = {
+            "weighted_availability": float(w @ coverage / w_total),
+            "weighted_mean_max_gap_s": float(w @ cell_max_gap / w_total),
+            "weighted_cells_worst_gap_s": float(cell_max_gap[w > 0].max()),
+            "served_fraction": weighted.served / w_total,
+        }
+    else:
+        metrics = {
+            "weighted_availability": 0.0,
+            "weighted_mean_max_gap_s": np.nan,
+            "weighted_cells_worst_gap_s": np.nan,
+            "served_fraction": np.zeros_like(weighted.served),
+        }
 
-            gap = max_gap(intervals, 0.0, t_end)
-            max_gap_grid[i, j] = gap
+    metrics["weight_in_view"] = weighted.in_view
 
-    return max_gap_grid
+    return metrics
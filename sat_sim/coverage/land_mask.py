@@ -0,0 +1,116 @@
+import hashlib
+import os
+from functools import lru_cache
+
+import numpy as np
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sat_sim")
+
+
+def default_cache_dir():
+    """
+    Diretório do cache em disco: $SAT_SIM_CACHE_DIR ou ~/.cache/sat_sim.
+    """
+    return os.environ.get("SAT_SIM_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+def land_cell_mask(
+    lat_grid_deg,
+    lon_grid_deg,
+    resolution="110m",
+    cache_dir=None
+):
+    """
+    Máscara booleana [n_lat, n_lon]: True nas células cujo centro está
+    sobre terra (polígonos Natural Earth 'land' via Cartopy).
+
+    A rasterização é feita uma única vez por definição de grid e
+    resolução: o resultado é salvo em disco (cache_dir, default
+    default_cache_dir()) e mantido em memória. O array retornado é
+    somente leitura.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    return _cached_land_mask(
+        tuple(np.asarray(lat_grid_deg, dtype=float)),
+        tuple(np.asarray(lon_grid_deg, dtype=float)),
+        resolution,
+        cache_dir
+    )
+
+
+def ocean_cell_mask(
+    lat_grid_deg,
+    lon_grid_deg,
+    resolution="110m",
+    cache_dir=None
+):
+    """
+    Máscara das células oceânicas (modo marítimo): complemento de
+    land_cell_mask. Pode ser combinada com uma ROI (roi_mask & ocean).
+    """
+    return ~land_cell_mask(lat_grid_deg, lon_grid_deg, resolution, cache_dir)
+
+
+def grid_key(lat_grid_deg, lon_grid_deg, resolution):
+    """
+    Hash estável da definição do grid (nome do arquivo de cache).
+    """
+    h = hashlib.sha1()
+    h.update(np.asarray(lat_grid_deg, dtype=float).tobytes())
+    h.update(np.asarray(lon_grid_deg, dtype=float).tobytes())
+    h.update(resolution.encode())
+
+    return h.hexdigest()[:16]
+
+
+@lru_cache(maxsize=16)
+def _cached_land_mask(lat_key, lon_key, resolution, cache_dir):
+    lat_grid = np.array(lat_key)
+    lon_grid = np.array(lon_key)
+
+    path = os.path.join(
+        cache_dir,
+        f"land_{resolution}_{grid_key(lat_grid, lon_grid, resolution)}.npy"
+    )
+
+    if os.path.exists(path):
+        mask = np.load(path)
+    else:
+        mask = rasterize_land(lat_grid, lon_grid, resolution)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(path, mask)
+
+    mask = np.asarray(mask, dtype=bool)
+    mask.setflags(write=False)
+
+    return mask
+
+
+def rasterize_land(lat_grid_deg, lon_grid_deg, resolution="110m"):
+    """
+    Rasteriza os polígonos de terra do Natural Earth nos centros das
+    células do grid (sem cache).
+    """
+    import shapely
+    from cartopy.io import shapereader
+
+    path = shapereader.natural_earth(
+        resolution=resolution,
+        category="physical",
+        name="land"
+    )
+
+    land = shapely.union_all(list(shapereader.Reader(path).geometries()))
+    shapely.prepare(land)
+
+    lat_2d, lon_2d = np.meshgrid(
+        np.asarray(lat_grid_deg, dtype=float),
+        np.asarray(lon_grid_deg, dtype=float),
+        indexing="ij"
+    )
+
+    return shapely.intersects_xy(land, lon_2d, lat_2d)
@@ -0,0 +1,220 @@
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from sat_sim.coverage.gap_stats import GapStatistics
+from sat_sim.coverage.engine import WeightedVisibility, accumulate_grid_pass
+
+
+# Efemérides compartilhadas, anexadas uma vez por chamada em cada worker
+_WORKER_EPHEMERIS = None
+_WORKER_SHM = None
+
+# Pool persistente, reutilizado entre chamadas (ex.: arquiteturas de um
+# sweep); recriado apenas se o número de workers mudar
+_POOL = None
+_POOL_WORKERS = None
+
+
+def default_n_workers():
+    """
+    Número de workers default: todos os núcleos disponíveis.
+    """
+    return os.cpu_count() or 1
+
+
+def split_tiles(n_cells, n_workers, tile_size=None):
+    """
+    Divide [0, n_cells) em blocos contíguos (start, stop).
+
+    Default: ~4 blocos por worker, para balancear carga.
+    """
+    if tile_size is None:
+        tile_size = int(np.ceil(n_cells / (4 * n_workers)))
+
+    tile_size = max(1, int(tile_size))
+
+    return [
+        (start, min(start + tile_size, n_cells))
+        for start in range(0, n_cells, tile_size)
+    ]
+
+
+def get_pool(n_workers):
+    """
+    ProcessPoolExecutor persistente com n_workers processos.
+    """
+    global _POOL, _POOL_WORKERS
+
+    if _POOL is None or _POOL_WORKERS != n_workers:
+        shutdown_pool()
+        _POOL = ProcessPoolExecutor(max_workers=n_workers)
+        _POOL_WORKERS = n_workers
+
+    return _POOL
+
+
+def shutdown_pool():
+    """
+    Encerra o pool persistente (chamado também na saída do processo).
+    """
+    global _POOL, _POOL_WORKERS
+
+    if _POOL is not None:
+        _POOL.shutdown()
+
+    _POOL = None
+    _POOL_WORKERS = None
+
+
+atexit.register(shutdown_pool)
+
+
+def _attach_ephemeris(name, shape, dtype):
+    global _WORKER_EPHEMERIS, _WORKER_SHM
+
+    # Bloco de uma chamada anterior: solta o mapeamento antigo
+    if _WORKER_SHM is not None and _WORKER_SHM.name != name:
+        _WORKER_EPHEMERIS = None
+        _WORKER_SHM.close()
+        _WORKER_SHM = None
+
+    if _WORKER_SHM is None:
+        _WORKER_SHM = shared_memory.SharedMemory(name=name)
+        _WORKER_EPHEMERIS = np.ndarray(
+            shape,
+            dtype=dtype,
+            buffer=_WORKER_SHM.buf
+        )
+
+    return _WORKER_EPHEMERIS
+
+
+def _run_tile(
+    shm_spec,
+    r_cells,
+    zenith_cells,
+    min_elevation_rad,
+    dt,
+    bins,
+    weights,
+    observers
+):
+    stats, weighted = accumulate_grid_pass(
+        _attach_ephemeris(*shm_spec),
+        r_cells,
+        zenith_cells,
+        min_elevation_rad,
+        dt,
+        bins,
+        weights,
+        observers=observers
+    )
+
+    # Observers atualizados no worker voltam ao processo principal
+    return stats, weighted, observers
+
+
+def accumulate_tiled(
+    ephemeris_ecef,
+    r_cells,
+    zenith_cells,
+    min_elevation_rad,
+    dt,
+    bins,
+    weights=None,
+    n_workers=None,
+    tile_size=None,
+    observers=()
+):
+    """
+    Versão multi-processo de accumulate_grid_pass; retorna
+    (stats, weighted). Cada observer é dividido por bloco
+    (observer.tile) e os blocos são juntados com observer.merge.
+
+    As efemérides ECEF [n_steps, n_sats, 3] são copiadas uma única vez
+    para multiprocessing.shared_memory e lidas sem cópia pelos workers
+    do pool persistente (get_pool), reutilizado entre chamadas. Cada
+    worker processa um bloco de células; os blocos são juntados na ordem
+    original, então o resultado é determinístico e idêntico ao serial.
+    """
+    if n_workers is None:
+        n_workers = default_n_workers()
+
+    n_cells = len(r_cells)
+    tiles = split_tiles(n_cells, n_workers, tile_size)
+
+    if len(tiles) <= 1:
+        return accumulate_grid_pass(
+            ephemeris_ecef,
+            r_cells,
+            zenith_cells,
+            min_elevation_rad,
+            dt,
+            bins,
+            weights,
+            observers=observers
+        )
+
+    # Antes de copiar as efemérides: observers sem blocos falham aqui
+    tile_observers = [
+        [observer.tile(start, stop) for observer in observers]
+        for start, stop in tiles
+    ]
+
+    ephemeris_ecef = np.ascontiguousarray(ephemeris_ecef, dtype=float)
+
+    shm = shared_memory.SharedMemory(
+        create=True,
+        size=max(ephemeris_ecef.nbytes, 1)
+    )
+    shared = np.ndarray(
+        ephemeris_ecef.shape,
+        dtype=ephemeris_ecef.dtype,
+        buffer=shm.buf
+    )
+
+    try:
+        shared[...] = ephemeris_ecef
+
+        shm_spec = (shm.name, ephemeris_ecef.shape, ephemeris_ecef.dtype)
+        pool = get_pool(n_workers)
+
+        futures = [
+            pool.submit(
+                _run_tile,
+                shm_spec,
+                r_cells[start:stop],
+                zenith_cells[start:stop],
+                min_elevation_rad,
+                dt,
+                bins,
+                None if weights is None else weights[start:stop],
+                tile_observers[i]
+            )
+            for i, (start, stop) in enumerate(tiles)
+        ]
+
+        # Ordem dos blocos preservada -> merge determinístico
+        parts = [f.result() for f in futures]
+
+    finally:
+        del shared
+        shm.close()
+        shm.unlink()
+
+    stats = GapStatistics.concatenate([stats for stats, _, _ in parts])
+
+    for i, observer in enumerate(observers):
+        observer.merge([part_observers[i] for _, _, part_observers in parts])
+
+    if weights is None:
+        return stats, None
+
+    return stats, WeightedVisibility.sum(
+        [weighted for _, weighted, _ in parts]
+    )
+
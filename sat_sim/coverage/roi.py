@@ -0,0 +1,182 @@
+import json
+from functools import lru_cache
+
+import numpy as np
+
+
+ROI_TYPES = ("point", "box", "lat_band", "polygon", "shapefile")
+
+
+def parse_roi(roi_str):
+    """
+    Parse ROI a partir de string (formato de CLI):
+
+      point:lat,lon
+      box:lat_min,lat_max,lon_min,lon_max
+      lat_band:lat_min[,lat_max]
+      polygon:lat1,lon1;lat2,lon2;lat3,lon3[;...]
+      shapefile:caminho.shp[:CAMPO=valor]
+
+    Retorna dicionário {"type": ..., ...}.
+    """
+    kind, _, values = roi_str.partition(":")
+
+    if kind == "point":
+        lat, lon = map(float, values.split(","))
+        return {"type": "point", "lat": lat, "lon": lon}
+
+    if kind == "box":
+        lat_min, lat_max, lon_min, lon_max = map(float, values.split(","))
+        return {
+            "type": "box",
+            "lat_min": lat_min,
+            "lat_max": lat_max,
+            "lon_min": lon_min,
+            "lon_max": lon_max,
+        }
+
+    if kind == "lat_band":
+        limits = list(map(float, values.split(",")))
+        roi = {"type": "lat_band", "lat_min": limits[0]}
+        if len(limits) > 1:
+            roi["lat_max"] = limits[1]
+        return roi
+
+    if kind == "polygon":
+        vertices = [
+            tuple(map(float, vertex.split(",")))
+            for vertex in values.split(";")
+        ]
+        if len(vertices) < 3:
+            raise ValueError("ROI polygon requer ao menos 3 vértices")
+        return {"type": "polygon", "vertices": vertices}
+
+    if kind == "shapefile":
+        path, _, selector = values.partition(":")
+        roi = {"type": "shapefile", "path": path}
+        if selector:
+            field, value = selector.split("=", 1)
+            roi["field"] = field
+            roi["value"] = value
+        return roi
+
+    raise ValueError(f"ROI type não suportado: '{kind}'")
+
+
+def roi_cell_mask(roi, lat_grid_deg, lon_grid_deg):
+    """
+    Máscara booleana [n_lat, n_lon] das células do grid dentro da ROI.
+
+    O cálculo (point-in-polygon incluso) é feito uma única vez por
+    combinação ROI + grid e mantido em cache; o array retornado é
+    somente leitura.
+    """
+    return _cached_roi_mask(
+        json.dumps(roi, sort_keys=True),
+        tuple(np.asarray(lat_grid_deg, dtype=float)),
+        tuple(np.asarray(lon_grid_deg, dtype=float))
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_roi_mask(roi_key, lat_key, lon_key):
+    roi = json.loads(roi_key)
+    lat_grid = np.array(lat_key)
+    lon_grid = np.array(lon_key)
+
+    lat_2d, lon_2d = np.meshgrid(lat_grid, lon_grid, indexing="ij")
+
+    kind = roi["type"]
+
+    if kind == "point":
+        mask = np.zeros(lat_2d.shape, dtype=bool)
+        i = np.argmin(np.abs(lat_grid - roi["lat"]))
+        j = np.argmin(np.abs(lon_grid - roi["lon"]))
+        mask[i, j] = True
+
+    elif kind == "box":
+        in_lat = (lat_2d >= roi["lat_min"]) & (lat_2d <= roi["lat_max"])
+
+        if roi["lon_min"] <= roi["lon_max"]:
+            in_lon = (lon_2d >= roi["lon_min"]) & (lon_2d <= roi["lon_max"])
+        else:
+            # Caixa cruzando o antimeridiano
+            in_lon = (lon_2d >= roi["lon_min"]) | (lon_2d <= roi["lon_max"])
+
+        mask = in_lat & in_lon
+
+    elif kind == "lat_band":
+        # Mesma convenção do desenho em architecture_maps_7c:
+        # banda simétrica nos dois hemisférios
+        abs_lat = np.abs(lat_2d)
+        mask = (
+            (abs_lat >= roi["lat_min"])
+            & (abs_lat <= roi.get("lat_max", 90.0))
+        )
+
+    elif kind in ("polygon", "shapefile"):
+        import shapely
+
+        geometry = roi_geometry(roi)
+        shapely.prepare(geometry)
+        mask = shapely.intersects_xy(geometry, lon_2d, lat_2d)
+
+        # Polígonos menores que a célula: usa a célula mais próxima
+        if not mask.any():
+            p = geometry.representative_point()
+            i = np.argmin(np.abs(lat_grid - p.y))
+            j = np.argmin(np.abs(lon_grid - p.x))
+            mask[i, j] = True
+
+    else:
+        raise ValueError(f"ROI type não suportado: '{kind}'")
+
+    mask = np.asarray(mask, dtype=bool)
+    mask.setflags(write=False)
+
+    return mask
+
+
+def roi_geometry(roi):
+    """
+    Geometria shapely (coordenadas lon, lat em graus) de uma ROI
+    polygon ou shapefile.
+    """
+    if roi["type"] == "polygon":
+        from shapely.geometry import Polygon
+
+        return Polygon([(lon, lat) for lat, lon in roi["vertices"]])
+
+    if roi["type"] == "shapefile":
+        return _load_shapefile_geometry(
+            roi["path"],
+            roi.get("field"),
+            roi.get("value")
+        )
+
+    raise ValueError(f"ROI '{roi['type']}' não possui geometria poligonal")
+
+
+@lru_cache(maxsize=8)
+def _load_shapefile_geometry(path, field=None, value=None):
+    """
+    Lê um shapefile (ex.: EEZ) e retorna a união das geometrias,
+    opcionalmente filtradas por atributo CAMPO == valor.
+    """
+    import shapefile
+    import shapely
+    from shapely.geometry import shape
+
+    geometries = []
+
+    with shapefile.Reader(path) as reader:
+        for record in reader.iterShapeRecords():
+            if field is not None:
+                if str(record.record[field]) != value:
+                    continue
+            geometries.append(shape(record.shape.__geo_interface__))
+
+    if not geometries:
+        raise ValueError(f"Nenhuma geometria selecionada em '{path}'")
+
+    return shapely.union_all(geometries)
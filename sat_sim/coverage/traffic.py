@@ -0,0 +1,238 @@
+import hashlib
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from sat_sim.coverage.grid_gap import compute_grid_gap_statistics
+from sat_sim.coverage.land_mask import default_cache_dir
+
+
+GLOBAL_EXTENT = (-180.0, 180.0, -90.0, 90.0)
+
+
+# -------------------------------------------------
+# Leitura do raster de densidade
+# -------------------------------------------------
+def load_density_samples(path, extent=None):
+    """
+    Lê um raster de densidade de navios (AIS) e retorna amostras
+    (lat_deg, lon_deg, density) como arrays 1D.
+
+    Formatos:
+    - .tif/.tiff: GeoTIFF de banda única (georreferência pelas tags
+      ModelTiepoint/ModelPixelScale; sem tags, usa extent ou global)
+    - .npy: matriz [n_rows, n_cols] norte para cima, cobrindo extent
+      (default global)
+    - .csv: linhas lat,lon,densidade (cabeçalho opcional)
+
+    extent = (lon_min, lon_max, lat_min, lat_max).
+    Valores NaN ou negativos são tratados como zero.
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".csv":
+        data = np.genfromtxt(path, delimiter=",", dtype=float)
+        data = np.atleast_2d(data)
+        data = data[~np.isnan(data[:, :2]).any(axis=1)]
+        lat, lon, density = data[:, 0], data[:, 1], data[:, 2]
+
+    elif ext == ".npy":
+        lat, lon, density = _raster_samples(np.load(path), extent)
+
+    elif ext in (".tif", ".tiff"):
+        values, tiff_extent = _read_geotiff(path)
+        lat, lon, density = _raster_samples(values, extent or tiff_extent)
+
+    else:
+        raise ValueError(f"Formato de raster não suportado: '{ext}'")
+
+    density = np.nan_to_num(np.asarray(density, dtype=float), nan=0.0)
+    density = np.clip(density, 0.0, None)
+
+    return np.asarray(lat, dtype=float), np.asarray(lon, dtype=float), density
+
+
+def _raster_samples(values, extent=None):
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 2:
+        raise ValueError("Raster de densidade deve ser 2D")
+
+    lon_min, lon_max, lat_min, lat_max = extent or GLOBAL_EXTENT
+    n_rows, n_cols = values.shape
+
+    # Centros dos pixels (linha 0 = norte)
+    lat = lat_max - (np.arange(n_rows) + 0.5) * (lat_max - lat_min) / n_rows
+    lon = lon_min + (np.arange(n_cols) + 0.5) * (lon_max - lon_min) / n_cols
+
+    lat_2d, lon_2d = np.meshgrid(lat, lon, indexing="ij")
+
+    return lat_2d.ravel(), lon_2d.ravel(), values.ravel()
+
+
+def _read_geotiff(path):
+    from PIL import Image
+
+    with Image.open(path) as img:
+        values = np.asarray(img, dtype=float)
+        scale = img.tag_v2.get(33550)      # ModelPixelScaleTag
+        tiepoint = img.tag_v2.get(33922)   # ModelTiepointTag
+
+    if scale is None or tiepoint is None:
+        return values, None
+
+    sx, sy = scale[0], scale[1]
+    i, j, x, y = tiepoint[0], tiepoint[1], tiepoint[3], tiepoint[4]
+
+    lon_min = x - i * sx
+    lat_max = y + j * sy
+    n_rows, n_cols = values.shape[:2]
+
+    extent = (lon_min, lon_min + n_cols * sx, lat_max - n_rows * sy, lat_max)
+
+    return values, extent
+
+
+# -------------------------------------------------
+# Regrid para o grid de cobertura (com cache)
+# -------------------------------------------------
+def regrid_density(lat, lon, density, lat_grid_deg, lon_grid_deg):
+    """
+    Soma as amostras de densidade na célula mais próxima do grid.
+
+    A soma conserva o total (ex.: número de navios). Retorna
+    array [n_lat, n_lon].
+    """
+    lat_grid = np.asarray(lat_grid_deg, dtype=float)
+    lon_grid = np.asarray(lon_grid_deg, dtype=float)
+
+    i = np.searchsorted(0.5 * (lat_grid[1:] + lat_grid[:-1]), lat)
+    j = np.searchsorted(0.5 * (lon_grid[1:] + lon_grid[:-1]), lon)
+
+    weights = np.zeros((len(lat_grid), len(lon_grid)))
+    np.add.at(weights, (i, j), density)
+
+    return weights
+
+
+def density_weights(
+    path,
+    lat_grid_deg,
+    lon_grid_deg,
+    extent=None,
+    cache_dir=None
+):
+    """
+    Pesos de tráfego [n_lat, n_lon] para o grid de cobertura.
+
+    O raster é lido e reamostrado uma única vez por (arquivo, grid); o
+    resultado fica em cache em disco (default_cache_dir()) e em memória.
+    O array retornado é somente leitura.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    stat = os.stat(path)
+
+    return _cached_density_weights(
+        os.path.abspath(path),
+        stat.st_size,
+        stat.st_mtime_ns,
+        tuple(np.asarray(lat_grid_deg, dtype=float)),
+        tuple(np.asarray(lon_grid_deg, dtype=float)),
+        None if extent is None else tuple(extent),
+        cache_dir
+    )
+
+
+@lru_cache(maxsize=16)
+def _cached_density_weights(
+    path,
+    size,
+    mtime_ns,
+    lat_key,
+    lon_key,
+    extent,
+    cache_dir
+):
+    h = hashlib.sha1()
+    h.update(repr((path, size, mtime_ns, extent)).encode())
+    h.update(np.asarray(lat_key).tobytes())
+    h.update(np.asarray(lon_key).tobytes())
+
+    cache_path = os.path.join(cache_dir, f"traffic_{h.hexdigest()[:16]}.npy")
+
+    if os.path.exists(cache_path):
+        weights = np.load(cache_path)
+    else:
+        lat, lon, density = load_density_samples(path, extent)
+        weights = regrid_density(lat, lon, density, lat_key, lon_key)
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        np.save(cache_path, weights)
+
+    weights.setflags(write=False)
+
+    return weights
+
+
+# -------------------------------------------------
+# Métricas ponderadas por tráfego
+# -------------------------------------------------
+def compute_grid_traffic_metrics(
+    *,
+    constellation,
+    timeline,
+    propagate_fn,
+    min_elevation_rad,
+    lat_grid_deg,
+    lon_grid_deg,
+    weights,
+    cell_mask=None,
+    n_workers=None
+):
+    """
+    Cobertura ponderada pela densidade de tráfego, em uma única passada
+    (compute_grid_gap_statistics com weights).
+
+    Apenas células com peso > 0 (e dentro de cell_mask, se houver) são
+    avaliadas. Retorna dicionário:
+        weighted_availability     fração do tráfego-tempo servido [0,1]
+        traffic_cells_worst_gap_s maior gap entre células com tráfego
+                                  (máximo simples, sem ponderação)
+        weighted_mean_max_gap_s   média dos gaps máximos, ponderada
+        served_fraction           [n_steps] fração do tráfego em visada
+        ships_in_view             [n_steps, n_sats] tráfego visto por satélite
+        coverage_fraction         [n_lat, n_lon]
+        max_gap_s                 [n_lat, n_lon]
+    """
+    weights = np.asarray(weights, dtype=float)
+
+    active = weights > 0
+    if cell_mask is not None:
+        active = active & np.asarray(cell_mask, dtype=bool)
+
+    stats = compute_grid_gap_statistics(
+        constellation=constellation,
+        timeline=timeline,
+        propagate_fn=propagate_fn,
+        min_elevation_rad=min_elevation_rad,
+        lat_grid_deg=lat_grid_deg,
+        lon_grid_deg=lon_grid_deg,
+        cell_mask=active,
+        n_workers=n_workers,
+        gap_bins_s=False,
+        pass_bins_s=False,
+        revisit_bins_s=False,
+        weights=weights
+    )
+
+    return {
+        "weighted_availability": stats["weighted_availability"],
+        "traffic_cells_worst_gap_s": stats["weighted_cells_worst_gap_s"],
+        "weighted_mean_max_gap_s": stats["weighted_mean_max_gap_s"],
+        "served_fraction": stats["served_fraction"],
+        "ships_in_view": stats["weight_in_view"],
+        "coverage_fraction": stats["coverage_fraction"],
+        "max_gap_s": stats["max_gap_s"],
+    }
@@ -31,3 +31,29 @@ def ecef_to_latlon(r_ecef: np.ndarray):
     lon = np.arctan2(y, x)
 
     return lat * RAD2DEG, lon * RAD2DEG
+
+
+def eci_to_ecef_batch(r_eci: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """
+    Versão vetorizada de eci_to_ecef.
+
+    r_eci tem shape (n_steps, ..., 3) e times shape (n_steps,).
+    Retorna array de mesmo shape em ECEF.
+    """
+    r_eci = np.asarray(r_eci, dtype=float)
+    theta = OMEGA_EARTH * np.asarray(times, dtype=float)
+
+    # Broadcast do ângulo sobre os eixos intermediários
+    shape = (len(theta),) + (1,) * (r_eci.ndim - 2)
+    c = np.cos(theta).reshape(shape)
+    s = np.sin(theta).reshape(shape)
+
+    x = r_eci[..., 0]
+    y = r_eci[..., 1]
+
+    r_ecef = np.empty_like(r_eci)
+    r_ecef[..., 0] = c * x + s * y
+    r_ecef[..., 1] = -s * x + c * y
+    r_ecef[..., 2] = r_eci[..., 2]
+
+    return r_ecef
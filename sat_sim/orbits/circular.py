@@ -1,5 +1,5 @@
 import numpy as np
-from sat_sim.constants import MU_EARTH
+from sat_sim.constants import MU_EARTH, R_EARTH, J2
 
 def mean_motion(a: float) -> float:
     """
@@ -8,6 +8,13 @@ def mean_motion(a: float) -> float:
     return np.sqrt(MU_EARTH / a**3)
 
 
+def j2_raan_rate(a: float, inclination: float) -> float:
+    """
+    Taxa secular de RAAN por J2 (rad/s) para órbita circular.
+    """
+    return -1.5 * mean_motion(a) * J2 * (R_EARTH / a) ** 2 * np.cos(inclination)
+
+
 def propagate_circular_orbit(
     a: float,
     inclination: float,
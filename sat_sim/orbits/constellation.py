@@ -1,22 +1,47 @@
+from dataclasses import dataclass
+
 import numpy as np
 from sat_sim.orbits.elements import ClassicalOrbitalElements
 
 
+# Abertura total de RAAN: delta espalha os planos em 2pi, star em pi
+WALKER_PATTERNS = {
+    "delta": 2 * np.pi,
+    "star": np.pi,
+}
+
+
 def generate_constellation(
     altitude: float,
     inclination: float,
     n_planes: int,
     sats_per_plane: int,
-    raan0: float = 0.0
+    raan0: float = 0.0,
+    phasing: int = 0,
+    pattern: str = "delta"
 ):
     """
     Gera uma constelação tipo Walker (parametrização explícita).
 
+    pattern: "delta" (RAAN em 2pi) ou "star" (RAAN em pi).
+    phasing: fator de fase F de Walker T/P/F (0 <= F < n_planes); o
+    satélite s do plano p tem anomalia s * 2pi/S + p * F * 2pi/T.
+
     Retorna lista de ClassicalOrbitalElements.
     """
+    if pattern not in WALKER_PATTERNS:
+        raise ValueError(f"Padrão Walker inválido: '{pattern}'")
 
-    delta_raan = 2 * np.pi / n_planes
+    if not 0 <= phasing < n_planes:
+        raise ValueError(
+            f"Fator de fase inválido: {phasing} (0 <= F < {n_planes})"
+        )
+
+    total_sats = n_planes * sats_per_plane
+
+    delta_raan = WALKER_PATTERNS[pattern] / n_planes
     delta_phase = 2 * np.pi / sats_per_plane
+    plane_phase = 2 * np.pi * phasing / total_sats
 
     sats = []
 
@@ -24,7 +49,7 @@ def generate_constellation(
         raan = raan0 + p * delta_raan
 
         for s in range(sats_per_plane):
-            nu = s * delta_phase
+            nu = s * delta_phase + p * plane_phase
 
             coe = ClassicalOrbitalElements(
                 a=altitude,
@@ -38,3 +63,42 @@ def generate_constellation(
             sats.append(coe)
 
     return sats
+
+
+@dataclass(frozen=True)
+class WalkerShell:
+    """
+    Uma camada Walker: altitude [m] (semi-eixo maior), inclinação [rad],
+    planos, satélites por plano, fator de fase F e padrão delta/star.
+    """
+    altitude: float
+    inclination: float
+    n_planes: int
+    sats_per_plane: int
+    phasing: int = 0
+    pattern: str = "delta"
+    raan0: float = 0.0
+
+    @property
+    def total_sats(self):
+        return self.n_planes * self.sats_per_plane
+
+
+def generate_shells(shells):
+    """
+    Constelação multi-camada: concatena generate_constellation de cada
+    WalkerShell, na ordem dada.
+    """
+    return [
+        coe
+        for shell in shells
+        for coe in generate_constellation(
+            altitude=shell.altitude,
+            inclination=shell.inclination,
+            n_planes=shell.n_planes,
+            sats_per_plane=shell.sats_per_plane,
+            raan0=shell.raan0,
+            phasing=shell.phasing,
+            pattern=shell.pattern
+        )
+    ]
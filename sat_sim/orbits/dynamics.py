@@ -29,3 +29,23 @@ def acceleration_total(r: np.ndarray, use_j2: bool = False) -> np.ndarray:
     if use_j2:
         a += acceleration_j2(r)
     return a
+
+
+def acceleration_total_batch(r: np.ndarray, use_j2: bool = False) -> np.ndarray:
+    """
+    Versão vetorizada de acceleration_total para r com shape (..., 3).
+    """
+    r_norm = np.linalg.norm(r, axis=-1, keepdims=True)
+
+    a = -MU_EARTH * r / r_norm**3
+
+    if use_j2:
+        factor = (3.0 / 2.0) * J2 * MU_EARTH * R_EARTH**2 / r_norm**5
+        zx2 = 5.0 * r[..., 2:3]**2 / r_norm**2
+
+        a = a + factor * r * np.concatenate(
+            (zx2 - 1.0, zx2 - 1.0, zx2 - 3.0),
+            axis=-1
+        )
+
+    return a
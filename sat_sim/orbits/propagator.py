@@ -1,5 +1,8 @@
 import numpy as np
-from sat_sim.orbits.dynamics import acceleration_total
+from sat_sim.orbits.dynamics import (
+    acceleration_total,
+    acceleration_total_batch,
+)
 
 def rk4_step(r, v, dt, use_j2=False):
 
@@ -32,3 +35,39 @@ def propagate_orbit(r0, v0, timeline, use_j2=False):
         r, v = rk4_step(r, v, timeline.dt, use_j2=use_j2)
 
     return np.array(rs), np.array(vs)
+
+
+def propagate_orbits_batch(r0, v0, timeline, use_j2=False):
+    """
+    RK4 vetorizado: propaga n órbitas ao mesmo tempo.
+
+    r0, v0: [n, 3]. Retorna (rs, vs) com shape [n_steps, n, 3], mesma
+    convenção de propagate_orbit (o primeiro instante é o estado
+    inicial). O custo por passo independe de n (até o limite de memória),
+    então lotes grandes (ex.: amostras de Monte Carlo) saem pelo custo de
+    uma única propagação.
+    """
+    r = np.array(r0, dtype=float)
+    v = np.array(v0, dtype=float)
+    dt = timeline.dt
+
+    n_steps = len(timeline.times)
+    rs = np.empty((n_steps,) + r.shape)
+    vs = np.empty((n_steps,) + v.shape)
+
+    def accel(x):
+        return acceleration_total_batch(x, use_j2=use_j2)
+
+    for k in range(n_steps):
+        rs[k] = r
+        vs[k] = v
+
+        k1r, k1v = v, accel(r)
+        k2r, k2v = v + 0.5 * dt * k1v, accel(r + 0.5 * dt * k1r)
+        k3r, k3v = v + 0.5 * dt * k2v, accel(r + 0.5 * dt * k2r)
+        k4r, k4v = v + dt * k3v, accel(r + dt * k3r)
+
+        r = r + (dt / 6.0) * (k1r + 2 * k2r + 2 * k3r + k4r)
+        v = v + (dt / 6.0) * (k1v + 2 * k2v + 2 * k3v + k4v)
+
+    return rs, vs
@@ -1,11 +1,190 @@
 # sat_sim/rf/vdes/antenna.py
 
-def satellite_rx_gain(off_boresight_rad: float) -> float:
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from sat_sim.constants import DEG2RAD
+
+
+def satellite_rx_gain(off_boresight_rad, phi_rad=0.0, pattern=None):
     """
     Ganho RX do satélite para VDES-SAT uplink.
 
-    Modelo atual:
+    Modelo default (pattern=None):
     - Wide-beam / quasi-omnidirecional
     - Não penaliza off-boresight
+
+    Com pattern (AntennaPattern), o ganho é interpolado na tabela
+    theta/phi; aceita arrays de qualquer shape (broadcast).
+    """
+    if pattern is None:
+        return 0.0  # dBi
+
+    return pattern.gain(off_boresight_rad, phi_rad)
+
+
+def satellite_tx_gain(off_boresight_rad, phi_rad=0.0, pattern=None):
+    """
+    Ganho TX do satélite para VDE-SAT downlink (mesmo modelo do RX:
+    0 dBi sem pattern).
+    """
+    return satellite_rx_gain(off_boresight_rad, phi_rad, pattern)
+
+
+@dataclass(frozen=True, eq=False)
+class AntennaPattern:
     """
-    return 0.0  # dBi
+    Diagrama de ganho tabelado [dBi] em theta (off-boresight) x phi
+    (azimute em torno do boresight, a partir do eixo X do corpo).
+
+    theta_rad: (n_theta,) crescente; fora da faixa usa o valor da borda
+    phi_rad:   (n_phi,) crescente em [phi_0, phi_0 + 2pi), periódico;
+               um único valor = diagrama axissimétrico
+    gain_dbi:  (n_theta, n_phi)
+    """
+    theta_rad: np.ndarray
+    phi_rad: np.ndarray
+    gain_dbi: np.ndarray
+    name: str = ""
+
+    def __post_init__(self):
+        theta = np.asarray(self.theta_rad, dtype=float)
+        phi = np.atleast_1d(np.asarray(self.phi_rad, dtype=float))
+        gain = np.asarray(self.gain_dbi, dtype=float).reshape(
+            len(theta), len(phi)
+        )
+
+        if len(theta) < 2 or np.any(np.diff(theta) <= 0):
+            raise ValueError("theta deve ser crescente com >= 2 pontos")
+        if np.any(np.diff(phi) <= 0) or phi[-1] - phi[0] >= 2 * np.pi:
+            raise ValueError("phi deve ser crescente dentro de 2pi")
+
+        # Grade de phi estendida com a primeira coluna em phi_0 + 2pi
+        phi_ext = np.append(phi, phi[0] + 2 * np.pi)
+        gain_ext = np.hstack((gain, gain[:, :1]))
+
+        for value in (theta, phi, gain, phi_ext, gain_ext):
+            value.setflags(write=False)
+
+        object.__setattr__(self, "theta_rad", theta)
+        object.__setattr__(self, "phi_rad", phi)
+        object.__setattr__(self, "gain_dbi", gain)
+        object.__setattr__(self, "_phi_ext", phi_ext)
+        object.__setattr__(self, "_gain_ext", gain_ext)
+
+    @property
+    def axisymmetric(self):
+        return len(self.phi_rad) == 1
+
+    def gain(self, theta_rad, phi_rad=0.0):
+        """
+        Interpolação bilinear vetorizada (theta limitado à tabela,
+        phi periódico). Retorna array com o shape do broadcast.
+        """
+        theta_grid = self.theta_rad
+        theta = np.clip(
+            np.asarray(theta_rad, dtype=float),
+            theta_grid[0],
+            theta_grid[-1]
+        )
+
+        i = np.clip(
+            np.searchsorted(theta_grid, theta, side="right") - 1,
+            0,
+            len(theta_grid) - 2
+        )
+        wt = (theta - theta_grid[i]) / (theta_grid[i + 1] - theta_grid[i])
+
+        if self.axisymmetric:
+            g = self.gain_dbi[:, 0]
+            return (1.0 - wt) * g[i] + wt * g[i + 1]
+
+        phi_grid = self._phi_ext
+        phi = np.mod(
+            np.asarray(phi_rad, dtype=float) - phi_grid[0],
+            2 * np.pi
+        ) + phi_grid[0]
+
+        j = np.clip(
+            np.searchsorted(phi_grid, phi, side="right") - 1,
+            0,
+            len(phi_grid) - 2
+        )
+        wp = (phi - phi_grid[j]) / (phi_grid[j + 1] - phi_grid[j])
+
+        g = self._gain_ext
+
+        return (
+            (1.0 - wt) * (1.0 - wp) * g[i, j]
+            + wt * (1.0 - wp) * g[i + 1, j]
+            + (1.0 - wt) * wp * g[i, j + 1]
+            + wt * wp * g[i + 1, j + 1]
+        )
+
+    def min_gain_over_phi(self, theta_rad):
+        """
+        Pior ganho em azimute para cada theta (envoltória conservadora).
+        """
+        theta = np.asarray(theta_rad, dtype=float)
+
+        return np.min(
+            self.gain(theta[..., None], self.phi_rad),
+            axis=-1
+        )
+
+
+def load_antenna_pattern(path):
+    """
+    Lê um diagrama de ganho tabelado (ângulos em graus).
+
+    Formatos:
+    - .npz: arrays theta_deg, gain_dbi [n_theta] ou [n_theta, n_phi]
+      e phi_deg opcional
+    - .csv: linhas theta_deg,gain_dbi (axissimétrico) ou
+      theta_deg,phi_deg,gain_dbi em grade completa (cabeçalho opcional)
+
+    O resultado é mantido em cache por (arquivo, mtime).
+    """
+    path = os.path.abspath(path)
+
+    return _cached_antenna_pattern(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _cached_antenna_pattern(path, mtime_ns):
+    ext = os.path.splitext(path)[1].lower()
+    name = os.path.splitext(os.path.basename(path))[0]
+
+    if ext == ".npz":
+        with np.load(path) as data:
+            theta_deg = data["theta_deg"]
+            gain = data["gain_dbi"]
+            phi_deg = data["phi_deg"] if "phi_deg" in data else [0.0]
+
+    elif ext == ".csv":
+        data = np.atleast_2d(np.genfromtxt(path, delimiter=",", dtype=float))
+        data = data[~np.isnan(data).any(axis=1)]
+
+        if data.shape[1] == 2:
+            theta_deg, phi_deg, gain = data[:, 0], [0.0], data[:, 1]
+        else:
+            theta_deg, i = np.unique(data[:, 0], return_inverse=True)
+            phi_deg, j = np.unique(data[:, 1], return_inverse=True)
+
+            gain = np.full((len(theta_deg), len(phi_deg)), np.nan)
+            gain[i, j] = data[:, 2]
+
+            if np.isnan(gain).any():
+                raise ValueError(f"Grade theta/phi incompleta em '{path}'")
+
+    else:
+        raise ValueError(f"Formato de diagrama não suportado: '{ext}'")
+
+    return AntennaPattern(
+        theta_rad=np.asarray(theta_deg, dtype=float) * DEG2RAD,
+        phi_rad=np.asarray(phi_deg, dtype=float) * DEG2RAD,
+        gain_dbi=gain,
+        name=name
+    )
@@ -0,0 +1,165 @@
+# sat_sim/rf/vdes/closure.py
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from sat_sim.constants import R_EARTH
+from sat_sim.rf.vdes.link_budget import (
+    DEFAULT_SAT_UPLINK_PARAMS,
+    compute_vdes_sat_uplink_array
+)
+
+
+@dataclass(frozen=True, eq=False)
+class ClosureTable:
+    """
+    Alcance máximo de fechamento do uplink em função da elevação.
+
+    Com VDESLinkParams e diagrama de antena fixos, o link fecha sempre que
+    a distância é menor que max_range_m(elevação): a disponibilidade RF
+    vira um teste geométrico.
+
+    Diagramas não axissimétricos: phi_rad é a grade de azimute do
+    diagrama e max_range_m tem uma coluna por phi [n_elevation, n_phi];
+    o alcance é interpolado em margem (dB) linearmente em phi, como o
+    ganho do diagrama, então depende do azimute real da estação.
+    """
+    altitude_m: float
+    elevation_rad: np.ndarray
+    max_range_m: np.ndarray
+    phi_rad: np.ndarray = None
+
+    def max_range(self, elevation_rad, phi_rad=0.0):
+        if self.phi_rad is None:
+            return np.interp(
+                elevation_rad,
+                self.elevation_rad,
+                self.max_range_m
+            )
+
+        # Margem a 1 m [dB] bilinear em (elevação, phi periódico)
+        elevation_grid = self.elevation_rad
+        elevation = np.clip(
+            np.asarray(elevation_rad, dtype=float),
+            elevation_grid[0],
+            elevation_grid[-1]
+        )
+
+        i = np.clip(
+            np.searchsorted(elevation_grid, elevation, side="right") - 1,
+            0,
+            len(elevation_grid) - 2
+        )
+        we = (
+            (elevation - elevation_grid[i])
+            / (elevation_grid[i + 1] - elevation_grid[i])
+        )
+
+        phi_grid = np.append(self.phi_rad, self.phi_rad[0] + 2 * np.pi)
+        phi = np.mod(
+            np.asarray(phi_rad, dtype=float) - phi_grid[0],
+            2 * np.pi
+        ) + phi_grid[0]
+
+        j = np.clip(
+            np.searchsorted(phi_grid, phi, side="right") - 1,
+            0,
+            len(phi_grid) - 2
+        )
+        wp = (phi - phi_grid[j]) / (phi_grid[j + 1] - phi_grid[j])
+
+        m = 20.0 * np.log10(np.hstack((
+            self.max_range_m,
+            self.max_range_m[:, :1]
+        )))
+
+        margin = (
+            (1.0 - we) * (1.0 - wp) * m[i, j]
+            + we * (1.0 - wp) * m[i + 1, j]
+            + (1.0 - we) * wp * m[i, j + 1]
+            + we * wp * m[i + 1, j + 1]
+        )
+
+        return 10.0 ** (margin / 20.0)
+
+    def is_closed(self, distance_m, elevation_rad, phi_rad=0.0):
+        """
+        Teste vetorizado: elevação > 0 e distância <= alcance máximo.
+        phi_rad (azimute da estação no corpo) só é usado com tabela por
+        azimute.
+        """
+        elevation_rad = np.asarray(elevation_rad)
+
+        return (
+            (elevation_rad > 0.0)
+            & (
+                np.asarray(distance_m)
+                <= self.max_range(elevation_rad, phi_rad)
+            )
+        )
+
+
+def nadir_off_boresight(elevation_rad, altitude_m):
+    """
+    Ângulo off-boresight [rad] de um satélite apontado para o nadir
+    (órbita circular), visto de uma estação com a elevação dada.
+    """
+    ratio = R_EARTH / (R_EARTH + altitude_m)
+    return np.arcsin(ratio * np.cos(elevation_rad))
+
+
+def build_uplink_closure_table(
+    params=DEFAULT_SAT_UPLINK_PARAMS,
+    altitude_m=550e3,
+    n_points=181,
+    pattern=None
+):
+    """
+    Inverte compute_vdes_sat_uplink_array em uma tabela alcance x elevação.
+
+    Como a margem cai exatamente 20 dB por década de distância, a margem
+    avaliada a 1 m fornece o alcance máximo: 10**(margem_1m / 20).
+    Com pattern, o ganho usado é o off-boresight de apontamento nadir;
+    diagramas não axissimétricos geram uma coluna por azimute da grade do
+    diagrama (consultada com o phi real, ver ClosureTable).
+    O resultado é mantido em cache por (params, altitude, n_points, pattern).
+    """
+    return _cached_closure_table(
+        params,
+        float(altitude_m),
+        int(n_points),
+        pattern
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_closure_table(params, altitude_m, n_points, pattern):
+    elevation = np.linspace(0.0, np.pi / 2, n_points)
+    phi = np.zeros(1) if pattern is None else pattern.phi_rad
+
+    margin_1m = compute_vdes_sat_uplink_array(
+        distance_m=1.0,
+        off_boresight_rad=nadir_off_boresight(elevation, altitude_m)[:, None],
+        params=params,
+        phi_rad=phi[None, :],
+        pattern=pattern
+    )["margin_db"]
+
+    max_range = 10.0 ** (margin_1m / 20.0)
+
+    if len(phi) == 1:
+        max_range = max_range[:, 0]
+        phi = None
+    else:
+        phi.setflags(write=False)
+
+    elevation.setflags(write=False)
+    max_range.setflags(write=False)
+
+    return ClosureTable(
+        altitude_m=altitude_m,
+        elevation_rad=elevation,
+        max_range_m=max_range,
+        phi_rad=phi
+    )
@@ -1,8 +1,168 @@
 # sat_sim/rf/vdes/link_budget.py
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
 from sat_sim.constants import C_LIGHT, K_BOLTZMANN
-from sat_sim.rf.vdes.antenna import satellite_rx_gain
+from sat_sim.rf.vdes.antenna import satellite_rx_gain, satellite_tx_gain
+from sat_sim.rf.vdes.params import VDESLinkParams, VDES_SAT_DL
+
+
+# Defaults historicamente fixos em compute_vdes_sat_uplink
+DEFAULT_SAT_UPLINK_PARAMS = VDESLinkParams(
+    frequency_hz=162e6,
+    bandwidth_hz=25e3,
+    eirp_dbw=14.0,
+    gt_rx_db_per_k=-5.0,
+    snr_min_db=6.0,
+    system_losses_db=0.0
+)
+
+DEFAULT_SAT_DOWNLINK_PARAMS = VDES_SAT_DL
+
+LINK_RESULT_DTYPE = np.dtype([
+    ("cn_db", float),
+    ("margin_db", float),
+    ("is_closed", bool),
+])
+
+
+@dataclass(frozen=True)
+class LinkConstants:
+    """
+    Termos do link budget que dependem apenas de VDESLinkParams.
+    """
+    wavelength_m: float
+    noise_db: float          # 10 log10(k B)
+    fspl_offset_db: float    # 20 log10(4 pi / lambda)
+    cn_offset_db: float      # EIRP + G/T - perdas - kB - fspl_offset
+
+
+@lru_cache(maxsize=128)
+def link_constants(params: VDESLinkParams) -> LinkConstants:
+    """
+    Pré-calcula (uma vez por VDESLinkParams) os termos constantes.
+    """
+    wavelength = C_LIGHT / params.frequency_hz
+    noise_db = 10 * np.log10(K_BOLTZMANN * params.bandwidth_hz)
+    fspl_offset_db = 20 * np.log10(4 * np.pi / wavelength)
+
+    cn_offset_db = (
+        params.eirp_dbw
+        + params.gt_rx_db_per_k
+        - params.system_losses_db
+        - noise_db
+        - fspl_offset_db
+    )
+
+    return LinkConstants(
+        wavelength_m=wavelength,
+        noise_db=noise_db,
+        fspl_offset_db=fspl_offset_db,
+        cn_offset_db=cn_offset_db
+    )
+
+
+def _link_budget_array(
+    distance_m,
+    gain_db,
+    elevation_rad,
+    params,
+    losses_db,
+    shapes
+):
+    const = link_constants(params)
+
+    cn_db = (
+        const.cn_offset_db
+        + gain_db
+        - losses_db
+        - 20 * np.log10(distance_m)
+    )
+    margin_db = cn_db - params.snr_min_db
+    is_closed = margin_db >= 0.0
+
+    if elevation_rad is not None:
+        is_closed = is_closed & (np.asarray(elevation_rad) > 0.0)
+
+    shape = np.broadcast_shapes(
+        np.shape(distance_m),
+        np.shape(elevation_rad),
+        np.shape(gain_db),
+        np.shape(losses_db),
+        *shapes
+    )
+
+    result = np.empty(shape, dtype=LINK_RESULT_DTYPE)
+    result["cn_db"] = cn_db
+    result["margin_db"] = margin_db
+    result["is_closed"] = is_closed
+
+    return result
+
+
+def compute_vdes_sat_uplink_array(
+    distance_m,
+    off_boresight_rad=0.0,
+    elevation_rad=None,
+    params: VDESLinkParams = DEFAULT_SAT_UPLINK_PARAMS,
+    phi_rad=0.0,
+    pattern=None,
+    propagation_losses_db=0.0,
+):
+    """
+    Link budget VDE-SAT uplink vetorizado.
+
+    distance_m, off_boresight_rad, elevation_rad e phi_rad aceitam arrays
+    de qualquer shape (broadcast). Com elevation_rad, amostras com
+    elevação <= 0 nunca fecham o link. pattern (AntennaPattern) define o
+    ganho RX do satélite; sem ele, 0 dBi. propagation_losses_db (ex.:
+    LossChain) soma-se a params.system_losses_db.
+
+    Retorna structured array (LINK_RESULT_DTYPE) com campos
+    cn_db, margin_db, is_closed.
+    """
+    distance_m = np.asarray(distance_m, dtype=float)
+    off_boresight_rad = np.asarray(off_boresight_rad, dtype=float)
+
+    return _link_budget_array(
+        distance_m,
+        satellite_rx_gain(off_boresight_rad, phi_rad, pattern),
+        elevation_rad,
+        params,
+        propagation_losses_db,
+        (off_boresight_rad.shape, np.shape(phi_rad))
+    )
+
+
+def compute_vdes_sat_downlink_array(
+    distance_m,
+    off_boresight_rad=0.0,
+    elevation_rad=None,
+    params: VDESLinkParams = DEFAULT_SAT_DOWNLINK_PARAMS,
+    phi_rad=0.0,
+    pattern=None,
+    propagation_losses_db=0.0,
+):
+    """
+    Link budget VDE-SAT downlink vetorizado (satélite -> navio).
+
+    Mesmas convenções de compute_vdes_sat_uplink_array; aqui
+    params.eirp_dbw é o EIRP do satélite na referência de 0 dBi e
+    pattern é o diagrama TX do satélite.
+    """
+    distance_m = np.asarray(distance_m, dtype=float)
+    off_boresight_rad = np.asarray(off_boresight_rad, dtype=float)
+
+    return _link_budget_array(
+        distance_m,
+        satellite_tx_gain(off_boresight_rad, phi_rad, pattern),
+        elevation_rad,
+        params,
+        propagation_losses_db,
+        (off_boresight_rad.shape, np.shape(phi_rad))
+    )
 
 
 def compute_vdes_sat_uplink(
@@ -14,26 +174,23 @@ def compute_vdes_sat_uplink(
     gt_sat_db: float = -5.0,
     cn_required_db: float = 6.0,
 ):
-    wavelength = C_LIGHT / frequency_hz
-
-    fspl_db = (
-        20 * np.log10(4 * np.pi * distance_m / wavelength)
+    params = VDESLinkParams(
+        frequency_hz=frequency_hz,
+        bandwidth_hz=bandwidth_hz,
+        eirp_dbw=tx_eirp_dbw,
+        gt_rx_db_per_k=gt_sat_db,
+        snr_min_db=cn_required_db,
+        system_losses_db=0.0
     )
 
-    rx_gain_db = satellite_rx_gain(off_boresight_rad)
-
-    cn_db = (
-        tx_eirp_dbw
-        + rx_gain_db
-        + gt_sat_db
-        - fspl_db
-        - 10 * np.log10(K_BOLTZMANN * bandwidth_hz)
+    result = compute_vdes_sat_uplink_array(
+        distance_m,
+        off_boresight_rad,
+        params=params
     )
 
-    margin_db = cn_db - cn_required_db
-
     return {
-        "cn_db": cn_db,
-        "margin_db": margin_db,
-        "is_closed": margin_db >= 0.0
+        "cn_db": result["cn_db"][()],
+        "margin_db": result["margin_db"][()],
+        "is_closed": result["is_closed"][()]
     }
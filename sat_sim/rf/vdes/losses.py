@@ -0,0 +1,278 @@
+# sat_sim/rf/vdes/losses.py
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from sat_sim.constants import R_EARTH
+
+
+REFERENCE_FREQUENCY_HZ = 162e6
+
+# Grade das tabelas: elevação [deg], latitude [deg], hora local [h]
+TABLE_ELEVATION_DEG = np.linspace(0.0, 90.0, 91)
+TABLE_LATITUDE_DEG = np.linspace(-90.0, 90.0, 91)
+TABLE_LOCAL_TIME_H = np.linspace(0.0, 24.0, 97)
+
+
+def _vertical_tec_tecu(lat_rad, local_time_h, day_tecu, night_tecu):
+    """
+    Modelo simples de TEC vertical [TECU]: pico diurno às 14 h local,
+    decaindo com a latitude.
+    """
+    diurnal = np.maximum(np.cos(2 * np.pi * (local_time_h - 14.0) / 24.0), 0.0)
+    latitude = np.cos(lat_rad) ** 2
+
+    return night_tecu + (day_tecu - night_tecu) * diurnal * latitude
+
+
+def _ionospheric_obliquity(elevation_rad, shell_height_m=350e3):
+    """
+    Fator de obliquidade (slant / vertical) para a camada ionosférica fina.
+    """
+    r_ratio = R_EARTH / (R_EARTH + shell_height_m)
+    cos_zp = np.sqrt(1.0 - (r_ratio * np.cos(elevation_rad)) ** 2)
+
+    return 1.0 / cos_zp
+
+
+@dataclass(frozen=True)
+class ScintillationLoss:
+    """
+    Margem de cintilação ionosférica [dB] a partir de um índice S4
+    (modelo no espírito da ITU-R P.531):
+    - faixa equatorial (|lat| < ~20 deg) após o pôr do sol (20 h - 02 h)
+    - altas latitudes (|lat| > ~60 deg)
+    S4 escala com f^-1.5 e com a raiz da obliquidade; a perda é metade da
+    flutuação pico a pico 27.5 S4^1.26.
+    """
+    s4_equatorial: float = 0.5
+    s4_high_latitude: float = 0.2
+    s4_background: float = 0.05
+    name: str = "scintillation"
+
+    def __call__(self, elevation_rad, lat_rad, local_time_h, frequency_hz):
+        lat_deg = np.degrees(lat_rad)
+
+        night = np.cos(2 * np.pi * (local_time_h - 23.0) / 24.0)
+        night = np.clip((night - 0.5) / 0.5, 0.0, 1.0)
+
+        equatorial = np.exp(-(lat_deg / 15.0) ** 2) * night
+        high_lat = 1.0 / (1.0 + np.exp(-(np.abs(lat_deg) - 60.0) / 3.0))
+
+        s4 = (
+            self.s4_background
+            + self.s4_equatorial * equatorial
+            + self.s4_high_latitude * high_lat
+        )
+        s4 = s4 * (frequency_hz / REFERENCE_FREQUENCY_HZ) ** -1.5
+        s4 = s4 * np.sqrt(_ionospheric_obliquity(elevation_rad))
+        s4 = np.minimum(s4, 1.0)
+
+        return 0.5 * 27.5 * s4 ** 1.26
+
+
+@dataclass(frozen=True)
+class FaradayPolarizationLoss:
+    """
+    Perda média de polarização [dB] por rotação de Faraday em um link
+    linear-linear.
+
+    Rotação: Omega = 2.36e4 B TEC_slant / f^2 [rad]. Com incerteza
+    relativa do TEC tec_uncertainty (gaussiana), a eficiência média é
+    0.5 (1 + cos(2 Omega) exp(-2 sigma^2)); rotações grandes e incertas
+    tendem a 3 dB. Limitada a max_loss_db.
+    """
+    day_tecu: float = 30.0
+    night_tecu: float = 5.0
+    b_parallel_t: float = 4e-5
+    tec_uncertainty: float = 0.25
+    max_loss_db: float = 10.0
+    name: str = "faraday"
+
+    def __call__(self, elevation_rad, lat_rad, local_time_h, frequency_hz):
+        tec = _vertical_tec_tecu(
+            lat_rad,
+            local_time_h,
+            self.day_tecu,
+            self.night_tecu
+        ) * 1e16 * _ionospheric_obliquity(elevation_rad)
+
+        omega = 2.36e4 * self.b_parallel_t * tec / frequency_hz ** 2
+        sigma = self.tec_uncertainty * omega
+
+        efficiency = 0.5 * (1.0 + np.cos(2 * omega) * np.exp(-2 * sigma ** 2))
+        loss = -10 * np.log10(np.maximum(efficiency, 1e-12))
+
+        return np.minimum(loss, self.max_loss_db)
+
+
+@dataclass(frozen=True)
+class PolarizationMismatchLoss:
+    """
+    Descasamento fixo de polarização [dB] (ex.: circular x linear = 3 dB,
+    independente da rotação de Faraday).
+    """
+    loss_db: float = 3.0
+    name: str = "polarization"
+
+    def __call__(self, elevation_rad, lat_rad, local_time_h, frequency_hz):
+        shape = np.broadcast(elevation_rad, lat_rad, local_time_h).shape
+
+        return np.full(shape, self.loss_db)
+
+
+@dataclass(frozen=True)
+class AtmosphericLoss:
+    """
+    Absorção atmosférica [dB]: valor zenital escalado por 1/sin(el)
+    (elevação limitada a 5 deg). Pequena em VHF.
+    """
+    zenith_db: float = 0.04
+    name: str = "atmospheric"
+
+    def __call__(self, elevation_rad, lat_rad, local_time_h, frequency_hz):
+        elevation = np.maximum(elevation_rad, np.radians(5.0))
+        shape = np.broadcast(elevation_rad, lat_rad, local_time_h).shape
+
+        return np.broadcast_to(self.zenith_db / np.sin(elevation), shape)
+
+
+@dataclass(frozen=True)
+class LossChain:
+    """
+    Cadeia de perdas de propagação somadas ao link budget.
+
+    Cada termo é um callable vetorizado (elevação, latitude, hora local,
+    frequência) -> dB. Os termos são tabelados uma única vez por
+    (cadeia, frequência) em elevação x latitude x hora local; a avaliação
+    é uma interpolação trilinear. epoch_utc_h é a hora UTC de t = 0.
+    """
+    terms: tuple
+    frequency_hz: float = REFERENCE_FREQUENCY_HZ
+    epoch_utc_h: float = 0.0
+
+    def tables(self):
+        return _cached_loss_tables(self)
+
+    def breakdown(self, elevation_rad, lat_rad, local_time_h):
+        """
+        Perda [dB] de cada termo, {nome: array} com shape do broadcast.
+        """
+        tables = self.tables()
+
+        index = _table_index(elevation_rad, lat_rad, local_time_h)
+
+        return {
+            name: _interp_table(table, index)
+            for name, table in tables.items()
+        }
+
+    def __call__(self, elevation_rad, lat_rad, local_time_h):
+        """
+        Perda total [dB] (soma dos termos).
+        """
+        index = _table_index(elevation_rad, lat_rad, local_time_h)
+
+        return _interp_table(_cached_total_table(self), index)
+
+
+def default_vhf_loss_chain(
+    frequency_hz=REFERENCE_FREQUENCY_HZ,
+    epoch_utc_h=0.0
+):
+    """
+    Cadeia VHF default: cintilação, Faraday (linear-linear) e atmosfera.
+    """
+    return LossChain(
+        terms=(
+            ScintillationLoss(),
+            FaradayPolarizationLoss(),
+            AtmosphericLoss()
+        ),
+        frequency_hz=frequency_hz,
+        epoch_utc_h=epoch_utc_h
+    )
+
+
+def local_time_hours(lon_rad, times_s, epoch_utc_h=0.0):
+    """
+    Hora solar local [h] de uma longitude para os instantes dados.
+    """
+    utc_h = epoch_utc_h + np.asarray(times_s, dtype=float) / 3600.0
+
+    return np.mod(utc_h + np.degrees(lon_rad) / 15.0, 24.0)
+
+
+@lru_cache(maxsize=32)
+def _cached_loss_tables(chain):
+    el, lat, lt = np.meshgrid(
+        np.radians(TABLE_ELEVATION_DEG),
+        np.radians(TABLE_LATITUDE_DEG),
+        TABLE_LOCAL_TIME_H,
+        indexing="ij"
+    )
+
+    tables = {}
+    for term in chain.terms:
+        table = np.asarray(
+            term(el, lat, lt, chain.frequency_hz),
+            dtype=float
+        )
+        table.setflags(write=False)
+        tables[term.name] = table
+
+    return tables
+
+
+@lru_cache(maxsize=32)
+def _cached_total_table(chain):
+    shape = (
+        len(TABLE_ELEVATION_DEG),
+        len(TABLE_LATITUDE_DEG),
+        len(TABLE_LOCAL_TIME_H)
+    )
+
+    total = np.zeros(shape)
+    for table in _cached_loss_tables(chain).values():
+        total = total + table
+
+    total.setflags(write=False)
+
+    return total
+
+
+def _axis_index(values, grid):
+    values = np.clip(values, grid[0], grid[-1])
+    step = grid[1] - grid[0]
+
+    position = (values - grid[0]) / step
+    i = np.minimum(position.astype(np.int64), len(grid) - 2)
+
+    return i, position - i
+
+
+def _table_index(elevation_rad, lat_rad, local_time_h):
+    elevation_rad, lat_rad, local_time_h = np.broadcast_arrays(
+        np.asarray(elevation_rad, dtype=float),
+        np.asarray(lat_rad, dtype=float),
+        np.mod(np.asarray(local_time_h, dtype=float), 24.0)
+    )
+
+    return (
+        _axis_index(np.degrees(elevation_rad), TABLE_ELEVATION_DEG),
+        _axis_index(np.degrees(lat_rad), TABLE_LATITUDE_DEG),
+        _axis_index(local_time_h, TABLE_LOCAL_TIME_H),
+    )
+
+
+def _interp_table(table, index):
+    (i, wi), (j, wj), (k, wk) = index
+
+    value = 0.0
+    for di, fi in ((0, 1.0 - wi), (1, wi)):
+        for dj, fj in ((0, 1.0 - wj), (1, wj)):
+            for dk, fk in ((0, 1.0 - wk), (1, wk)):
+                value = value + fi * fj * fk * table[i + di, j + dj, k + dk]
+
+    return value
@@ -1,7 +1,7 @@
 # sat_sim/rf/vdes/params.py
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True)
 class VDESLinkParams:
     frequency_hz: float
     bandwidth_hz: float
@@ -20,6 +20,16 @@ VDES_SAT_UL = VDESLinkParams(
     system_losses_db=2.0      # implementation losses
 )
 
+VDES_SAT_DL = VDESLinkParams(
+    frequency_hz=161.2e6,     # VDE-SAT downlink channel
+    bandwidth_hz=50e3,        # VDE-SAT downlink channelization
+    eirp_dbw=10.0,            # placeholder (satellite TX, 0 dBi reference)
+    gt_rx_db_per_k=-25.0,     # placeholder (ship receiver)
+    snr_min_db=3.0,           # service-level requirement
+    system_losses_db=2.0      # implementation losses
+)
+
 VDES_PARAMS = {
-    "vdes_sat_uplink": VDES_SAT_UL
+    "vdes_sat_uplink": VDES_SAT_UL,
+    "vdes_sat_downlink": VDES_SAT_DL
 }
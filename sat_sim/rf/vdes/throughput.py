@@ -0,0 +1,65 @@
+# sat_sim/rf/vdes/throughput.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class ModcodTable:
+    """
+    Tabela MODCOD: C/N mínimo [dB] e eficiência espectral [bit/s/Hz]
+    de cada modo, em ordem crescente de C/N. Abaixo do primeiro limiar
+    a taxa é zero.
+    """
+    name: str
+    cn_threshold_db: tuple
+    efficiency_bps_hz: tuple
+
+    def __post_init__(self):
+        if np.any(np.diff(self.cn_threshold_db) <= 0):
+            raise ValueError("Limiares MODCOD devem ser crescentes")
+
+    def efficiency(self, cn_db):
+        """
+        Eficiência do melhor modo que fecha com cn_db (vetorizado).
+        """
+        thresholds = np.asarray(self.cn_threshold_db, dtype=float)
+        efficiency = np.append(0.0, self.efficiency_bps_hz)
+
+        idx = np.searchsorted(thresholds, np.asarray(cn_db), side="right")
+
+        return efficiency[idx]
+
+
+# Placeholder: modos VDE-SAT (pi/4-QPSK, 8PSK, 16QAM; FEC 1/2 e 3/4)
+VDES_SAT_MODCODS = ModcodTable(
+    name="vdes_sat",
+    cn_threshold_db=(3.0, 6.0, 9.5, 12.5, 15.5),
+    efficiency_bps_hz=(0.5, 0.75, 1.1, 1.5, 2.0),
+)
+
+
+def shannon_efficiency(cn_db, gap_db=0.0):
+    """
+    Limite de Shannon log2(1 + C/N) [bit/s/Hz], com gap de implementação
+    opcional [dB].
+    """
+    snr = 10.0 ** ((np.asarray(cn_db, dtype=float) - gap_db) / 10.0)
+
+    return np.log2(1.0 + snr)
+
+
+def achievable_rate_bps(cn_db, bandwidth_hz, rate_model="shannon"):
+    """
+    Taxa alcançável [bit/s] para C/N [dB] de qualquer shape.
+
+    rate_model: "shannon" ou ModcodTable.
+    """
+    if isinstance(rate_model, ModcodTable):
+        return bandwidth_hz * rate_model.efficiency(cn_db)
+
+    if rate_model == "shannon":
+        return bandwidth_hz * shannon_efficiency(cn_db)
+
+    raise ValueError(f"Modelo de taxa inválido: '{rate_model}'")
@@ -15,3 +15,16 @@ class TimeArray:
 
     def __len__(self):
         return len(self.times)
+
+    def window(self, start, stop):
+        """
+        Sub-linha do tempo com os instantes times[start:stop] (mesmo dt,
+        tempos absolutos preservados).
+        """
+        sub = TimeArray.__new__(TimeArray)
+        sub.times = self.times[start:stop]
+        sub.dt = self.dt
+        sub.t0 = float(sub.times[0])
+        sub.tf = float(sub.times[-1])
+
+        return sub
@@ -0,0 +1,160 @@
+import os
+from functools import lru_cache
+from itertools import chain
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import animation
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+
+
+EXTENT = [-180, 180, -90, 90]
+
+
+@lru_cache(maxsize=4)
+def basemap_rgba(width_px, height_px):
+    """
+    Rasteriza uma única vez o mapa base Cartopy (terra, oceano, costa)
+    em PlateCarree e retorna a imagem RGBA [height, width, 4].
+
+    A rasterização é mantida em cache: os quadros da animação apenas
+    sobrepõem a cobertura a essa imagem, sem redesenhar as feições.
+    """
+    fig = plt.figure(figsize=(width_px / 100.0, height_px / 100.0), dpi=100)
+    ax = fig.add_axes([0, 0, 1, 1], projection=ccrs.PlateCarree())
+    ax.set_global()
+    ax.set_axis_off()
+
+    ax.add_feature(cfeature.LAND, facecolor="lightgray")
+    ax.add_feature(cfeature.OCEAN, facecolor="white")
+    ax.add_feature(cfeature.COASTLINE, linewidth=0.6)
+
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+
+    rgba.setflags(write=False)
+
+    return rgba
+
+
+def _frame_writer(filename, fps):
+    """
+    Escolhe o writer pelo destino:
+    - .mp4 / .gif -> ffmpeg (streaming, memória constante)
+    - .gif sem ffmpeg -> Pillow (mantém os quadros em memória)
+    - diretório ou padrão com '{' -> sequência de PNG
+    """
+    ext = os.path.splitext(filename)[1].lower()
+
+    if ext in (".mp4", ".gif"):
+        if animation.writers.is_available("ffmpeg"):
+            return animation.FFMpegWriter(fps=fps)
+        if ext == ".gif":
+            return animation.PillowWriter(fps=fps)
+        raise RuntimeError("Exportar MP4 requer ffmpeg instalado")
+
+    return None
+
+
+def write_coverage_animation(
+    frames,
+    filename,
+    *,
+    fps=10,
+    width_px=1200,
+    height_px=600,
+    title="Cobertura instantânea",
+    cmap="RdYlGn",
+    vmin=0.0,
+    vmax=1.0,
+    label="Cobertura",
+    markers=None
+):
+    """
+    Escreve uma animação a partir de quadros (t_s, frame [n_lat, n_lon]),
+    como os gerados por iter_grid_coverage_frames.
+
+    filename:
+        .mp4 / .gif            -> vídeo
+        diretório ou 'x_{:05d}.png' -> sequência de PNG
+
+    Os quadros são consumidos um a um; só o quadro corrente fica em
+    memória (exceto GIF sem ffmpeg). markers: lista opcional de (lat, lon).
+
+    Retorna o número de quadros escritos.
+    """
+    frames = iter(frames)
+
+    try:
+        t_first, first = next(frames)
+    except StopIteration:
+        return 0
+
+    fig = plt.figure(figsize=(width_px / 100.0, height_px / 100.0), dpi=100)
+    ax = fig.add_axes([0.07, 0.08, 0.8, 0.84])
+
+    ax.imshow(
+        basemap_rgba(width_px, height_px),
+        extent=EXTENT,
+        origin="upper",
+        interpolation="bilinear"
+    )
+
+    im = ax.imshow(
+        first,
+        extent=EXTENT,
+        origin="lower",
+        cmap=cmap,
+        vmin=vmin,
+        vmax=vmax,
+        alpha=0.75,
+        interpolation="nearest"
+    )
+
+    for lat, lon in markers or []:
+        ax.scatter(lon, lat, color="blue", marker="x", s=80)
+
+    ax.set_xlim(-180, 180)
+    ax.set_ylim(-90, 90)
+    ax.set_xlabel("Longitude [deg]")
+    ax.set_ylabel("Latitude [deg]")
+
+    cax = fig.add_axes([0.9, 0.08, 0.02, 0.84])
+    fig.colorbar(im, cax=cax, label=label)
+
+    header = ax.set_title("")
+
+    def render(t_s, frame):
+        im.set_data(frame)
+        header.set_text(f"{title} — t = {t_s / 3600.0:6.2f} h")
+
+    writer = _frame_writer(filename, fps)
+    frames = chain([(t_first, first)], frames)
+    n_frames = 0
+
+    try:
+        if writer is None:
+            if "{" in filename:
+                pattern = filename
+            else:
+                os.makedirs(filename, exist_ok=True)
+                pattern = os.path.join(filename, "frame_{:05d}.png")
+
+            for t_s, frame in frames:
+                render(t_s, frame)
+                fig.savefig(pattern.format(n_frames))
+                n_frames += 1
+
+        else:
+            with writer.saving(fig, filename, dpi=100):
+                for t_s, frame in frames:
+                    render(t_s, frame)
+                    writer.grab_frame()
+                    n_frames += 1
+
+    finally:
+        plt.close(fig)
+
+    return n_frames